@@ -1,15 +1,21 @@
+import functools
 import os
 import subprocess
-import sys
-
-sys.path.insert(0, os.path.abspath("../../src"))
 
 
+@functools.lru_cache(maxsize=1)
 def get_version():
+    # Skip git entirely when the version is already known (e.g., in CI)
+    version = os.environ.get("DOCS_VERSION")
+    if version:
+        return version
+
     try:
         # Get the latest git tag (--always option allows commit hash as fallback)
         tag = subprocess.check_output(
-            ["git", "describe", "--tags", "--always"], universal_newlines=True
+            ["git", "describe", "--tags", "--always"],
+            universal_newlines=True,
+            stderr=subprocess.DEVNULL,
         ).strip()
         return tag
     except subprocess.CalledProcessError:
@@ -34,9 +40,8 @@ release = get_version()
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
 extensions = [
-    "sphinx.ext.autodoc",  # For reading source code
+    "autoapi.extension",  # For reading source code (static analysis, no imports)
     "sphinx.ext.napoleon",  # For parsing docstrings
-    "sphinxcontrib.autodoc_pydantic",  # For generating Pydantic documentation
     "sphinxcontrib.mermaid",  # For embedding Mermaid diagrams
 ]
 
@@ -56,18 +61,19 @@ gettext_compact = False
 html_theme = "sphinx_rtd_theme"
 html_static_path = ["_static"]
 
-# -- Autodoc configuration ---------------------------------------------------
-# Configuration to prevent duplicate object definitions
-autodoc_default_options = {
-    'members': True,
-    'show-inheritance': True,
-    'undoc-members': True,
-}
-
-# Avoid duplicates from __init__.py imports
-autodoc_mock_imports = []
+# -- AutoAPI configuration ---------------------------------------------------
+# Sources are parsed statically, so the package and its dependencies are never imported
+# https://sphinx-autoapi.readthedocs.io/en/latest/reference/config.html
+autoapi_type = "python"
+autoapi_dirs = ["../../src/crypto_api_client"]
+autoapi_options = [
+    "members",
+    "show-inheritance",
+    "undoc-members",
+]
+autoapi_keep_files = False
 
-# Configuration for more detailed control
+# AutoAPI honours the autodoc type hint settings
 autodoc_typehints = 'description'
 autodoc_typehints_description_target = 'documented'
 
@@ -79,18 +85,17 @@ suppress_warnings = [
     'app.add_generic_role',
     'app.add_source_parser',
     'autosummary',
-    'autodoc.import_object',
     'ref.python',  # Suppress cross-reference warnings for multiple targets
-    'autodoc',     # Suppress autodoc-related warnings
+    'autoapi',     # Suppress autoapi-related warnings
     'docutils',    # Suppress docstring syntax errors
     'misc.highlighting_failure',  # Suppress JSON syntax highlighting errors
 ]
 
-# Skip Module contents section in __init__.py for Sphinx autodoc
+# Skip Module contents section in __init__.py for Sphinx AutoAPI
 def skip_module_contents(app, what, name, obj, skip, options):
     """Filter to avoid duplicates in Module contents section of __init__.py"""
     # Skip objects defined in package __init__.py
-    if what == "module" and name.endswith(".__init__"):
+    if what in ("module", "package") and name.endswith(".__init__"):
         return True
 
     # Skip classes/functions at package level that are already defined in individual modules
@@ -113,18 +118,10 @@ def skip_module_contents(app, what, name, obj, skip, options):
 
 def setup(app):
     """Sphinx configuration setup"""
-    app.connect('autodoc-skip-member', skip_module_contents)
+    app.connect('autoapi-skip-member', skip_module_contents)
 
     # Raise warning level (show only ERRORs)
     import logging
     logging.getLogger('sphinx').setLevel(logging.ERROR)
-    logging.getLogger('autodoc').setLevel(logging.ERROR)
+    logging.getLogger('autoapi').setLevel(logging.ERROR)
     logging.getLogger('docutils').setLevel(logging.ERROR)
-
-# Pydantic configuration (prevent JSON schema errors)
-autodoc_pydantic_model_show_json_schema = False
-autodoc_pydantic_settings_show_json_schema = False
-autodoc_pydantic_field_show_constraints = False
-autodoc_pydantic_model_show_config_summary = False
-autodoc_pydantic_model_show_validator_summary = False
-autodoc_pydantic_model_show_field_summary = False
@@ -9,30 +9,28 @@ Arbitrage is a trading strategy that profits from price differences between diff
     uv run python examples/arbitrage.py
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
 from decimal import Decimal
+from heapq import nlargest
+from itertools import combinations
+from operator import itemgetter
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 from zoneinfo import ZoneInfo
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.display import BUY_COLOR, SELL_COLOR
-from common.helpers import setup_logging
-from common.ticker_fetcher import fetch_all_btc_jpy_tickers
+from common.display import BUY_COLOR, SELL_COLOR, get_console
+from common.helpers import create_typer_app, run_async, setup_logging
 from common.typer_custom_types import ZONE_INFO_TYPE
-from rich.console import Console
-from rich.table import Table
 
-# Unified settings for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
-console = Console()
+if TYPE_CHECKING:
+    from rich.table import Table
+
+app = create_typer_app()
 
 
 @app.command()
@@ -48,17 +46,20 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(zone_info, log_level))
+    run_async(async_main(zone_info, log_level))
 
 
 async def async_main(zone_info: ZoneInfo, log_level: str) -> None:
+    # Imported here so that --help does not load the library and all exchange modules
+    from common.ticker_fetcher import fetch_all_btc_jpy_tickers
+
     setup_logging(log_level)
 
     tickers = await fetch_all_btc_jpy_tickers()
 
     # Display price list table
     table = create_price_table(tickers, zone_info)
-    console.print(table)
+    get_console().print(table)
 
     # Display arbitrage analysis
     analyze_arbitrage(tickers)
@@ -66,73 +67,99 @@ async def async_main(zone_info: ZoneInfo, log_level: str) -> None:
 
 def create_price_table(tickers: list[dict[str, Any]], zone_info: ZoneInfo) -> Table:
     """Create price table"""
+    from rich.table import Table
+
     table = Table(
         title="BTC/JPY Price Information by Exchange",
         show_header=True,
         header_style="bold magenta",
     )
 
-    table.add_column("Exchange", style="cyan", width=12)
-    table.add_column("Ask Price", justify="right", style=SELL_COLOR)
-    table.add_column("Bid Price", justify="right", style=BUY_COLOR)
-    table.add_column("Spread", justify="right", style="white")
+    table.add_column("Exchange", style="cyan", width=12, no_wrap=True)
+    table.add_column("Ask Price", justify="right", style=SELL_COLOR, no_wrap=True)
+    table.add_column("Bid Price", justify="right", style=BUY_COLOR, no_wrap=True)
+    table.add_column("Spread", justify="right", style="white", no_wrap=True)
     table.add_column("Timestamp", style="dim")
 
+    rows: list[tuple[str, str, str, str, str]] = []
     for ticker_data in tickers:
         if "error" in ticker_data:
-            table.add_row(
-                ticker_data["exchange"],
-                "[red]Error[/red]",
-                "-",
-                "-",
-                ticker_data.get("error", "Unknown error"),
+            rows.append(
+                (
+                    ticker_data["exchange"],
+                    "[red]Error[/red]",
+                    "-",
+                    "-",
+                    ticker_data.get("error", "Unknown error"),
+                )
             )
             continue
 
-        # Calculate spread
-        spread = "-"
-        if ticker_data.get("ask_price") and ticker_data.get("bid_price"):
-            try:
-                ask = Decimal(str(ticker_data["ask_price"]))
-                bid = Decimal(str(ticker_data["bid_price"]))
-
-                spread_value = ask - bid
-                spread_pct = (spread_value / bid * 100) if bid > 0 else 0
-                spread = f"¥{spread_value:,.0f} ({spread_pct:.3f}%)"
-            except (ValueError, TypeError, AttributeError):
-                pass
-
-        # Format price
-        def format_price(price: Any) -> str:
-            if price is None:
-                return "-"
-            try:
-                return f"¥{Decimal(str(price)):,.0f}"
-            except (ValueError, TypeError, AttributeError):
-                return str(price)
+        ask_price = ticker_data.get("ask_price")
+        bid_price = ticker_data.get("bid_price")
+
+        # Convert each price to Decimal once and reuse it for formatting and spread
+        try:
+            ask = _to_decimal(ask_price)
+            bid = _to_decimal(bid_price)
+            ask_text = _format_price(ask)
+            bid_text = _format_price(bid)
+            spread = _format_spread(ask, bid)
+        except (ArithmeticError, ValueError, TypeError):
+            ask_text = "-" if ask_price is None else str(ask_price)
+            bid_text = "-" if bid_price is None else str(bid_price)
+            spread = "-"
 
         # Format timestamp
         timestamp_str = "-"
-        if ticker_data.get("timestamp"):
-            try:
-                dt = ticker_data["timestamp"]
-                if hasattr(dt, "astimezone"):
-                    dt = dt.astimezone(zone_info)
-                    timestamp_str = dt.strftime("%H:%M:%S")
-            except (AttributeError, TypeError):
-                pass
-
-        table.add_row(
-            ticker_data["exchange"],
-            format_price(ticker_data.get("ask_price")),
-            format_price(ticker_data.get("bid_price")),
-            spread,
-            timestamp_str,
-        )
+        dt = ticker_data.get("timestamp")
+        if dt is not None and hasattr(dt, "astimezone"):
+            timestamp_str = dt.astimezone(zone_info).strftime("%H:%M:%S")
+
+        rows.append((ticker_data["exchange"], ask_text, bid_text, spread, timestamp_str))
+
+    for row in rows:
+        table.add_row(*row)
 
     return table
 
 
+def _price_to_decimal(price: Any) -> Decimal:
+    """Convert price to Decimal (domain models already hold Decimal values)"""
+    if isinstance(price, Decimal):
+        return price
+    return Decimal(str(price))
+
+
+def _to_decimal(price: Any) -> Decimal | None:
+    if price is None:
+        return None
+    return _price_to_decimal(price)
+
+
+def _format_yen(amount: Decimal) -> str:
+    """Format whole yen with thousands separators
+
+    round() yields an int (with the same half-even rounding as ``:,.0f``),
+    and int formatting is much cheaper than Decimal's format-spec handling.
+    """
+    return f"¥{round(amount):,}"
+
+
+def _format_price(price: Decimal | None) -> str:
+    if price is None:
+        return "-"
+    return _format_yen(price)
+
+
+def _format_spread(ask: Decimal | None, bid: Decimal | None) -> str:
+    if not ask or not bid:
+        return "-"
+    spread_value = ask - bid
+    spread_pct = (spread_value / bid * 100) if bid > 0 else 0
+    return f"{_format_yen(spread_value)} ({spread_pct:.3f}%)"
+
+
 def analyze_arbitrage(tickers: list[dict[str, Any]]) -> None:
     valid_tickers = [
         t
@@ -141,7 +168,9 @@ def analyze_arbitrage(tickers: list[dict[str, Any]]) -> None:
     ]
 
     if len(valid_tickers) < 2:
-        console.print("\n[red]Error: Valid data from less than 2 exchanges[/red]")
+        get_console().print(
+            "\n[red]Error: Valid data from less than 2 exchanges[/red]"
+        )
         return
 
     # Display spreads for all exchange pairs
@@ -149,54 +178,44 @@ def analyze_arbitrage(tickers: list[dict[str, Any]]) -> None:
 
 
 def display_all_spreads(tickers: list[dict[str, Any]]) -> None:
+    console = get_console()
     console.print("\n[bold cyan]📈 Spreads for All Exchange Pairs[/bold cyan]")
 
+    # Convert prices once per exchange instead of once per exchange pair
+    quotes = [
+        (
+            t["exchange"],
+            _price_to_decimal(t["ask_price"]),
+            _price_to_decimal(t["bid_price"]),
+        )
+        for t in tickers
+    ]
+
     # Calculate spreads
     spreads: list[tuple[str, str, Decimal, Decimal]] = []
 
-    for i, buy_exchange in enumerate(tickers):
-        for sell_exchange in tickers[i + 1 :]:
-            buy_ask = Decimal(str(buy_exchange["ask_price"]))
-            sell_bid = Decimal(str(sell_exchange["bid_price"]))
-
-            # Profit when buying on buy_exchange and selling on sell_exchange
-            profit1 = sell_bid - buy_ask
-            profit1_pct = (profit1 / buy_ask * 100) if buy_ask > 0 else Decimal(0)
-
-            # Reverse direction
-            sell_ask = Decimal(str(sell_exchange["ask_price"]))
-            buy_bid = Decimal(str(buy_exchange["bid_price"]))
-            profit2 = buy_bid - sell_ask
-            profit2_pct = (profit2 / sell_ask * 100) if sell_ask > 0 else Decimal(0)
-
-            if profit1 > profit2:
-                spreads.append(
-                    (
-                        buy_exchange["exchange"],
-                        sell_exchange["exchange"],
-                        profit1,
-                        profit1_pct,
-                    )
-                )
-            else:
-                spreads.append(
-                    (
-                        sell_exchange["exchange"],
-                        buy_exchange["exchange"],
-                        profit2,
-                        profit2_pct,
-                    )
-                )
+    for (name1, ask1, bid1), (name2, ask2, bid2) in combinations(quotes, 2):
+        # Profit when buying on exchange 1 and selling on exchange 2
+        profit1 = bid2 - ask1
+        # Reverse direction
+        profit2 = bid1 - ask2
+
+        if profit1 > profit2:
+            profit1_pct = (profit1 / ask1 * 100) if ask1 > 0 else Decimal(0)
+            spreads.append((name1, name2, profit1, profit1_pct))
+        else:
+            profit2_pct = (profit2 / ask2 * 100) if ask2 > 0 else Decimal(0)
+            spreads.append((name2, name1, profit2, profit2_pct))
 
-    # Sort by spread (descending)
-    spreads.sort(key=lambda x: x[2], reverse=True)
+    # Select top 3 by spread (descending) without sorting every pair
+    top_spreads = nlargest(3, spreads, key=itemgetter(2))
 
     # Display top 3
     console.print("\nTop 3 spreads:")
-    for i, (buy_ex, sell_ex, profit, profit_pct) in enumerate(spreads[:3], 1):
+    for i, (buy_ex, sell_ex, profit, profit_pct) in enumerate(top_spreads, 1):
         color = "green" if profit > 0 else "red"
         console.print(
-            f"  {i}. {buy_ex} → {sell_ex}: [{color}]¥{profit:,.0f} ({profit_pct:.3f}%)[/{color}]"
+            f"  {i}. {buy_ex} → {sell_ex}: [{color}]{_format_yen(profit)} ({profit_pct:.3f}%)[/{color}]"
         )
 
 
@@ -15,6 +15,9 @@ using :func:`~crypto_api_client.factories.create_response_validator`.
     # Propagate errors as-is (typer traceback display)
     uv run python examples/binance/default_response_validator.py --demo callbacks
 
+    # Run both demos concurrently
+    uv run python examples/binance/default_response_validator.py --demo both
+
 .. note::
 
     If you want to customize error handling (custom logging, conversion to
@@ -36,19 +39,20 @@ from typing import Annotated
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import setup_logging
+from common.display import create_recording_console, replay_console
+from common.helpers import (
+    create_typer_app,
+    get_response_validator,
+    run_async,
+    setup_logging,
+)
 from rich.console import Console
 
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.binance import TickerRequest
 from crypto_api_client.errors.exceptions import ExchangeApiError
-from crypto_api_client.factories import create_response_validator
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+app = create_typer_app()
 console = Console()
 
 
@@ -58,7 +62,8 @@ def main(
         str,
         typer.Option(
             "--demo",
-            help="Demo type: exception (exception handling), callbacks (callback)",
+            help="Demo type: exception (exception handling), callbacks (callback), "
+            "both (run both concurrently)",
         ),
     ] = "exception",
     log_level: Annotated[
@@ -66,7 +71,7 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(demo, log_level))
+    run_async(async_main(demo, log_level))
 
 
 async def async_main(demo: str, log_level: str) -> None:
@@ -81,18 +86,34 @@ async def async_main(demo: str, log_level: str) -> None:
         await demonstrate_exception_display()
     elif demo == "callbacks":
         await demonstrate_callbacks()
-
-
-async def demonstrate_exception_display() -> None:
-    console.print("\n[bold cyan]Public API + default response validator[/bold cyan]")
-    console.print("   Generate exception with non-existent symbol and verify ExchangeApiError\n")
-
-    validator = create_response_validator(Exchange.BINANCE)
+    elif demo == "both":
+        # The demos are independent round-trips, so run them concurrently. Each
+        # one writes to its own recording console, replayed in order once both
+        # have finished so their output does not interleave. The callbacks demo's
+        # error is re-raised only after that
+        outputs = (create_recording_console(), create_recording_console())
+        results = await asyncio.gather(
+            demonstrate_exception_display(outputs[0]),
+            demonstrate_callbacks(outputs[1]),
+            return_exceptions=True,
+        )
+        for out in outputs:
+            replay_console(out, console)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+
+async def demonstrate_exception_display(out: Console = console) -> None:
+    out.print("\n[bold cyan]Public API + default response validator[/bold cyan]")
+    out.print("   Generate exception with non-existent symbol and verify ExchangeApiError\n")
+
+    validator = get_response_validator(Exchange.BINANCE)
 
     symbol = "INVALID_SYMBOL"
 
-    console.print(f"   📍 Validator type: {type(validator).__name__}")
-    console.print(f"   📊 Symbol: {symbol}\n")
+    out.print(f"   📍 Validator type: {type(validator).__name__}")
+    out.print(f"   📊 Symbol: {symbol}\n")
 
     try:
         async with create_session(Exchange.BINANCE, callbacks=(validator,)) as session:
@@ -100,18 +121,18 @@ async def demonstrate_exception_display() -> None:
             ticker = await session.api.ticker_24hr(request)  # pyright: ignore[reportUnusedVariable]  # noqa: F841
 
     except ExchangeApiError as e:
-        console.print(f"   ❌ [red]error description: {e.error_description}[/red]")
-        console.print(f"      [red]http status code: {e.http_status_code}[/red]")
-        console.print(f"      [red]api status code 1: {e.api_status_code_1}[/red]")
-        console.print(f"      [red]api error message 1: {e.api_error_message_1}[/red]")
-        console.print(f"      [red]response body: {e.response_body}[/red]")
+        out.print(f"   ❌ [red]error description: {e.error_description}[/red]")
+        out.print(f"      [red]http status code: {e.http_status_code}[/red]")
+        out.print(f"      [red]api status code 1: {e.api_status_code_1}[/red]")
+        out.print(f"      [red]api error message 1: {e.api_error_message_1}[/red]")
+        out.print(f"      [red]response body: {e.response_body}[/red]")
 
 
-async def demonstrate_callbacks() -> None:
-    console.print("\n[bold cyan]Public API + default response validator[/bold cyan]")
-    console.print("   Call API with invalid symbol and verify validator behavior\n")
+async def demonstrate_callbacks(out: Console = console) -> None:
+    out.print("\n[bold cyan]Public API + default response validator[/bold cyan]")
+    out.print("   Call API with invalid symbol and verify validator behavior\n")
 
-    validator = create_response_validator(Exchange.BINANCE)
+    validator = get_response_validator(Exchange.BINANCE)
 
     async with create_session(
         Exchange.BINANCE,
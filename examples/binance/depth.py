@@ -11,9 +11,11 @@ Displays bid and ask order lists, mid price, and spread.
 
     # Fetch order book for ETH/USDT
     uv run python examples/binance/depth.py --pair ETHUSDT --price-band 10 --rows 5
+
+    # Always fetch the maximum depth (5000 levels)
+    uv run python examples/binance/depth.py --pair BTCUSDT --price-band 100 --full-depth
 """
 
-import asyncio
 import sys
 from decimal import Decimal
 from pathlib import Path
@@ -22,7 +24,7 @@ from typing import Annotated
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import format_price, setup_logging
+from common.helpers import create_typer_app, format_price, run_async, setup_logging
 from common.order_book_display import display_order_book_table_with_bands
 from common.typer_custom_types import POSITIVE_DECIMAL_TYPE
 
@@ -32,11 +34,13 @@ from crypto_api_client.binance import (
     DepthRequest,
 )
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+# Depth limits accepted by BINANCE /api/v3/depth (smaller limits have lower request weight)
+DEPTH_LIMITS = (5, 10, 20, 50, 100, 500, 1000, 5000)
+
+# Initial guess of order book levels needed per displayed price band
+LEVELS_PER_ROW_ESTIMATE = 10
+
+app = create_typer_app()
 
 
 @app.command()
@@ -63,27 +67,78 @@ def main(
             help="Number of rows to display (applied after price band grouping)",
         ),
     ] = 5,
+    full_depth: Annotated[
+        bool,
+        typer.Option(
+            "--full-depth",
+            help="Always fetch the maximum depth (5000 levels) instead of only what the displayed rows need",
+        ),
+    ] = False,
     log_level: Annotated[
         str,
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(price_band, pair, rows, log_level))
+    run_async(async_main(price_band, pair, rows, full_depth, log_level))
 
 
-async def async_main(price_band: Decimal, pair: str, rows: int, log_level: str) -> None:
+async def async_main(
+    price_band: Decimal, pair: str, rows: int, full_depth: bool, log_level: str
+) -> None:
     setup_logging(log_level)
 
-    request = DepthRequest(
-        symbol=pair, limit=5000
-    )  # Fetch more data for price band aggregation
+    limit = (
+        DEPTH_LIMITS[-1]
+        if full_depth
+        else snap_depth_limit(rows * LEVELS_PER_ROW_ESTIMATE)
+    )
 
     async with create_session(Exchange.BINANCE) as session:
-        depth = await session.api.depth(request)
+        while True:
+            request = DepthRequest(symbol=pair, limit=limit)
+            depth = await session.api.depth(request)
+
+            # Grow the depth only when the fetched levels cannot fill the requested rows
+            if limit == DEPTH_LIMITS[-1] or covers_rows(depth, limit, rows, price_band):
+                break
+            limit = snap_depth_limit(limit + 1)
 
     display_depth(depth, request, rows, price_band)
 
 
+def snap_depth_limit(levels: int) -> int:
+    """Return the smallest valid BINANCE depth limit that is >= levels
+
+    :param levels: Number of order book levels needed
+    :return: Valid depth limit (capped at 5000)
+    """
+    return next((limit for limit in DEPTH_LIMITS if limit >= levels), DEPTH_LIMITS[-1])
+
+
+def covers_rows(depth: Depth, limit: int, rows: int, price_band: Decimal) -> bool:
+    """Check whether the fetched depth is enough to display the requested rows
+
+    The display picks the ``rows`` bands closest to the center from both sides
+    combined, so a sparse side can leave all of them to the other one. Any side cut
+    off by the limit must therefore hold ``rows`` complete bands besides its
+    outermost one, which may be partial; the outermost band and everything beyond
+    it then rank below the displayed rows.
+
+    :param depth: Fetched depth
+    :param limit: Depth limit used for the request
+    :param rows: Number of rows to display
+    :param price_band: Width of price band
+    :return: True if no more depth is needed
+    """
+    for entries in (depth.asks, depth.bids):
+        if len(entries) < limit:
+            continue  # Whole side of the order book was returned
+        bands = {entry.price // price_band for entry in entries}
+        if len(bands) < rows + 1:
+            return False
+    return True
+
+
 def display_depth(
     depth: Depth,
     request: DepthRequest,
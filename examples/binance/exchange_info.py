@@ -16,35 +16,51 @@ Fetches a list and detailed information of currency pairs supported by the excha
 
     # Fetch only symbols with TRADING status
     uv run python examples/binance/exchange_info.py --status TRADING
+
+    # Show details for the first 20 symbols only
+    uv run python examples/binance/exchange_info.py --show-details --limit 20
 """
 
+from __future__ import annotations
+
 import asyncio
 import sys
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from common.helpers import setup_logging
+from common.display import get_console
+from common.helpers import create_typer_app, run_async, setup_logging
+
+if TYPE_CHECKING:
+    from crypto_api_client.binance import (
+        ExchangeInfo,
+        ExchangeSymbol,
+        SymbolStatus,
+    )
+
+app = create_typer_app()
 
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.binance import (
-    ExchangeInfo,
-    ExchangeInfoRequest,
-    ExchangeSymbol,
-    SymbolStatus,
-)
+# Maximum number of rows rendered per summary table
+SUMMARY_TABLE_CHUNK_SIZE = 500
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
-console = Console()
+# Keyed by SymbolStatus value so the table can be built without importing the library
+_UNKNOWN_STATUS_EMOJI = "⚪"
+_EMOJI_BY_STATUS_VALUE: dict[str, str] = {
+    "TRADING": "🟢",
+    "HALT": "🔴",
+    "BREAK": "🟡",
+    "AUCTION_MATCH": "🔵",
+    "PRE_TRADING": "⚪",
+    "POST_TRADING": "⚪",
+    "END_OF_DAY": "⚫",
+}
 
 
 @app.command()
@@ -77,17 +93,26 @@ def main(
             help="Show detailed information for each symbol",
         ),
     ] = False,
+    limit: Annotated[
+        int | None,
+        typer.Option(
+            "--limit",
+            help="Maximum number of symbols to show in detailed view",
+            min=1,
+        ),
+    ] = None,
     log_level: Annotated[
         str,
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(
+    run_async(
         async_main(
             symbol=symbol,
             permissions=permissions,
             symbol_status=status,
             show_details=show_details,
+            limit=limit,
             log_level=log_level,
         )
     )
@@ -98,27 +123,48 @@ async def async_main(
     permissions: str | None,
     symbol_status: str | None,
     show_details: bool,
+    limit: int | None,
     log_level: str,
 ) -> None:
-    setup_logging(log_level)
+    from crypto_api_client import Exchange, create_session
+    from crypto_api_client.binance import ExchangeInfoRequest
 
-    request_params: dict[str, Any] = {}
-    if symbol:
-        request_params["symbol"] = symbol
-    elif permissions:
-        request_params["permissions"] = permissions
+    setup_logging(log_level)
 
-    if symbol_status:
-        request_params["symbol_status"] = symbol_status
+    # symbol takes precedence over permissions (mutually exclusive in the API)
+    request_params: dict[str, Any] = {
+        key: value
+        for key, value in (
+            ("symbol", symbol),
+            ("permissions", None if symbol else permissions),
+            ("symbol_status", symbol_status),
+        )
+        if value
+    }
 
-    request = ExchangeInfoRequest(**request_params) if request_params else None
+    # Typer already parsed the options and mutual exclusivity is enforced above,
+    # so skip Pydantic validation
+    request = (
+        ExchangeInfoRequest.model_construct(**request_params) if request_params else None
+    )
 
     async with create_session(Exchange.BINANCE) as session:
         exchange_info = await session.api.exchange_info(request)
-        display_exchange_info(exchange_info, show_details)
+
+    # Aggregate thousands of symbols in a worker thread to keep the event loop free
+    statistics = await asyncio.to_thread(
+        compute_summary_statistics, exchange_info.symbols
+    )
+    display_exchange_info(exchange_info, statistics, show_details, limit)
 
 
-def display_exchange_info(exchange_info: ExchangeInfo, show_details: bool) -> None:
+def display_exchange_info(
+    exchange_info: ExchangeInfo,
+    statistics: SummaryStatistics,
+    show_details: bool,
+    limit: int | None = None,
+) -> None:
+    console = get_console()
     console.print("\n[bold cyan]🏦 BINANCE Exchange Information[/bold cyan]")
     console.print(f"Timezone: {exchange_info.timezone}")
     console.print(f"Server Time: {exchange_info.serverTime}")
@@ -127,14 +173,15 @@ def display_exchange_info(exchange_info: ExchangeInfo, show_details: bool) -> No
     display_rate_limits(exchange_info)
 
     if show_details:
-        display_detailed_symbols(exchange_info.symbols)
+        display_detailed_symbols(exchange_info.symbols, limit)
     else:
         display_summary_table(exchange_info.symbols)
 
-    display_summary_statistics(exchange_info.symbols)
+    display_summary_statistics(statistics)
 
 
 def display_rate_limits(exchange_info: ExchangeInfo) -> None:
+    console = get_console()
     console.print("[bold]Rate Limits:[/bold]")
     for limit in exchange_info.rateLimits:
         interval_text = f"{limit.intervalNum} {limit.interval.value}"
@@ -145,123 +192,154 @@ def display_rate_limits(exchange_info: ExchangeInfo) -> None:
 
 
 def display_summary_table(symbols: list[ExchangeSymbol]) -> None:
-    table = Table(title="Trading Symbols", show_header=True)
-    table.add_column("Symbol", style="cyan", width=15)
-    table.add_column("Status", style="magenta")
-    table.add_column("Base/Quote", style="green")
-    table.add_column("Permissions", style="yellow")
+    from rich.table import Table
 
-    for symbol in symbols:
-        status_emoji = get_status_emoji(symbol.status)
-        status_display = f"{status_emoji} {symbol.status.value}"
-        base_quote = f"{symbol.baseAsset}/{symbol.quoteAsset}"
-        permissions_str = ", ".join(symbol.permissions)
-
-        table.add_row(
+    console = get_console()
+    rows = [
+        (
             symbol.symbol,
-            status_display,
-            base_quote,
-            permissions_str,
+            f"{get_status_emoji(symbol.status)} {symbol.status.value}",
+            f"{symbol.baseAsset}/{symbol.quoteAsset}",
+            ", ".join(symbol.permissions),
         )
+        for symbol in symbols
+    ]
+
+    # Render large symbol lists in chunks so each Table is released after printing
+    total = len(rows)
+    for start in range(0, max(total, 1), SUMMARY_TABLE_CHUNK_SIZE):
+        chunk = rows[start : start + SUMMARY_TABLE_CHUNK_SIZE]
+        title = "Trading Symbols"
+        if total > SUMMARY_TABLE_CHUNK_SIZE:
+            title += f" ({start + 1}-{start + len(chunk)} of {total})"
+
+        table = Table(title=title, show_header=True, show_lines=False, expand=False)
+        table.add_column("Symbol", style="cyan", width=15, no_wrap=True)
+        table.add_column("Status", style="magenta", no_wrap=True)
+        table.add_column("Base/Quote", style="green", no_wrap=True)
+        table.add_column("Permissions", style="yellow")
 
-    console.print(table)
+        for row in chunk:
+            table.add_row(*row)
 
+        console.print(table)
 
-def display_detailed_symbols(symbols: list[ExchangeSymbol]) -> None:
+
+def display_detailed_symbols(
+    symbols: list[ExchangeSymbol], limit: int | None = None
+) -> None:
+    """Print detailed symbol blocks one at a time
+
+    Each block is rendered and flushed as soon as it is produced, so only one
+    symbol's output is held in memory and output can be interrupted early.
+    """
+    console = get_console()
+    count = len(symbols) if limit is None else min(limit, len(symbols))
+    for block in iter_symbol_blocks(symbols[:count]):
+        console.print(block)
+
+    if count < len(symbols):
+        console.print(f"\n... {len(symbols) - count} more symbols (use --limit)")
+
+
+def iter_symbol_blocks(symbols: list[ExchangeSymbol]) -> Iterator[str]:
+    """Yield the detailed display text for each symbol"""
     for i, symbol in enumerate(symbols, 1):
-        console.print(f"\n[bold cyan]═══ {i}. {symbol.symbol} ═══[/bold cyan]")
-        console.print(
-            f"Status: {get_status_emoji(symbol.status)} {symbol.status.value}"
+        features = ", ".join(
+            label
+            for label, allowed in (
+                ("✓ Spot Trading", symbol.isSpotTradingAllowed),
+                ("✓ Margin Trading", symbol.isMarginTradingAllowed),
+                ("✓ Iceberg Orders", symbol.icebergAllowed),
+                ("✓ OCO Orders", symbol.ocoAllowed),
+                ("✓ OTO Orders", symbol.otoAllowed),
+            )
+            if allowed
         )
-        console.print(
-            f"Base Asset: {symbol.baseAsset} (Precision: {symbol.baseAssetPrecision})"
-        )
-        console.print(
-            f"Quote Asset: {symbol.quoteAsset} (Precision: {symbol.quoteAssetPrecision})"
+
+        block = (
+            f"\n[bold cyan]═══ {i}. {symbol.symbol} ═══[/bold cyan]\n"
+            f"Status: {get_status_emoji(symbol.status)} {symbol.status.value}\n"
+            f"Base Asset: {symbol.baseAsset} (Precision: {symbol.baseAssetPrecision})\n"
+            f"Quote Asset: {symbol.quoteAsset} (Precision: {symbol.quoteAssetPrecision})\n"
+            f"Order Types: {', '.join(symbol.orderTypes)}\n"
+            f"Features: {features}\n"
+            f"Permissions: {', '.join(symbol.permissions)}\n"
+            # Filter information (brief display)
+            f"Filters: {len(symbol.filters)} filters applied"
         )
-        console.print(f"Order Types: {', '.join(symbol.orderTypes)}")
-
-        # Trading capabilities
-        features: list[str] = []
-        if symbol.isSpotTradingAllowed:
-            features.append("✓ Spot Trading")
-        if symbol.isMarginTradingAllowed:
-            features.append("✓ Margin Trading")
-        if symbol.icebergAllowed:
-            features.append("✓ Iceberg Orders")
-        if symbol.ocoAllowed:
-            features.append("✓ OCO Orders")
-        if symbol.otoAllowed:
-            features.append("✓ OTO Orders")
-
-        console.print(f"Features: {', '.join(features)}")
-        console.print(f"Permissions: {', '.join(symbol.permissions)}")
-
-        # Filter information (brief display)
-        console.print(f"Filters: {len(symbol.filters)} filters applied")
 
         if i < len(symbols):
-            console.print()  # Separator
+            block += "\n"  # Separator
 
+        yield block
 
-def display_summary_statistics(symbols: list[ExchangeSymbol]) -> None:
-    console.print("\n[bold]📊 Summary Statistics:[/bold]")
 
-    # Count by status
-    status_counts: dict[str, int] = {}
+@dataclass(frozen=True)
+class SummaryStatistics:
+    """Aggregated statistics of exchange symbols"""
+
+    total: int
+    status_counts: Counter[str]
+    permission_counts: Counter[str]
+    spot_count: int
+    margin_count: int
+    iceberg_count: int
+    oco_count: int
+
+
+def compute_summary_statistics(symbols: list[ExchangeSymbol]) -> SummaryStatistics:
+    """Aggregate symbol statistics in a single pass (pure, no I/O)"""
+    status_counts: Counter[str] = Counter()
+    permission_counts: Counter[str] = Counter()
+    spot_count = margin_count = iceberg_count = oco_count = 0
     for symbol in symbols:
-        status_counts[symbol.status.value] = (
-            status_counts.get(symbol.status.value, 0) + 1
-        )
+        status_counts[symbol.status.value] += 1
+        permission_counts.update(symbol.permissions)
+        spot_count += symbol.isSpotTradingAllowed
+        margin_count += symbol.isMarginTradingAllowed
+        iceberg_count += symbol.icebergAllowed
+        oco_count += symbol.ocoAllowed
+
+    return SummaryStatistics(
+        total=len(symbols),
+        status_counts=status_counts,
+        permission_counts=permission_counts,
+        spot_count=spot_count,
+        margin_count=margin_count,
+        iceberg_count=iceberg_count,
+        oco_count=oco_count,
+    )
+
+
+def display_summary_statistics(statistics: SummaryStatistics) -> None:
+    console = get_console()
+    console.print("\n[bold]📊 Summary Statistics:[/bold]")
 
     console.print("\nStatus Distribution:")
-    for status, count in sorted(status_counts.items()):
+    for status, count in sorted(statistics.status_counts.items()):
         emoji = get_status_emoji_from_string(status)
         console.print(f"  {emoji} {status}: {count}")
 
-    # Count by permission
-    permission_counts: dict[str, int] = {}
-    for symbol in symbols:
-        for perm in symbol.permissions:
-            permission_counts[perm] = permission_counts.get(perm, 0) + 1
-
     console.print("\nPermissions Distribution:")
-    for perm, count in sorted(permission_counts.items()):
+    for perm, count in sorted(statistics.permission_counts.items()):
         console.print(f"  • {perm}: {count}")
 
-    # Feature support statistics
-    spot_count = sum(1 for s in symbols if s.isSpotTradingAllowed)
-    margin_count = sum(1 for s in symbols if s.isMarginTradingAllowed)
-    iceberg_count = sum(1 for s in symbols if s.icebergAllowed)
-    oco_count = sum(1 for s in symbols if s.ocoAllowed)
-
+    total = statistics.total
     console.print("\nFeature Support:")
-    console.print(f"  • Spot Trading: {spot_count}/{len(symbols)}")
-    console.print(f"  • Margin Trading: {margin_count}/{len(symbols)}")
-    console.print(f"  • Iceberg Orders: {iceberg_count}/{len(symbols)}")
-    console.print(f"  • OCO Orders: {oco_count}/{len(symbols)}")
+    console.print(f"  • Spot Trading: {statistics.spot_count}/{total}")
+    console.print(f"  • Margin Trading: {statistics.margin_count}/{total}")
+    console.print(f"  • Iceberg Orders: {statistics.iceberg_count}/{total}")
+    console.print(f"  • OCO Orders: {statistics.oco_count}/{total}")
 
 
 def get_status_emoji(status: SymbolStatus) -> str:
-    emoji_map = {
-        SymbolStatus.TRADING: "🟢",
-        SymbolStatus.HALT: "🔴",
-        SymbolStatus.BREAK: "🟡",
-        SymbolStatus.AUCTION_MATCH: "🔵",
-        SymbolStatus.PRE_TRADING: "⚪",
-        SymbolStatus.POST_TRADING: "⚪",
-        SymbolStatus.END_OF_DAY: "⚫",
-    }
-    return emoji_map.get(status, "⚪")
+    return _EMOJI_BY_STATUS_VALUE.get(status.value, _UNKNOWN_STATUS_EMOJI)
 
 
 def get_status_emoji_from_string(status: str) -> str:
     """Return emoji corresponding to status string"""
-    try:
-        status_enum = SymbolStatus(status)
-        return get_status_emoji(status_enum)
-    except ValueError:
-        return "⚪"
+    return _EMOJI_BY_STATUS_VALUE.get(status, _UNKNOWN_STATUS_EMOJI)
 
 
 if __name__ == "__main__":
@@ -14,31 +14,31 @@ Shows total amount and available amount.
     Set BITBANK_API_KEY and BITBANK_API_SECRET as environment variables.
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 import typer
-from common.helpers import get_key_and_secret, setup_logging
-from rich.console import Console
-from rich.table import Table
-
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.bitbank.exchange_api_client import (
-    ExchangeApiClient as BitbankApiClient,
+from common.display import format_amount, get_console
+from common.helpers import (
+    create_typer_app,
+    get_key_and_secret,
+    run_async,
+    setup_logging,
 )
-from crypto_api_client.core.exchange_session import ExchangeSession
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
-console = Console()
+if TYPE_CHECKING:
+    from crypto_api_client.bitbank.exchange_api_client import (
+        ExchangeApiClient as BitbankApiClient,
+    )
+    from crypto_api_client.core.exchange_session import ExchangeSession
+
+app = create_typer_app()
 
 
 @app.command()
@@ -50,10 +50,12 @@ def main(
         ),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(log_level))
+    run_async(async_main(log_level))
 
 
 async def async_main(log_level: str) -> None:
+    from crypto_api_client import Exchange, create_session
+
     setup_logging(log_level)
 
     api_key, api_secret = get_key_and_secret("bitbank")
@@ -69,9 +71,25 @@ async def async_main(log_level: str) -> None:
 async def fetch_and_display_assets(
     session: ExchangeSession[BitbankApiClient],
 ) -> None:
+    from rich.table import Table
+
+    from crypto_api_client import Exchange
+
+    console = get_console()
     assets = await session.api.assets()
 
-    if not assets or not any(a.onhand_amount > 0 or a.free_amount > 0 for a in assets):
+    # Filter and format once; the emptiness check then reuses the result
+    rows = [
+        (
+            asset.asset.upper(),
+            format_amount(asset.onhand_amount),
+            format_amount(asset.free_amount),
+        )
+        for asset in assets
+        if asset.onhand_amount > 0 or asset.free_amount > 0
+    ]
+
+    if not rows:
         console.print("[yellow]No holdings[/yellow]")
         return
 
@@ -82,13 +100,8 @@ async def fetch_and_display_assets(
     table.add_column("Total Amount", justify="right", style="green")
     table.add_column("Available", justify="right", style="yellow")
 
-    for asset in assets:
-        if asset.onhand_amount > 0 or asset.free_amount > 0:
-            table.add_row(
-                asset.asset.upper(),
-                f"{asset.onhand_amount:,.8f}".rstrip("0").rstrip("."),
-                f"{asset.free_amount:,.8f}".rstrip("0").rstrip("."),
-            )
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -6,27 +6,29 @@
     uv run python examples/bitbank/create_order.py --pair btc_jpy --side sell --type limit --amount 0.0001 --price 17000000 --dry-run
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
 from decimal import Decimal
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import get_key_and_secret, setup_logging
+from common.helpers import (
+    create_typer_app,
+    get_key_and_secret,
+    run_async,
+    setup_logging,
+)
 from common.typer_custom_types import (
     POSITIVE_DECIMAL_TYPE,
     PRICE_DECIMAL_TYPE,
 )
-from pydantic import SecretStr
 
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.bitbank import (
-    CreateOrderRequest,
-    Order,
-)
+# Side and OrderType stay at module level because Typer needs them to build
+# the --side and --type choices
 from crypto_api_client.bitbank.native_domain_models import (
     OrderType as BitbankOrderType,
 )
@@ -34,12 +36,15 @@ from crypto_api_client.bitbank.native_domain_models import (
     Side as BitbankSide,
 )
 
-# Unified settings for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+if TYPE_CHECKING:
+    from pydantic import SecretStr
+
+    from crypto_api_client.bitbank import (
+        CreateOrderRequest,
+        Order,
+    )
+
+app = create_typer_app()
 
 
 @app.command()
@@ -68,7 +73,7 @@ def main(
     dry_run: Annotated[bool, typer.Option("--dry-run")] = False,
     log_level: Annotated[str, typer.Option("--log-level", "-l")] = "WARNING",
 ) -> None:
-    asyncio.run(
+    run_async(
         async_main(
             pair,
             type_,
@@ -128,6 +133,8 @@ def build_create_order_request(
     trigger_price: Decimal | None,
     post_only: bool,
 ) -> CreateOrderRequest:
+    from crypto_api_client.bitbank import CreateOrderRequest
+
     return CreateOrderRequest(
         pair=pair,
         side=side,
@@ -158,19 +165,22 @@ def display_order_details(
     :param trigger_price: Trigger price
     :param post_only: Post-only flag
     """
-    typer.echo("\n📋 Order details:")
-    typer.echo("-" * 50)
-    typer.echo(f"Currency pair: {pair}")
-    typer.echo(f"Side: {side.value}")
-    typer.echo(f"Type: {type_.value}")
+    lines = [
+        "\n📋 Order details:",
+        "-" * 50,
+        f"Currency pair: {pair}",
+        f"Side: {side.value}",
+        f"Type: {type_.value}",
+    ]
     if amount:
-        typer.echo(f"Amount: {amount}")
+        lines.append(f"Amount: {amount}")
     if price:
-        typer.echo(f"Price: {price}")
+        lines.append(f"Price: {price}")
     if trigger_price:
-        typer.echo(f"Trigger price: {trigger_price}")
+        lines.append(f"Trigger price: {trigger_price}")
     if post_only and type_ == BitbankOrderType.LIMIT:
-        typer.echo(f"Post-only: {post_only}")
+        lines.append(f"Post-only: {post_only}")
+    typer.echo("\n".join(lines))
 
 
 def display_order_result(order: Order) -> None:
@@ -178,20 +188,23 @@ def display_order_result(order: Order) -> None:
 
     :param order: Order result object
     """
-    typer.echo("\n✅ Order sent successfully!")
-    typer.echo(f"Order ID: {order.order_id}")
-    typer.echo(f"Status: {order.status.value}")
-    typer.echo(f"Order time: {order.ordered_at}")
+    lines = [
+        "\n✅ Order sent successfully!",
+        f"Order ID: {order.order_id}",
+        f"Status: {order.status.value}",
+        f"Order time: {order.ordered_at}",
+    ]
 
     # Display price information
     if order.price:
-        typer.echo(f"Order price: {order.price}")
+        lines.append(f"Order price: {order.price}")
     if order.amount:
-        typer.echo(f"Order amount: {order.amount}")
+        lines.append(f"Order amount: {order.amount}")
     if order.executed_amount:
-        typer.echo(f"Executed amount: {order.executed_amount}")
+        lines.append(f"Executed amount: {order.executed_amount}")
     if order.average_price:
-        typer.echo(f"Average execution price: {order.average_price}")
+        lines.append(f"Average execution price: {order.average_price}")
+    typer.echo("\n".join(lines))
 
 
 async def send_order(
@@ -205,6 +218,8 @@ async def send_order(
     :return: Order result
     :raises Exception: Order sending error
     """
+    from crypto_api_client import Exchange, create_session
+
     async with create_session(
         Exchange.BITBANK, api_key=api_key, api_secret=api_secret
     ) as session:
@@ -10,7 +10,6 @@
     uv run python examples/bitbank/depth.py --pair xrp_jpy --price-band 0.1 --rows 5
 """
 
-import asyncio
 import sys
 from decimal import Decimal
 from pathlib import Path
@@ -19,18 +18,14 @@ from typing import Annotated
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import format_price, setup_logging
+from common.helpers import create_typer_app, format_price, run_async, setup_logging
 from common.order_book_display import display_order_book_table_with_bands
 from common.typer_custom_types import POSITIVE_DECIMAL_TYPE
 
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.bitbank import Depth, DepthRequest
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -62,7 +57,7 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(
+    run_async(
         async_main(
             price_band,
             pair,
@@ -5,28 +5,40 @@
 
     # Check status for all currency pairs
     uv run python examples/bitbank/spot_status.py
+
+    # Reuse the previous response for up to 5 minutes
+    uv run python examples/bitbank/spot_status.py --cache-ttl 300
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import setup_logging
-from rich import print
-from rich.table import Table
+from common.display import get_console
+from common.helpers import create_typer_app, run_async, setup_logging
+from common.response_cache import get_or_fetch
+
+if TYPE_CHECKING:
+    from crypto_api_client.bitbank import SpotStatus
 
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.bitbank import SpotStatus, SpotStatusRequest
+app = create_typer_app()
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+_EMOJI_MAP = {
+    "NORMAL": "🟢",
+    "BUSY": "🟡",
+    "VERY_BUSY": "🟠",
+    "HALT": "🔴",
+}
+_UNKNOWN_STATUS_EMOJI = "⚪"
+
+# "<emoji> <status>" labels built once instead of formatting one per row
+_STATUS_DISPLAY = {status: f"{emoji} {status}" for status, emoji in _EMOJI_MAP.items()}
 
 
 @app.command()
@@ -35,19 +47,37 @@ def main(
         str,
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
+    cache_ttl: Annotated[
+        float,
+        typer.Option(
+            "--cache-ttl",
+            help="Seconds to reuse the previous response (0 disables the cache)",
+        ),
+    ] = 0.0,
 ) -> None:
-    asyncio.run(async_main(log_level))
+    run_async(async_main(log_level, cache_ttl))
+
 
+async def async_main(log_level: str, cache_ttl: float) -> None:
+    from crypto_api_client import Exchange, create_session
+    from crypto_api_client.bitbank import SpotStatus, SpotStatusRequest
 
-async def async_main(log_level: str) -> None:
     setup_logging(log_level)
 
     async with create_session(Exchange.BITBANK) as session:
-        spot_status = await session.api.spot_status(SpotStatusRequest())
+        spot_status = await get_or_fetch(
+            ("bitbank", "spot_status"),
+            SpotStatus,
+            lambda: session.api.spot_status(SpotStatusRequest.model_construct()),
+            ttl_seconds=cache_ttl,
+        )
         display_spot_status(spot_status)
 
 
 def display_spot_status(spot_status: SpotStatus) -> None:
+    from rich.console import Group
+    from rich.table import Table
+
     statuses = spot_status.statuses
 
     table = Table(title="bitbank Exchange Status")
@@ -55,38 +85,33 @@ def display_spot_status(spot_status: SpotStatus) -> None:
     table.add_column("Status", style="magenta")
     table.add_column("Min Order Amount", style="green", justify="right")
 
+    # Count statuses in the same pass that fills the table
+    counts: Counter[str] = Counter()
     for pair_status in statuses:
-        status_emoji = get_status_emoji(pair_status.status.value)
-        status_display = f"{status_emoji} {pair_status.status.value}"
+        status_value = pair_status.status.value
+        counts[status_value] += 1
 
         table.add_row(
             pair_status.pair,
-            status_display,
+            get_status_display(status_value),
             str(pair_status.min_amount),
         )
 
-    print(table)
-
-    normal_count = sum(1 for s in statuses if s.status.value == "NORMAL")
-    busy_count = sum(1 for s in statuses if s.status.value == "BUSY")
-    very_busy_count = sum(1 for s in statuses if s.status.value == "VERY_BUSY")
-    halt_count = sum(1 for s in statuses if s.status.value == "HALT")
-
-    print("\n[bold]Summary:[/bold]")
-    print(f"  🟢 NORMAL: {normal_count}")
-    print(f"  🟡 BUSY: {busy_count}")
-    print(f"  🟠 VERY_BUSY: {very_busy_count}")
-    print(f"  🔴 HALT: {halt_count}")
-
-
-def get_status_emoji(status: str) -> str:
-    emoji_map = {
-        "NORMAL": "🟢",
-        "BUSY": "🟡",
-        "VERY_BUSY": "🟠",
-        "HALT": "🔴",
-    }
-    return emoji_map.get(status, "⚪")
+    summary = "\n".join(
+        [
+            "\n[bold]Summary:[/bold]",
+            *(
+                f"  {emoji} {status_value}: {counts[status_value]}"
+                for status_value, emoji in _EMOJI_MAP.items()
+            ),
+        ]
+    )
+    # Render table and summary together so the terminal gets a single write
+    get_console().print(Group(table, summary))
+
+
+def get_status_display(status: str) -> str:
+    return _STATUS_DISPLAY.get(status) or f"{_UNKNOWN_STATUS_EMOJI} {status}"
 
 
 if __name__ == "__main__":
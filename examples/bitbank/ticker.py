@@ -7,31 +7,25 @@
     uv run python examples/bitbank/ticker.py --pair btc_jpy --zone Asia/Tokyo
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
 from pathlib import Path
-from typing import Annotated
-
-from rich import print
+from typing import TYPE_CHECKING, Annotated
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from zoneinfo import ZoneInfo
 
 import typer
-from common.display import BUY_COLOR, LABEL_WIDTH, SELL_COLOR
-from common.helpers import setup_logging
+from common.display import BUY_COLOR, LABEL_WIDTH, SELL_COLOR, get_console
+from common.helpers import create_typer_app, run_async, setup_logging
 from common.typer_custom_types import ZONE_INFO_TYPE
 
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.bitbank import TickerRequest
-from crypto_api_client.bitbank.native_domain_models import Ticker
+if TYPE_CHECKING:
+    from crypto_api_client.bitbank.native_domain_models import Ticker
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -54,44 +48,47 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(pair, zone_info, log_level))
+    run_async(async_main(pair, zone_info, log_level))
 
 
 async def async_main(pair: str, zone_info: ZoneInfo, log_level: str) -> None:
+    from crypto_api_client import Exchange, create_session
+    from crypto_api_client.bitbank import TickerRequest
+
     setup_logging(log_level)
 
     async with create_session(Exchange.BITBANK) as session:
-        ticker = await session.api.ticker(TickerRequest(pair=pair))
+        ticker = await session.api.ticker(TickerRequest.model_construct(pair=pair))
 
         display_ticker(ticker, pair, zone_info)
 
 
 def display_ticker(ticker: Ticker, pair: str, zone_info: ZoneInfo) -> None:
-    # Basic information
-    typer.echo(f"{'pair':<{LABEL_WIDTH}}: {pair}")
-    print(f"[{SELL_COLOR}]{'sell':<{LABEL_WIDTH}}: {ticker.sell:,.0f}[/]")
-    print(f"[{BUY_COLOR}]{'buy':<{LABEL_WIDTH}}: {ticker.buy:,.0f}[/]")
+    from rich.markup import escape
 
     spread = ticker.sell - ticker.buy
     spread_pct = (spread / ticker.buy) * 100 if ticker.buy != 0 else 0
-    typer.echo(f"{'spread':<{LABEL_WIDTH}}: {spread:,.0f} ({spread_pct:.3f}%)")
-
-    typer.echo(f"{'last':<{LABEL_WIDTH}}: {ticker.last:,.0f}")
-    typer.echo(f"{'vol':<{LABEL_WIDTH}}: {ticker.vol:,.4f}")
-
-    # Exchange-specific fields
-    typer.echo(f"{'open':<{LABEL_WIDTH}}: {ticker.open:,.0f}")
-    print(f"[{SELL_COLOR}]{'high':<{LABEL_WIDTH}}: {ticker.high:,.0f}[/]")
-    print(f"[{BUY_COLOR}]{'low':<{LABEL_WIDTH}}: {ticker.low:,.0f}[/]")
-    typer.echo(
-        f"{'timestamp':<{LABEL_WIDTH}}: {ticker.timestamp.astimezone(zone_info)}"
-    )
-
     price_change = ticker.last - ticker.open
     price_change_pct = (price_change / ticker.open) * 100 if ticker.open != 0 else 0
-    typer.echo(
-        f"{'24h change':<{LABEL_WIDTH}}: {price_change:+,.0f} ({price_change_pct:+.2f}%)\n"
-    )
+
+    # Build the whole block and emit it with one markup parse and one write
+    lines = [
+        # Basic information
+        f"{'pair':<{LABEL_WIDTH}}: {escape(pair)}",
+        f"[{SELL_COLOR}]{'sell':<{LABEL_WIDTH}}: {ticker.sell:,.0f}[/]",
+        f"[{BUY_COLOR}]{'buy':<{LABEL_WIDTH}}: {ticker.buy:,.0f}[/]",
+        f"{'spread':<{LABEL_WIDTH}}: {spread:,.0f} ({spread_pct:.3f}%)",
+        f"{'last':<{LABEL_WIDTH}}: {ticker.last:,.0f}",
+        f"{'vol':<{LABEL_WIDTH}}: {ticker.vol:,.4f}",
+        # Exchange-specific fields
+        f"{'open':<{LABEL_WIDTH}}: {ticker.open:,.0f}",
+        f"[{SELL_COLOR}]{'high':<{LABEL_WIDTH}}: {ticker.high:,.0f}[/]",
+        f"[{BUY_COLOR}]{'low':<{LABEL_WIDTH}}: {ticker.low:,.0f}[/]",
+        f"{'timestamp':<{LABEL_WIDTH}}: {ticker.timestamp.astimezone(zone_info)}",
+        f"{'24h change':<{LABEL_WIDTH}}: "
+        f"{price_change:+,.0f} ({price_change_pct:+.2f}%)\n",
+    ]
+    get_console().print("\n".join(lines), highlight=False)
 
 
 if __name__ == "__main__":
@@ -11,31 +11,31 @@
     Set BITFLYER_API_KEY and BITFLYER_API_SECRET as environment variables.
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 import typer
-from common.helpers import get_key_and_secret, setup_logging
-from rich.console import Console
-from rich.table import Table
-
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.bitflyer.exchange_api_client import (
-    ExchangeApiClient as BitFlyerApiClient,
+from common.display import format_amount, get_console
+from common.helpers import (
+    create_typer_app,
+    get_key_and_secret,
+    run_async,
+    setup_logging,
 )
-from crypto_api_client.core.exchange_session import ExchangeSession
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
-console = Console()
+if TYPE_CHECKING:
+    from crypto_api_client.bitflyer.exchange_api_client import (
+        ExchangeApiClient as BitFlyerApiClient,
+    )
+    from crypto_api_client.core.exchange_session import ExchangeSession
+
+app = create_typer_app()
 
 
 @app.command()
@@ -45,10 +45,12 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(log_level))
+    run_async(async_main(log_level))
 
 
 async def async_main(log_level: str) -> None:
+    from crypto_api_client import Exchange, create_session
+
     setup_logging(log_level)
 
     api_key, api_secret = get_key_and_secret("bitflyer")
@@ -62,9 +64,25 @@ async def async_main(log_level: str) -> None:
 async def fetch_and_display_balances(
     session: ExchangeSession[BitFlyerApiClient],
 ) -> None:
+    from rich.table import Table
+
+    from crypto_api_client import Exchange
+
+    console = get_console()
     balances = await session.api.getbalance()
 
-    if not balances or not any(b.amount > 0 or b.available > 0 for b in balances):
+    # Filter and format once; the emptiness check then reuses the result
+    rows = [
+        (
+            balance.currency_code,
+            format_amount(balance.amount),
+            format_amount(balance.available),
+        )
+        for balance in balances
+        if balance.amount > 0 or balance.available > 0
+    ]
+
+    if not rows:
         console.print("[yellow]No holdings[/yellow]")
         return
 
@@ -75,13 +93,8 @@ async def fetch_and_display_balances(
     table.add_column("Total", justify="right", style="green")
     table.add_column("Available", justify="right", style="yellow")
 
-    for balance in balances:
-        if balance.amount > 0 or balance.available > 0:
-            table.add_row(
-                balance.currency_code,
-                f"{balance.amount:,.8f}".rstrip("0").rstrip("."),
-                f"{balance.available:,.8f}".rstrip("0").rstrip("."),
-            )
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -6,30 +6,26 @@
     uv run python examples/bitflyer/board.py --pair BTC_JPY --price-band 100000
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
 from decimal import Decimal
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import format_price, setup_logging
-from common.order_book_display import display_order_book_table_with_bands
+from common.helpers import create_typer_app, format_price, run_async, setup_logging
 from common.typer_custom_types import POSITIVE_DECIMAL_TYPE
 
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.bitflyer import (
-    Board,
-    BoardRequest,
-)
+if TYPE_CHECKING:
+    from crypto_api_client.bitflyer import (
+        Board,
+        BoardRequest,
+    )
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -61,13 +57,16 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(price_band, pair, rows, log_level))
+    run_async(async_main(price_band, pair, rows, log_level))
 
 
 async def async_main(price_band: Decimal, pair: str, rows: int, log_level: str) -> None:
+    from crypto_api_client import Exchange, create_session
+    from crypto_api_client.bitflyer import BoardRequest
+
     setup_logging(log_level)
 
-    request = BoardRequest(product_code=pair)
+    request = BoardRequest.model_construct(product_code=pair)
 
     async with create_session(Exchange.BITFLYER) as session:
         board = await session.api.board(request)
@@ -81,6 +80,8 @@ def display_board(
     rows: int,
     price_band: Decimal,
 ) -> None:
+    from common.order_book_display import display_order_book_table_with_bands
+
     # Format price_band value according to precision (e.g., 1000 → "1,000", 0.1 → "0.1")
     price_band_str = format_price(price_band, align_to=price_band)
 
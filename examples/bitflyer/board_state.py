@@ -6,9 +6,11 @@ Checks the operational status of the order book for a specified currency pair.
 .. code-block:: console
 
     uv run python examples/bitflyer/board_state.py --pair BTC_JPY
+
+    # Reuse the previous response for up to 5 minutes
+    uv run python examples/bitflyer/board_state.py --pair BTC_JPY --cache-ttl 300
 """
 
-import asyncio
 import sys
 from pathlib import Path
 from typing import Annotated
@@ -17,15 +19,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import common.helpers as utils
 import typer
+from common.response_cache import get_or_fetch
 
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.bitflyer import BoardStateRequest
-
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = utils.create_typer_app()
 
 
 @app.command()
@@ -44,16 +40,32 @@ def main(
             help="Log level: DEBUG, INFO, WARNING, ERROR, CRITICAL",
         ),
     ] = "WARNING",
+    cache_ttl: Annotated[
+        float,
+        typer.Option(
+            "--cache-ttl",
+            help="Seconds to reuse the previous response (0 disables the cache)",
+        ),
+    ] = 0.0,
 ) -> None:
     utils.setup_logging(log_level)
 
-    asyncio.run(async_main(pair))
+    utils.run_async(async_main(pair, cache_ttl))
+
 
+async def async_main(pair: str, cache_ttl: float) -> None:
+    from crypto_api_client import Exchange, create_session
+    from crypto_api_client.bitflyer import BoardStateRequest
+    from crypto_api_client.bitflyer.native_domain_models import BoardState
 
-async def async_main(pair: str) -> None:
     async with create_session(Exchange.BITFLYER) as session:
-        request = BoardStateRequest(product_code=pair)
-        board_state = await session.api.getboardstate(request)
+        request = BoardStateRequest.model_construct(product_code=pair)
+        board_state = await get_or_fetch(
+            ("bitflyer", "getboardstate", pair),
+            BoardState,
+            lambda: session.api.getboardstate(request),
+            ttl_seconds=cache_ttl,
+        )
 
         typer.echo("📋 Board Status:")
         health_emoji = utils.get_health_status_emoji(board_state.health)
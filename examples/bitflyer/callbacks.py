@@ -12,6 +12,7 @@ can be easily added.
 
 import asyncio
 import sys
+import time
 from pathlib import Path
 from typing import Annotated
 
@@ -20,19 +21,15 @@ from yarl import URL
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from common.helpers import create_typer_app, get_response_validator, run_async
+
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.bitflyer import TickerRequest
 from crypto_api_client.callbacks import AbstractRequestCallback
-from crypto_api_client.factories import create_response_validator
 from crypto_api_client.http.http_response_data import HttpResponseData
 from crypto_api_client.security.secret_headers import SecretHeaders
 
-# Unified settings for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -45,29 +42,34 @@ def main(
         ),
     ],
 ) -> None:
-    asyncio.run(async_main(product_code))
+    run_async(async_main(product_code))
 
 
 async def async_main(product_code: str) -> None:
     # Create custom callbacks
-    response_validator = create_response_validator(Exchange.BITFLYER)
+    response_validator = get_response_validator(Exchange.BITFLYER)
     timing_callback = MyAsyncCallback("Timer")
     rate_monitor = RateLimitMonitor()
 
-    async with create_session(
-        Exchange.BITFLYER, callbacks=(response_validator, timing_callback, rate_monitor)
-    ) as session:
-        typer.echo(f"📊 Fetching currency pair {product_code}\n")
+    try:
+        async with create_session(
+            Exchange.BITFLYER,
+            callbacks=(response_validator, timing_callback, rate_monitor),
+        ) as session:
+            typer.echo(f"📊 Fetching currency pair {product_code}\n")
 
-        request = TickerRequest(product_code=product_code)
-        ticker = await session.api.ticker(request)
+            request = TickerRequest(product_code=product_code)
+            ticker = await session.api.ticker(request)
 
-        typer.echo("\n📈 Result:")
-        typer.echo(
-            f"  {str(ticker.product_code)}: "
-            f"Last price={ticker.ltp:,.0f} JPY, "
-            f"Volume={ticker.volume:,.2f}"
-        )
+            typer.echo("\n📈 Result:")
+            typer.echo(
+                f"  {ticker.product_code}: "
+                f"Last price={ticker.ltp:,.0f} JPY, "
+                f"Volume={ticker.volume:,.2f}"
+            )
+    finally:
+        # Drop any pending reset timer so it does not outlive the event loop
+        rate_monitor.close()
 
 
 class MyAsyncCallback(AbstractRequestCallback):
@@ -90,7 +92,9 @@ class MyAsyncCallback(AbstractRequestCallback):
             f"🔵 [{self.name}] Request #{self.request_count} starting: {url.host}{url.path}",
             color=True,
         )
-        await asyncio.sleep(0.001)  # Simulate async processing
+        # Stand-in for real async work; sleep(0) yields to the loop without
+        # scheduling a timer, so the demo adds no latency to the request
+        await asyncio.sleep(0)
 
     async def after_request(self, response_data: HttpResponseData) -> None:
         """Async processing after response is received."""
@@ -108,11 +112,35 @@ class MyAsyncCallback(AbstractRequestCallback):
             )
 
         # Example async processing: send analysis data (actual implementation would use async HTTP client)
-        await asyncio.sleep(0.001)  # Simulate async processing
+        await asyncio.sleep(0)
 
 
 class RateLimitMonitor(AbstractRequestCallback):
-    """Async callback that monitors rate limit information."""
+    """Async callback that monitors rate limit information.
+
+    When the remaining request count drops below ``threshold``, further requests
+    wait until the reset time reported by the exchange instead of being
+    rejected with HTTP 429.
+    """
+
+    def __init__(self, threshold: int = 5):
+        """
+        :param threshold: Remaining request count below which requests are held
+            until the rate limit resets
+        """
+        self.threshold = threshold
+        # Set while requests may be sent; cleared until the rate limit resets
+        self._gate = asyncio.Event()
+        self._gate.set()
+        # Pending timer that reopens the gate, kept so close() can cancel it
+        self._reset_timer: asyncio.TimerHandle | None = None
+
+    def close(self) -> None:
+        """Cancel a pending reset timer so it does not outlive the session."""
+        if self._reset_timer is not None:
+            self._reset_timer.cancel()
+            self._reset_timer = None
+        self._gate.set()
 
     async def before_request(
         self,
@@ -120,7 +148,8 @@ class RateLimitMonitor(AbstractRequestCallback):
         headers: SecretHeaders,
         data: str | None,
     ) -> None:
-        pass
+        """Wait while the rate limit is nearly exhausted."""
+        await self._gate.wait()
 
     async def after_request(self, response_data: HttpResponseData) -> None:
         """Extract and display rate limit information from response."""
@@ -133,11 +162,32 @@ class RateLimitMonitor(AbstractRequestCallback):
         rate_limit_remaining = headers.get("x-ratelimit-remaining")
         rate_limit_reset = headers.get("x-ratelimit-reset")
 
-        if rate_limit_remaining:
+        if not rate_limit_remaining:
+            return
+
+        typer.echo(
+            f"⚡ Rate Limit: {rate_limit_remaining} requests remaining "
+            f"(Period: {rate_limit_period}s, Reset: {rate_limit_reset})",
+            color=True,
+        )
+
+        if not rate_limit_reset or not self._gate.is_set():
+            return
+
+        try:
+            remaining = int(rate_limit_remaining)
+            # X-RateLimit-Reset is a UNIX timestamp, not a delay
+            delay = int(rate_limit_reset) - time.time()
+        except ValueError:
+            return
+
+        if remaining < self.threshold and delay > 0:
             typer.echo(
-                f"⚡ Rate Limit: {rate_limit_remaining} requests remaining "
-                f"(Period: {rate_limit_period}s, Reset: {rate_limit_reset})",
-                color=True,
+                f"⏸️  Holding requests for {delay:.1f}s until reset", color=True
+            )
+            self._gate.clear()
+            self._reset_timer = asyncio.get_running_loop().call_later(
+                delay, self._gate.set
             )
 
 
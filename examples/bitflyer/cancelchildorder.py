@@ -15,7 +15,6 @@ Order IDs can be checked using the getchildorders command.
     Be careful not to enter the wrong order ID.
 """
 
-import asyncio
 import sys
 from pathlib import Path
 from typing import Annotated
@@ -23,18 +22,19 @@ from typing import Annotated
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import get_key_and_secret, setup_logging
+from common.helpers import (
+    create_typer_app,
+    get_key_and_secret,
+    run_async,
+    setup_logging,
+)
 
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.bitflyer import (
     CancelChildOrderRequest,
 )
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -54,7 +54,7 @@ def main(
         ),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(pair, child_order_id, log_level))
+    run_async(async_main(pair, child_order_id, log_level))
 
 
 async def async_main(pair: str, child_order_id: str, log_level: str) -> None:
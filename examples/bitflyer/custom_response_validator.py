@@ -24,45 +24,101 @@ Provides two custom implementation examples:
     see ``examples/bitflyer/default_response_validator.py``.
 """
 
-import asyncio
-import json
+from __future__ import annotations
+
+import contextlib
 import logging
+import queue
 import sys
+from collections.abc import Iterator
 from datetime import datetime
 from decimal import Decimal
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Annotated
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Annotated, Any
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import get_key_and_secret, setup_logging
-from pydantic import SecretStr
-from rich.console import Console
-from yarl import URL
-
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.bitflyer import (
-    SendChildOrderRequest,
-)
-from crypto_api_client.bitflyer.native_domain_models import (
-    ChildOrderType,
-    Side,
+from common.display import get_console
+from common.helpers import (
+    create_typer_app,
+    get_key_and_secret,
+    run_async,
+    setup_logging,
 )
+
 from crypto_api_client.callbacks import AbstractRequestCallback
+from crypto_api_client.core.decimal_json_parser import DecimalJsonParser
 from crypto_api_client.errors.exceptions import ExchangeApiError
 from crypto_api_client.http._http_status_code import HttpStatusCode
-from crypto_api_client.http.http_response_data import HttpResponseData
-from crypto_api_client.security.secret_headers import SecretHeaders
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
-console = Console()
+if TYPE_CHECKING:
+    from yarl import URL
+
+    from crypto_api_client.http.http_response_data import HttpResponseData
+    from crypto_api_client.security.secret_headers import SecretHeaders
+
+app = create_typer_app()
 logger = logging.getLogger(__name__)
 
+# Error bodies larger than this are not parsed (e.g., upstream debug dumps)
+MAX_ERROR_BODY_LENGTH = 65536
+
+
+def load_error_object(response_data: HttpResponseData) -> dict[str, Any] | None:
+    """Parse error response body as a JSON object, skipping bodies that cannot be one
+
+    Gateways often answer with empty bodies or HTML pages (e.g., 502), so
+    a cheap first-character check avoids a parse attempt that is bound to fail.
+
+    :param response_data: HTTP response data
+    :return: Parsed JSON object, or None if the body is not a JSON object
+    """
+    response_body = response_data.response_body_text
+    if len(response_body) > MAX_ERROR_BODY_LENGTH:
+        return None
+    if response_body.lstrip()[:1] != "{":
+        return None
+    try:
+        return DecimalJsonParser.loads(response_body)
+    except ValueError:
+        return None
+
+
+@contextlib.contextmanager
+def queued_logging(target: logging.Logger) -> Iterator[None]:
+    """Hand target's log records to a listener thread while the block runs
+
+    ``LoggingResponseValidator`` logs from ``after_request`` on the event loop.
+    With a queue in between, the loop only enqueues the record and the root
+    handlers' terminal/pipe writes happen on the listener thread.
+
+    :param target: Logger whose records are queued
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    handler = QueueHandler(log_queue)
+    target.addHandler(handler)
+    # The listener already writes to the root handlers
+    target.propagate = False
+    listener.start()
+    try:
+        yield
+    finally:
+        target.removeHandler(handler)
+        target.propagate = True
+        # Flushes the records still in the queue
+        listener.stop()
+
+
+def _to_status(value: Any) -> int | None:
+    # Parsed JSON numbers are Decimal; bitFlyer status codes are integers
+    return int(value) if isinstance(value, Decimal) else None
+
 
 class BusinessLogicError(Exception):
     """Business logic error (insufficient balance, etc.)"""
@@ -107,21 +163,22 @@ class LoggingResponseValidator(AbstractRequestCallback):
         self.error_count += 1
         self.last_error_time = datetime.now()
 
-        logger.error(
-            "API Error detected",
-            extra={
-                "http_status": http_status_code,
-                "response_body": http_response_data.response_body_text[
-                    :500
-                ],  # First 500 characters
-                "error_count": self.error_count,
-                "timestamp": self.last_error_time.isoformat(),
-            },
-        )
+        # Build the extra fields (body slice, ISO timestamp) only if the record
+        # will actually be emitted
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "API Error detected",
+                extra={
+                    "http_status": http_status_code,
+                    "response_body": http_response_data.response_body_text[
+                        :500
+                    ],  # First 500 characters
+                    "error_count": self.error_count,
+                    "timestamp": self.last_error_time.isoformat(),
+                },
+            )
 
-        api_status, api_message = self._extract_error_info(
-            http_response_data.response_body_text
-        )
+        api_status, api_message = self._extract_error_info(http_response_data)
         raise ExchangeApiError(
             error_description=f"bitFlyer API error (HTTP {http_status_code}, status {api_status}): {api_message}",
             http_status_code=http_status_code,
@@ -130,13 +187,14 @@ class LoggingResponseValidator(AbstractRequestCallback):
             response_body=http_response_data.response_body_text,
         )
 
-    def _extract_error_info(self, response_body: str) -> tuple[int | None, str | None]:
+    def _extract_error_info(
+        self, response_data: HttpResponseData
+    ) -> tuple[int | None, str | None]:
         """Extract error information from response body"""
-        try:
-            data = json.loads(response_body)
-            return data.get("status"), data.get("error_message")
-        except Exception:
+        data = load_error_object(response_data)
+        if data is None:
             return None, None
+        return _to_status(data.get("status")), data.get("error_message")
 
 
 # Error conversion type Response Validator
@@ -150,10 +208,14 @@ class BusinessLogicResponseValidator(AbstractRequestCallback):
         :class:`~crypto_api_client.callbacks.AbstractRequestCallback`
     """
 
-    # Business logic error mapping
-    BUSINESS_ERROR_CODES = {
-        -106: BusinessLogicError("( ゜д゜)What!? That order is impossible!"),
-    }
+    # Business logic error mapping (API status code -> error message)
+    # Messages rather than exception instances: a shared instance would carry
+    # the traceback of every previous raise
+    BUSINESS_ERROR_CODES = MappingProxyType(
+        {
+            -106: "( ゜д゜)What!? That order is impossible!",
+        }
+    )
 
     async def before_request(
         self,
@@ -176,11 +238,13 @@ class BusinessLogicResponseValidator(AbstractRequestCallback):
             return
 
         # Extract API status code
-        api_status = self._extract_api_status(http_response_data.response_body_text)
+        api_status = self._extract_api_status(http_response_data)
 
         # Check for business errors
-        if api_status in self.BUSINESS_ERROR_CODES:
-            raise self.BUSINESS_ERROR_CODES[api_status]
+        if api_status is not None:
+            message = self.BUSINESS_ERROR_CODES.get(api_status)
+            if message is not None:
+                raise BusinessLogicError(message)
 
         # Other errors
         raise ExchangeApiError(
@@ -190,13 +254,12 @@ class BusinessLogicResponseValidator(AbstractRequestCallback):
             response_body=http_response_data.response_body_text,
         )
 
-    def _extract_api_status(self, response_body: str) -> int | None:
+    def _extract_api_status(self, response_data: HttpResponseData) -> int | None:
         """Extract API status code from response body"""
-        try:
-            data = json.loads(response_body)
-            return data.get("status")
-        except Exception:
+        data = load_error_object(response_data)
+        if data is None:
             return None
+        return _to_status(data.get("status"))
 
 
 @app.command()
@@ -218,11 +281,12 @@ def main(
         typer.Option("--private", help="Test using Private API (API key required)"),
     ] = False,
 ) -> None:
-    asyncio.run(async_main(test_type.lower(), log_level, use_private_api))
+    run_async(async_main(test_type.lower(), log_level, use_private_api))
 
 
 async def async_main(test_type: str, log_level: str, use_private_api: bool) -> None:
     setup_logging(log_level)
+    console = get_console()
 
     console.print("[bold magenta]Custom Response Validator Implementation Example[/bold magenta]")
     console.print("=" * 60)
@@ -234,11 +298,17 @@ async def async_main(test_type: str, log_level: str, use_private_api: bool) -> N
 
     tests = test_mapping.get(test_type, [])
 
-    for test_func in tests:
-        await test_func()  # type: ignore
+    with queued_logging(logger):
+        for test_func in tests:
+            await test_func()
 
 
 async def test_logging() -> None:
+    from pydantic import SecretStr
+
+    from crypto_api_client import Exchange, create_session
+
+    console = get_console()
     console.print(
         "\n[bold cyan]Using Logging Response Validator with create_session[/bold cyan]"
     )
@@ -264,6 +334,12 @@ async def test_logging() -> None:
 
 async def test_business_logic() -> None:
     """Use Business Logic Response Validator with create_session"""
+    # Order placement models are only needed by this test
+    from crypto_api_client import Exchange, create_session
+    from crypto_api_client.bitflyer import SendChildOrderRequest
+    from crypto_api_client.bitflyer.native_domain_models import ChildOrderType, Side
+
+    console = get_console()
     console.print(
         "\n[bold cyan]Using Business Logic Response Validator with create_session[/bold cyan]"
     )
@@ -15,6 +15,9 @@ using :func:`~crypto_api_client.factories.create_response_validator`.
     # Propagate errors as-is (typer traceback display)
     uv run python examples/bitflyer/default_response_validator.py --demo callbacks
 
+    # Run both demos concurrently
+    uv run python examples/bitflyer/default_response_validator.py --demo both
+
 .. note::
 
     If you want to customize error handling (custom logging, conversion to
@@ -28,28 +31,28 @@ using :func:`~crypto_api_client.factories.create_response_validator`.
     - :doc:`glossary` - response validator definition
 """
 
+from __future__ import annotations
+
 import asyncio
 import sys
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import setup_logging
-from rich.console import Console
-
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.bitflyer import TickerRequest
-from crypto_api_client.errors.exceptions import ExchangeApiError
-from crypto_api_client.factories import create_response_validator
-
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
+from common.display import create_recording_console, get_console, replay_console
+from common.helpers import (
+    create_typer_app,
+    get_response_validator,
+    run_async,
+    setup_logging,
 )
-console = Console()
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+app = create_typer_app()
 
 
 @app.command()
@@ -58,7 +61,8 @@ def main(
         str,
         typer.Option(
             "--demo",
-            help="Test type: exception (exception handling), callbacks (callback)",
+            help="Test type: exception (exception handling), callbacks (callback), "
+            "both (run both concurrently)",
         ),
     ] = "public",
     log_level: Annotated[
@@ -66,11 +70,12 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(demo, log_level))
+    run_async(async_main(demo, log_level))
 
 
 async def async_main(demo: str, log_level: str) -> None:
     setup_logging(log_level)
+    console = get_console()
 
     console.print("[bold magenta]Default Response Validator Usage Example[/bold magenta]")
     console.print("=" * 60)
@@ -79,13 +84,34 @@ async def async_main(demo: str, log_level: str) -> None:
         await demonstrate_exception_display()
     elif demo == "callbacks":
         await demonstrate_callbacks()
-
-
-async def demonstrate_exception_display() -> None:
+    elif demo == "both":
+        # The demos are independent round-trips, so run them concurrently. Each
+        # one writes to its own recording console, replayed in order once both
+        # have finished so their output does not interleave. The callbacks demo's
+        # error is re-raised only after that
+        outputs = (create_recording_console(), create_recording_console())
+        results = await asyncio.gather(
+            demonstrate_exception_display(outputs[0]),
+            demonstrate_callbacks(outputs[1]),
+            return_exceptions=True,
+        )
+        for out in outputs:
+            replay_console(out, console)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+
+async def demonstrate_exception_display(out: Console | None = None) -> None:
+    from crypto_api_client import Exchange, create_session
+    from crypto_api_client.bitflyer import TickerRequest
+    from crypto_api_client.errors.exceptions import ExchangeApiError
+
+    console = out if out is not None else get_console()
     console.print("\n[bold cyan]Public API + default response validator[/bold cyan]")
     console.print("   Generate exception with non-existent currency pair and verify ExchangeApiError\n")
 
-    validator = create_response_validator(Exchange.BITFLYER)
+    validator = get_response_validator(Exchange.BITFLYER)
 
     pair = "DUMMY_BTC_USDT"
 
@@ -107,11 +133,14 @@ async def demonstrate_exception_display() -> None:
         console.print(f"      [red]response body: {e.response_body}[/red]")
 
 
-async def demonstrate_callbacks() -> None:
+async def demonstrate_callbacks(out: Console | None = None) -> None:
+    from crypto_api_client import Exchange, create_session
+
+    console = out if out is not None else get_console()
     console.print("\n[bold cyan]Private API + default response validator[/bold cyan]")
     console.print("   Intentionally fail authentication on API that requires authentication and verify validator behavior\n")
 
-    validator = create_response_validator(Exchange.BITFLYER)
+    validator = get_response_validator(Exchange.BITFLYER)
 
     async with create_session(
         Exchange.BITFLYER,
@@ -12,10 +12,9 @@ Checks the operational status of the entire exchange or a specified currency pai
     uv run python examples/bitflyer/health.py --pair BTC_JPY
 """
 
-import asyncio
 import sys
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Final
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -25,11 +24,10 @@ import typer
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.bitflyer import HealthRequest
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = utils.create_typer_app()
+
+# HealthRequest is frozen, so the no-pair request can be built once and reused
+_ALL_MARKETS_HEALTH_REQUEST: Final = HealthRequest()
 
 
 @app.command()
@@ -51,12 +49,14 @@ def main(
 ) -> None:
     utils.setup_logging(log_level)
 
-    asyncio.run(async_main(pair))
+    utils.run_async(async_main(pair))
 
 
 async def async_main(pair: str | None) -> None:
     async with create_session(Exchange.BITFLYER) as session:
-        request = HealthRequest(product_code=pair)
+        request = (
+            HealthRequest(product_code=pair) if pair else _ALL_MARKETS_HEALTH_REQUEST
+        )
         health_status = await session.api.gethealth(request)
 
         typer.echo("📊 Health Check Results:")
@@ -22,7 +22,9 @@ Can filter orders by status: active orders, completed, canceled, etc.
 """
 
 import asyncio
+import contextlib
 import sys
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Annotated
 
@@ -31,7 +33,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from zoneinfo import ZoneInfo
 
 import typer
-from common.helpers import get_key_and_secret, setup_logging
+from common.helpers import (
+    create_typer_app,
+    get_key_and_secret,
+    run_async,
+    setup_logging,
+)
+from common.token_bucket import TokenBucket
 from common.typer_custom_types import ZONE_INFO_TYPE
 from pydantic import SecretStr
 from rich.console import Console
@@ -44,13 +52,12 @@ from crypto_api_client.bitflyer import (
 )
 from crypto_api_client.bitflyer.native_domain_models import ChildOrder
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = create_typer_app()
 console = Console()
 
+# Number of orders shown without --verbose
+LIMITED_DISPLAY_COUNT = 3
+
 
 @app.command()
 def main(
@@ -92,7 +99,7 @@ def main(
         typer.Option(
             "--delay",
             min=0.0,
-            help="Delay between requests in seconds",
+            help="Minimum interval between request starts in seconds",
         ),
     ] = 0.2,
     zone_info: Annotated[
@@ -114,7 +121,7 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(
+    run_async(
         async_main(
             pair,
             order_state,
@@ -142,7 +149,12 @@ async def async_main(
 
     api_key, api_secret = get_key_and_secret("BITFLYER")
 
-    orders = await fetch_orders_with_paging(
+    # Pages are displayed as they arrive; only the orders shown without
+    # --verbose and the summary counts are kept
+    first_orders: list[ChildOrder] = []
+    total = buy_count = sell_count = 0
+
+    async for orders in iter_orders_with_paging(
         pair,
         order_state,
         total_count,
@@ -151,17 +163,29 @@ async def async_main(
         api_key,
         api_secret,
         zone_info,
-    )
+    ):
+        if verbose:
+            if total == 0:
+                console.print("\n[bold]Detailed Order List:[/bold]")
+                console.print("=" * 60)
+            display_order_details(orders, zone_info)
+        elif len(first_orders) < LIMITED_DISPLAY_COUNT:
+            first_orders.extend(orders[: LIMITED_DISPLAY_COUNT - len(first_orders)])
 
-    if verbose:
-        display_order_details(orders, zone_info)
-    else:
-        display_limited_orders(orders, zone_info)
+        total += len(orders)
+        for order in orders:
+            if order.side == Side.BUY:
+                buy_count += 1
+            elif order.side == Side.SELL:
+                sell_count += 1
 
-    display_summary(pair, orders, order_state)
+    if not verbose:
+        display_limited_orders(first_orders, total, zone_info)
 
+    display_summary(pair, total, buy_count, sell_count, order_state)
 
-async def fetch_orders_with_paging(
+
+async def iter_orders_with_paging(
     product_code: str,
     order_state: ChildOrderState | None,
     total_count: int,
@@ -170,17 +194,24 @@ async def fetch_orders_with_paging(
     api_key: SecretStr,
     api_secret: SecretStr,
     zone: ZoneInfo | None = None,
-) -> list[ChildOrder]:
-    all_orders: list[ChildOrder] = []
-    before_id: str | None = None
+) -> AsyncIterator[list[ChildOrder]]:
+    """Fetch orders page by page, yielding each page as it arrives
+
+    :return: Async iterator of order pages (newest first), up to total_count orders
+    """
+    fetched_count = 0
     request_count = 0
 
     async with create_session(
         Exchange.BITFLYER, api_key=api_key, api_secret=api_secret
     ) as session:
-        while len(all_orders) < total_count:
-            remaining = total_count - len(all_orders)
-            count = min(batch_size, remaining)
+        # --delay is kept between request starts rather than after each
+        # response, so it overlaps with the previous round-trip
+        bucket = TokenBucket(rate=1 / delay) if delay > 0 else None
+
+        async def fetch_page(count: int, before_id: str | None) -> list[ChildOrder]:
+            if bucket is not None:
+                await bucket.acquire()
 
             request = ChildOrdersRequest(
                 product_code=product_code,
@@ -188,73 +219,94 @@ async def fetch_orders_with_paging(
                 count=count,
                 before=before_id,
             )
+            return await session.api.getchildorders(request)
 
-            request_count += 1
-            console.print(
-                f"[bold blue][Request {request_count}][/bold blue] "
-                f"Fetching {count} orders..."
-            )
+        count = min(batch_size, total_count)
+        page = asyncio.create_task(fetch_page(count, None))
 
-            orders = await session.api.getchildorders(request)
+        try:
+            while True:
+                request_count += 1
+                console.print(
+                    f"[bold blue][Request {request_count}][/bold blue] "
+                    f"Fetching {count} orders..."
+                )
 
-            if not orders:
-                console.print("No more orders available.", style="dim yellow")
-                break
+                orders = await page
 
-            all_orders.extend(orders)
+                if not orders:
+                    console.print("No more orders available.", style="dim yellow")
+                    break
 
-            console.print(
-                f"  [green]→[/green] Fetched [bold]{len(orders)}[/bold] orders. "
-                f"Total: [bold cyan]{len(all_orders)}/{total_count}[/bold cyan]"
-            )
+                fetched_count += len(orders)
 
-            # Display order date/time range
-            if orders:
-                newest = orders[0].child_order_date
-                oldest = orders[-1].child_order_date
-                if zone:
-                    newest_display = newest.astimezone(zone)
-                    oldest_display = oldest.astimezone(zone)
-                    zone_name = zone.key if hasattr(zone, "key") else str(zone)
-                    console.print(
-                        f"     [dim]Range:[/dim] {newest_display.strftime('%Y-%m-%d %H:%M:%S')} ~ "
-                        f"{oldest_display.strftime('%Y-%m-%d %H:%M:%S')} ({zone_name})",
-                        style="dim",
-                    )
-                else:
-                    console.print(
-                        f"     [dim]Range:[/dim] {newest.strftime('%Y-%m-%d %H:%M:%S')} ~ "
-                        f"{oldest.strftime('%Y-%m-%d %H:%M:%S')} (UTC)",
-                        style="dim",
+                # The next page only needs this page's last ID, so request it now
+                # and display this page while it is in flight
+                next_count = min(batch_size, total_count - fetched_count)
+                if len(orders) >= count and next_count > 0:
+                    page = asyncio.create_task(
+                        fetch_page(next_count, orders[-1].child_order_acceptance_id)
                     )
 
-            if orders:
-                before_id = orders[-1].child_order_acceptance_id
-
-            if len(orders) < count:
-                console.print("Reached the end of available orders.", style="dim green")
-                break
-
-            if len(all_orders) >= total_count:
                 console.print(
-                    f"[bold green]✓[/bold green] Reached target count: {total_count}"
+                    f"  [green]→[/green] Fetched [bold]{len(orders)}[/bold] orders. "
+                    f"Total: [bold cyan]{fetched_count}/{total_count}[/bold cyan]"
                 )
-                break
 
-            if len(all_orders) < total_count:
-                await asyncio.sleep(delay)
+                # Display order date/time range
+                if orders:
+                    newest = orders[0].child_order_date
+                    oldest = orders[-1].child_order_date
+                    if zone:
+                        newest_display = newest.astimezone(zone)
+                        oldest_display = oldest.astimezone(zone)
+                        zone_name = zone.key
+                        console.print(
+                            f"     [dim]Range:[/dim] {newest_display.strftime('%Y-%m-%d %H:%M:%S')} ~ "
+                            f"{oldest_display.strftime('%Y-%m-%d %H:%M:%S')} ({zone_name})",
+                            style="dim",
+                        )
+                    else:
+                        console.print(
+                            f"     [dim]Range:[/dim] {newest.strftime('%Y-%m-%d %H:%M:%S')} ~ "
+                            f"{oldest.strftime('%Y-%m-%d %H:%M:%S')} (UTC)",
+                            style="dim",
+                        )
+
+                yield orders
+
+                if len(orders) < count:
+                    console.print(
+                        "Reached the end of available orders.", style="dim green"
+                    )
+                    break
+
+                if fetched_count >= total_count:
+                    console.print(
+                        f"[bold green]✓[/bold green] Reached target count: {total_count}"
+                    )
+                    break
 
-    return all_orders[:total_count]
+                count = next_count
+        finally:
+            # Cancel a prefetch left in flight when the consumer stops early,
+            # so it neither outlives the session nor leaves an unretrieved error
+            if not page.done():
+                page.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await page
 
 
 def display_summary(
     product_code: str,
-    orders: list[ChildOrder],
+    total: int,
+    buy_count: int,
+    sell_count: int,
     order_state: ChildOrderState | None,
 ) -> None:
     state_str = order_state.value if order_state else "ALL"
 
-    if not orders:
+    if not total:
         console.print(
             f"No matching orders found. ({product_code}, State: {state_str})",
             style="dim yellow",
@@ -264,20 +316,18 @@ def display_summary(
     console.print("\n📊 Summary:", style="bold green")
     console.print(f"  [bold]Pair:[/bold] {product_code}")
     console.print(
-        f"  [bold]Total:[/bold] {len(orders)} orders ([dim]State: {state_str}[/dim])"
+        f"  [bold]Total:[/bold] {total} orders ([dim]State: {state_str}[/dim])"
     )
-
-    buy_count = sum(1 for order in orders if order.side == Side.BUY)
-    sell_count = sum(1 for order in orders if order.side == Side.SELL)
     console.print(
         f"  [bold]Breakdown:[/bold] [green]Buy: {buy_count}[/green] / [red]Sell: {sell_count}[/red]"
     )
 
 
-def display_limited_orders(orders: list[ChildOrder], tz: ZoneInfo) -> None:
+def display_limited_orders(orders: list[ChildOrder], total: int, tz: ZoneInfo) -> None:
     """Display a limited number of orders (when not verbose).
 
-    :param orders: List of orders
+    :param orders: First orders to display
+    :param total: Total number of fetched orders
     :param tz: Timezone
     """
     if not orders:
@@ -285,21 +335,19 @@ def display_limited_orders(orders: list[ChildOrder], tz: ZoneInfo) -> None:
 
     console.print("\n[bold]Recent Orders:[/bold]")
 
-    # Display only first 3
-    display_count = min(3, len(orders))
-    for i in range(display_count):
-        order = orders[i]
-        order_display = order.with_timezone(tz)
+    for order in orders:
+        # Only the date is shown, so convert it instead of copying the model
+        order_date = order.child_order_date.astimezone(tz)
         side_color = "green" if order.side == Side.BUY else "red"
         console.print(
             f"  [{side_color}]{order.side.value}[/{side_color}] "
             f"{order.size} @ {order.price if order.price else 'MARKET'} "
-            f"[dim]({order_display.child_order_date.strftime('%Y-%m-%d %H:%M:%S')})[/dim]"
+            f"[dim]({order_date.strftime('%Y-%m-%d %H:%M:%S')})[/dim]"
         )
 
     # Display message if there are omitted orders
-    if len(orders) > 3:
-        omitted_count = len(orders) - 3
+    if total > len(orders):
+        omitted_count = total - len(orders)
         console.print(
             f"\n[dim]... {omitted_count} more orders omitted. "
             f"Use --verbose to show all.[/dim]"
@@ -307,41 +355,39 @@ def display_limited_orders(orders: list[ChildOrder], tz: ZoneInfo) -> None:
 
 
 def display_order_details(orders: list[ChildOrder], tz: ZoneInfo) -> None:
-    """Display detailed information for all orders (when verbose).
+    """Display detailed information for orders (when verbose).
 
     :param orders: List of orders
     :param tz: Timezone
     """
-    if not orders:
-        return
-
-    console.print("\n[bold]Detailed Order List:[/bold]")
-    console.print("=" * 60)
-
+    # One console write per page instead of one per field
+    lines: list[str] = []
     for order in orders:
-        converted = order.with_timezone(tz)
-        side_color = "green" if converted.side == Side.BUY else "red"
+        side_color = "green" if order.side == Side.BUY else "red"
 
-        console.print(f"\n[bold]Order ID:[/bold] {converted.child_order_id}")
-        console.print(
-            f"  [dim]Acceptance ID:[/dim] {converted.child_order_acceptance_id}"
-        )
-        console.print(f"  [bold]Type:[/bold] {converted.child_order_type.value}")
-        console.print(
-            f"  [bold]Side:[/bold] [{side_color}]{converted.side.value}[/{side_color}]"
-        )
-        console.print(f"  [bold]Size:[/bold] {converted.size}")
-        console.print(
-            f"  [bold]Price:[/bold] {converted.price if converted.price else 'MARKET'}"
-        )
-        console.print(f"  [bold]Outstanding:[/bold] {converted.outstanding_size}")
-        console.print(f"  [bold]Executed:[/bold] {converted.executed_size}")
-        if converted.average_price:
-            console.print(f"  [bold]Avg Price:[/bold] {converted.average_price}")
-        console.print(f"  [bold]State:[/bold] {converted.child_order_state.value}")
-        console.print(f"  [bold]Order Date:[/bold] {converted.child_order_date}")
-        if converted.expire_date:
-            console.print(f"  [bold]Expire Date:[/bold] {converted.expire_date}")
+        lines += [
+            f"\n[bold]Order ID:[/bold] {order.child_order_id}",
+            f"  [dim]Acceptance ID:[/dim] {order.child_order_acceptance_id}",
+            f"  [bold]Type:[/bold] {order.child_order_type.value}",
+            f"  [bold]Side:[/bold] [{side_color}]{order.side.value}[/{side_color}]",
+            f"  [bold]Size:[/bold] {order.size}",
+            f"  [bold]Price:[/bold] {order.price if order.price else 'MARKET'}",
+            f"  [bold]Outstanding:[/bold] {order.outstanding_size}",
+            f"  [bold]Executed:[/bold] {order.executed_size}",
+        ]
+        if order.average_price:
+            lines.append(f"  [bold]Avg Price:[/bold] {order.average_price}")
+        lines += [
+            f"  [bold]State:[/bold] {order.child_order_state.value}",
+            f"  [bold]Order Date:[/bold] {order.child_order_date.astimezone(tz)}",
+        ]
+        if order.expire_date:
+            lines.append(
+                f"  [bold]Expire Date:[/bold] {order.expire_date.astimezone(tz)}"
+            )
+
+    if lines:
+        console.print("\n".join(lines))
 
 
 if __name__ == "__main__":
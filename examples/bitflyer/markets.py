@@ -8,9 +8,11 @@ displays information such as currency pairs, market types, and aliases.
 
     # Display basic information
     uv run python examples/bitflyer/markets.py
+
+    # Reuse the previous response for up to an hour
+    uv run python examples/bitflyer/markets.py --cache-ttl 3600
 """
 
-import asyncio
 import sys
 from pathlib import Path
 from typing import Annotated
@@ -22,13 +24,9 @@ from crypto_api_client.bitflyer.native_domain_models import Market
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 import common.helpers as utils
+from common.response_cache import get_or_fetch
 
-# Unified settings for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,      # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False        # Show full traceback
-)
+app = utils.create_typer_app()
 
 
 @app.command()
@@ -37,28 +35,39 @@ def main(
         str,
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
+    cache_ttl: Annotated[
+        float,
+        typer.Option(
+            "--cache-ttl",
+            help="Seconds to reuse the previous response (0 disables the cache)",
+        ),
+    ] = 0.0,
 ) -> None:
-    asyncio.run(async_main(log_level))
+    utils.run_async(async_main(log_level, cache_ttl))
 
 
-async def async_main(log_level: str) -> None:
+async def async_main(log_level: str, cache_ttl: float) -> None:
     utils.setup_logging(log_level)
 
     async with create_session(Exchange.BITFLYER) as session:
-        markets = await session.api.markets()
+        markets = await get_or_fetch(
+            ("bitflyer", "markets"),
+            list[Market],
+            session.api.markets,
+            ttl_seconds=cache_ttl,
+        )
         display_table(markets)
 
 
 def display_table(markets: list[Market]) -> None:
-    typer.echo("\n📊 bitFlyer Market List")
-    typer.echo("=" * 80)
-
-    for market in markets:
-        pc = str(market.product_code)
-        mt = market.market_type.value
-        typer.echo(f"{pc:<15} {mt:<10}")
-
-    typer.echo("=" * 80)
+    lines = ["\n📊 bitFlyer Market List", "=" * 80]
+    lines += [
+        f"{market.product_code:<15} {market.market_type.value:<10}"
+        for market in markets
+    ]
+    lines.append("=" * 80)
+
+    typer.echo("\n".join(lines))
 
 
 if __name__ == "__main__":
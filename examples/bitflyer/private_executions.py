@@ -19,7 +19,10 @@ Requires authentication as it uses the Private API.
 """
 
 import asyncio
+import contextlib
 import sys
+from collections.abc import AsyncIterator
+from decimal import Decimal
 from pathlib import Path
 from typing import Annotated
 
@@ -28,7 +31,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from zoneinfo import ZoneInfo
 
 import typer
-from common.helpers import get_key_and_secret, setup_logging
+from common.helpers import (
+    create_typer_app,
+    get_key_and_secret,
+    run_async,
+    setup_logging,
+)
+from common.token_bucket import TokenBucket
 from common.typer_custom_types import ZONE_INFO_TYPE
 from pydantic import SecretStr
 from rich.console import Console
@@ -40,14 +49,12 @@ from crypto_api_client.bitflyer import (
     Side,
 )
 
-# Unified settings for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,      # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False        # Show full traceback
-)
+app = create_typer_app()
 console = Console()
 
+# Number of executions shown without --verbose
+LIMITED_DISPLAY_COUNT = 3
+
 
 @app.command()
 def main(
@@ -81,7 +88,7 @@ def main(
         typer.Option(
             "--delay",
             min=0.0,
-            help="Delay between requests in seconds",
+            help="Minimum interval between request starts in seconds",
         ),
     ] = 0.2,
     zone: Annotated[
@@ -109,7 +116,7 @@ def main(
         ),
     ] = False,
 ) -> None:
-    asyncio.run(
+    run_async(
         async_main(pair, zone, total_count, batch_size, delay, log_level, verbose)
     )
 
@@ -127,57 +134,72 @@ async def async_main(
 
     api_key, api_secret = get_key_and_secret("bitflyer")
 
-    all_executions = await fetch_executions_with_paging(
+    # Pages are displayed as they arrive; only the executions shown without
+    # --verbose and the summary totals are kept
+    first_executions: list[PrivateExecution] = []
+    newest: PrivateExecution | None = None
+    oldest: PrivateExecution | None = None
+    total = buy_count = sell_count = no_side_count = 0
+    total_buy_size = total_sell_size = total_commission = Decimal(0)
+
+    async for executions in iter_executions_with_paging(
         pair, total_count, batch_size, delay, zone, api_key, api_secret
-    )
+    ):
+        if verbose:
+            for execution in executions:
+                typer.echo(execution.with_timezone(zone))
+        elif len(first_executions) < LIMITED_DISPLAY_COUNT:
+            first_executions.extend(
+                executions[: LIMITED_DISPLAY_COUNT - len(first_executions)]
+            )
 
-    if verbose:
-        for execution in all_executions:
-            converted = execution.with_timezone(zone)
-            typer.echo(converted)
-    else:
-        # Display only first 3
-        display_count = min(3, len(all_executions))
-        for i in range(display_count):
-            converted = all_executions[i].with_timezone(zone)
-            typer.echo(converted)
-
-        if len(all_executions) > 3:
-            omitted_count = len(all_executions) - 3
+        if newest is None:
+            newest = executions[0]
+        oldest = executions[-1]
+        total += len(executions)
+        for ex in executions:
+            if ex.side == Side.BUY:
+                buy_count += 1
+                total_buy_size += ex.size
+            elif ex.side == Side.SELL:
+                sell_count += 1
+                total_sell_size += ex.size
+            elif ex.side is None:
+                no_side_count += 1
+            total_commission += ex.commission
+
+    if not verbose:
+        for execution in first_executions:
+            typer.echo(execution.with_timezone(zone))
+
+        if total > len(first_executions):
+            omitted_count = total - len(first_executions)
             console.print(
                 f"\n[dim]... {omitted_count} more executions omitted. "
                 f"Use --verbose to show all.[/dim]"
             )
 
     console.print("📊 Summary:", style="bold green")
-    buy_count = sum(1 for ex in all_executions if ex.side == Side.BUY)
-    sell_count = sum(1 for ex in all_executions if ex.side == Side.SELL)
-    no_side_count = sum(1 for ex in all_executions if ex.side is None)
     console.print(
-        f"  [bold]Total:[/bold] {len(all_executions)} ([green]Buy: {buy_count}[/green] / [red]Sell: {sell_count}[/red]" +
+        f"  [bold]Total:[/bold] {total} ([green]Buy: {buy_count}[/green] / [red]Sell: {sell_count}[/red]" +
         (f" / [dim]No side: {no_side_count}[/dim]" if no_side_count > 0 else "") + ")"
     )
 
-    if all_executions:
-        oldest_display = all_executions[-1].with_timezone(zone).exec_date
-        newest_display = all_executions[0].with_timezone(zone).exec_date
-        zone_name = zone.key if hasattr(zone, "key") else str(zone)
+    if newest is not None and oldest is not None:
+        oldest_display = oldest.with_timezone(zone).exec_date
+        newest_display = newest.with_timezone(zone).exec_date
+        zone_name = zone.key
         console.print(
             f"  [bold]Period:[/bold] {oldest_display.strftime('%Y-%m-%d %H:%M:%S')} ~ {newest_display.strftime('%Y-%m-%d %H:%M:%S')} ({zone_name})"
         )
 
-        total_buy_size = sum(ex.size for ex in all_executions if ex.side == Side.BUY)
-        total_sell_size = sum(
-            ex.size for ex in all_executions if ex.side == Side.SELL
-        )
-        total_commission = sum(ex.commission for ex in all_executions)
         console.print(
             f"  [bold]Volume:[/bold] [green]Buy: {total_buy_size:.8f}[/green] / [red]Sell: {total_sell_size:.8f}[/red]"
         )
         console.print(f"  [bold]Total Commission:[/bold] {total_commission:.8f}")
 
 
-async def fetch_executions_with_paging(
+async def iter_executions_with_paging(
     product_code: str,
     total_count: int,
     batch_size: int,
@@ -185,81 +207,108 @@ async def fetch_executions_with_paging(
     zone: ZoneInfo | None,
     api_key: SecretStr,
     api_secret: SecretStr,
-) -> list[PrivateExecution]:
-    all_executions: list[PrivateExecution] = []
-    before_id: int | None = None
+) -> AsyncIterator[list[PrivateExecution]]:
+    """Fetch executions page by page, yielding each page as it arrives
+
+    :return: Async iterator of execution pages (newest first), up to total_count
+        executions
+    """
+    fetched_count = 0
     request_count = 0
 
     async with create_session(
         Exchange.BITFLYER, api_key=api_key, api_secret=api_secret
     ) as session:
-        while len(all_executions) < total_count:
-            remaining = total_count - len(all_executions)
-            count = min(batch_size, remaining)
+        # --delay is kept between request starts rather than after each
+        # response, so it overlaps with the previous round-trip
+        bucket = TokenBucket(rate=1 / delay) if delay > 0 else None
+
+        async def fetch_page(
+            count: int, before_id: int | None
+        ) -> list[PrivateExecution]:
+            if bucket is not None:
+                await bucket.acquire()
 
             request = PrivateExecutionsRequest(
                 product_code=product_code,
                 count=count,
                 before=before_id,
             )
+            return await session.api.private_executions(request)
 
-            request_count += 1
-            console.print(
-                f"[bold blue][Request {request_count}][/bold blue] "
-                f"Fetching {count} executions..."
-            )
+        count = min(batch_size, total_count)
+        page = asyncio.create_task(fetch_page(count, None))
 
-            executions = await session.api.private_executions(request)
+        try:
+            while True:
+                request_count += 1
+                console.print(
+                    f"[bold blue][Request {request_count}][/bold blue] "
+                    f"Fetching {count} executions..."
+                )
 
-            if not executions:
-                console.print("No more executions available.", style="dim yellow")
-                break
+                executions = await page
 
-            all_executions.extend(executions)
+                if not executions:
+                    console.print("No more executions available.", style="dim yellow")
+                    break
 
-            console.print(
-                f"  [green]→[/green] Fetched [bold]{len(executions)}[/bold] executions. "
-                f"Total: [bold cyan]{len(all_executions)}/{total_count}[/bold cyan]"
-            )
+                fetched_count += len(executions)
 
-            if executions:
-                newest = executions[0].exec_date
-                oldest = executions[-1].exec_date
-                if zone:
-                    newest_display = newest.astimezone(zone)
-                    oldest_display = oldest.astimezone(zone)
-                    zone_name = zone.key if hasattr(zone, "key") else str(zone)
-                    console.print(
-                        f"     [dim]Range:[/dim] {newest_display.strftime('%Y-%m-%d %H:%M:%S')} ~ "
-                        f"{oldest_display.strftime('%Y-%m-%d %H:%M:%S')} ({zone_name})",
-                        style="dim",
+                # The next page only needs this page's last ID, so request it now
+                # and display this page while it is in flight
+                next_count = min(batch_size, total_count - fetched_count)
+                if len(executions) >= count and next_count > 0:
+                    page = asyncio.create_task(
+                        fetch_page(next_count, executions[-1].id)
                     )
-                else:
-                    console.print(
-                        f"     [dim]Range:[/dim] {newest.strftime('%Y-%m-%d %H:%M:%S')} ~ "
-                        f"{oldest.strftime('%Y-%m-%d %H:%M:%S')} (UTC)",
-                        style="dim",
-                    )
-
-            if executions:
-                before_id = executions[-1].id
 
-            if len(executions) < count:
                 console.print(
-                    "Reached the end of available executions.", style="dim green"
+                    f"  [green]→[/green] Fetched [bold]{len(executions)}[/bold] executions. "
+                    f"Total: [bold cyan]{fetched_count}/{total_count}[/bold cyan]"
                 )
-                break
 
-            if len(all_executions) >= total_count:
-                console.print(
-                    f"[bold green]✓[/bold green] Reached target count: {total_count}"
-                )
-                break
-
-            if len(all_executions) < total_count:
-                await asyncio.sleep(delay)
+                if executions:
+                    newest = executions[0].exec_date
+                    oldest = executions[-1].exec_date
+                    if zone:
+                        newest_display = newest.astimezone(zone)
+                        oldest_display = oldest.astimezone(zone)
+                        zone_name = zone.key
+                        console.print(
+                            f"     [dim]Range:[/dim] {newest_display.strftime('%Y-%m-%d %H:%M:%S')} ~ "
+                            f"{oldest_display.strftime('%Y-%m-%d %H:%M:%S')} ({zone_name})",
+                            style="dim",
+                        )
+                    else:
+                        console.print(
+                            f"     [dim]Range:[/dim] {newest.strftime('%Y-%m-%d %H:%M:%S')} ~ "
+                            f"{oldest.strftime('%Y-%m-%d %H:%M:%S')} (UTC)",
+                            style="dim",
+                        )
+
+                yield executions
+
+                if len(executions) < count:
+                    console.print(
+                        "Reached the end of available executions.", style="dim green"
+                    )
+                    break
 
-    return all_executions[:total_count]
+                if fetched_count >= total_count:
+                    console.print(
+                        f"[bold green]✓[/bold green] Reached target count: {total_count}"
+                    )
+                    break
+
+                count = next_count
+        finally:
+            # Cancel a prefetch left in flight when the consumer stops early,
+            # so it neither outlives the session nor leaves an unretrieved error
+            if not page.done():
+                page.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await page
 
 
 if __name__ == "__main__":
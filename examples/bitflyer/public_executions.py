@@ -23,7 +23,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from zoneinfo import ZoneInfo
 
 import typer
-from common.helpers import setup_logging
+from common.helpers import create_typer_app, run_async, setup_logging
 from common.typer_custom_types import ZONE_INFO_TYPE
 from rich.console import Console
 
@@ -34,12 +34,7 @@ from crypto_api_client.bitflyer import (
     Side,
 )
 
-# Unified configuration for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,      # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False        # Show full traceback
-)
+app = create_typer_app()
 console = Console()
 
 
@@ -103,7 +98,7 @@ def main(
         ),
     ] = False,
 ) -> None:
-    asyncio.run(
+    run_async(
         async_main(pair, zone, total_count, batch_size, delay, log_level, verbose)
     )
 
@@ -151,7 +146,7 @@ async def async_main(
     )
     oldest_display = all_executions[-1].with_timezone(zone).exec_date
     newest_display = all_executions[0].with_timezone(zone).exec_date
-    zone_name = zone.key if hasattr(zone, "key") else str(zone)
+    zone_name = zone.key
     console.print(
         f"  [bold]Period:[/bold] {oldest_display.strftime('%Y-%m-%d %H:%M:%S')} ~ {newest_display.strftime('%Y-%m-%d %H:%M:%S')} ({zone_name})"
     )
@@ -213,7 +208,7 @@ async def fetch_executions_with_paging(
                 if zone:
                     newest_display = newest.astimezone(zone)
                     oldest_display = oldest.astimezone(zone)
-                    zone_name = zone.key if hasattr(zone, "key") else str(zone)
+                    zone_name = zone.key
                     console.print(
                         f"     [dim]Range:[/dim] {newest_display.strftime('%Y-%m-%d %H:%M:%S')} ~ "
                         f"{oldest_display.strftime('%Y-%m-%d %H:%M:%S')} ({zone_name})",
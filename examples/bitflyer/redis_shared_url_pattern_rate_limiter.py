@@ -23,7 +23,6 @@ Can share rate limit information across multiple processes.
     Can be specified via REDIS_HOST environment variable or --redis-host option.
 """
 
-import asyncio
 import re
 import sys
 from pathlib import Path
@@ -33,7 +32,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import redis.asyncio
 import typer
-from common.helpers import filter_callbacks_by_type, setup_logging
+from common.helpers import (
+    create_typer_app,
+    filter_callbacks_by_type,
+    run_async,
+    setup_logging,
+)
 from common.redis_client_factory import create_redis_client
 
 from crypto_api_client import Exchange, callbacks, create_session
@@ -45,12 +49,7 @@ from crypto_api_client.core.exchange_session import ExchangeSession
 from crypto_api_client.errors import RateLimitApproachingError
 from crypto_api_client.factories import create_response_validator
 
-# Unified settings for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -105,7 +104,7 @@ def main(
         ),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(
+    run_async(
         async_main(
             pair,
             window_seconds,
@@ -194,11 +193,15 @@ async def create_rate_limiters(
 
     response_validator = create_response_validator(Exchange.BITFLYER)
 
+    # One MGET before and one pipeline after each request for all three limiters,
+    # instead of a Redis round-trip per limiter
+    limiter_group = callbacks.RedisSharedUrlPatternRateLimiterGroup(
+        [general_limiter, ticker_limiter, markets_limiter]
+    )
+
     return (
         response_validator,
-        general_limiter,
-        ticker_limiter,
-        markets_limiter,
+        limiter_group,
     )
 
 
@@ -229,11 +232,11 @@ def display_limiter_status(
     limiters: list[callbacks.AbstractRequestCallback]
     | tuple[callbacks.AbstractRequestCallback, ...],
 ) -> None:
-    rate_limiters = filter_callbacks_by_type(
-        limiters, callbacks.RedisSharedUrlPatternRateLimiter
+    (limiter_group,) = filter_callbacks_by_type(
+        limiters, callbacks.RedisSharedUrlPatternRateLimiterGroup
     )
 
-    general_limiter, ticker_limiter, markets_limiter = rate_limiters
+    general_limiter, ticker_limiter, markets_limiter = limiter_group.limiters
     typer.echo("\n📊 Rate limiter status:")
     typer.echo(f"all    : {general_limiter}")
     typer.echo(f"ticker : {ticker_limiter}")
@@ -16,7 +16,6 @@ Dry-run mode allows operation verification without actually sending orders.
     Exercise caution when not using the --dry-run option.
 """
 
-import asyncio
 import os
 import sys
 from decimal import Decimal
@@ -26,13 +25,17 @@ from typing import Annotated
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import get_key_and_secret, setup_logging
+from common.helpers import (
+    create_typer_app,
+    get_key_and_secret,
+    run_async,
+    setup_logging,
+)
 from common.typer_custom_types import (
     POSITIVE_DECIMAL_TYPE,
     PRICE_DECIMAL_TYPE,
 )
 
-from crypto_api_client import Exchange, create_session
 from crypto_api_client.bitflyer import (
     ChildOrderType,
     SendChildOrderRequest,
@@ -40,12 +43,7 @@ from crypto_api_client.bitflyer import (
     TimeInForce,
 )
 
-# Unified settings for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -113,7 +111,7 @@ def main(
     ] = False,
 ) -> None:
     """Send a new order to bitFlyer asynchronously."""
-    asyncio.run(
+    run_async(
         async_main(
             product_code,
             child_order_type,
@@ -139,13 +137,16 @@ async def async_main(
     log_level: str,
     dry_run: bool,
 ) -> None:
+    from crypto_api_client import Exchange, create_session
+
     setup_logging(log_level)
 
     # Workaround:
     # launch.json args cannot expand environment variables,
     # so explicitly get environment variable here for convenience during development
-    if price is None and os.environ.get("PRICE"):
-        price = Decimal(os.environ["PRICE"])
+    env_price = os.environ.get("PRICE")
+    if price is None and env_price:
+        price = Decimal(env_price)
 
     # Price is required for LIMIT orders
     if child_order_type == ChildOrderType.LIMIT and not price:
@@ -174,8 +175,9 @@ async def async_main(
     typer.echo(f"Side: {side.value}")
     typer.echo(f"Size: {size} BTC")
     if price:
-        typer.echo(f"Price: ¥{int(price):,}")
-        typer.echo(f"Estimated amount: ¥{int(price * size):,}")
+        # Show exact Decimal values (the price as sent), neither rounded nor truncated
+        typer.echo(f"Price: ¥{price:,}")
+        typer.echo(f"Estimated amount: ¥{price * size:,}")
     else:
         typer.echo("Price: Market")
     if minute_to_expire:
@@ -8,32 +8,31 @@
 
     # Fetch ticker information for ETH/JPY pair (debug mode)
     uv run python examples/bitflyer/ticker.py --pair ETH_JPY --zone Asia/Tokyo --log-level DEBUG
+
+    # Reuse the previous response for up to 2 seconds (e.g., frequent refreshes)
+    uv run python examples/bitflyer/ticker.py --pair BTC_JPY --cache-ttl 2
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from zoneinfo import ZoneInfo
 
 import typer
-from common.display import BUY_COLOR, LABEL_WIDTH, SELL_COLOR
-from common.helpers import setup_logging
+from common.display import BUY_COLOR, LABEL_WIDTH, SELL_COLOR, get_console
+from common.helpers import create_typer_app, run_async, setup_logging
+from common.response_cache import get_or_fetch
 from common.typer_custom_types import ZONE_INFO_TYPE
-from rich import print
 
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.bitflyer import TickerRequest
-from crypto_api_client.bitflyer.native_domain_models import Ticker
+if TYPE_CHECKING:
+    from crypto_api_client.bitflyer.native_domain_models import Ticker
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -55,50 +54,66 @@ def main(
         str,
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
+    cache_ttl: Annotated[
+        float,
+        typer.Option(
+            "--cache-ttl",
+            help="Seconds to reuse the previous response (0 disables the cache)",
+        ),
+    ] = 0.0,
 ) -> None:
-    asyncio.run(async_main(pair, zone_info, log_level))
+    run_async(async_main(pair, zone_info, log_level, cache_ttl))
 
 
-async def async_main(pair: str, zone_info: ZoneInfo, log_level: str) -> None:
+async def async_main(
+    pair: str, zone_info: ZoneInfo, log_level: str, cache_ttl: float
+) -> None:
+    from crypto_api_client import Exchange, create_session
+    from crypto_api_client.bitflyer import TickerRequest
+    from crypto_api_client.bitflyer.native_domain_models import Ticker
+
     setup_logging(log_level)
 
     async with create_session(Exchange.BITFLYER) as session:
-        ticker = await session.api.ticker(TickerRequest(product_code=pair))
+        ticker = await get_or_fetch(
+            ("bitflyer", "ticker", pair),
+            Ticker,
+            lambda: session.api.ticker(TickerRequest(product_code=pair)),
+            ttl_seconds=cache_ttl,
+        )
 
         display_ticker(ticker, zone_info)
 
 
 def display_ticker(ticker: Ticker, zone_info: ZoneInfo) -> None:
-    # Basic information
-    typer.echo(f"{'product code':<{LABEL_WIDTH}}: {str(ticker.product_code)}")
-    print(f"[{SELL_COLOR}]{'ask price':<{LABEL_WIDTH}}: {ticker.best_ask:,.0f}[/]")
-    print(f"[{BUY_COLOR}]{'bid price':<{LABEL_WIDTH}}: {ticker.best_bid:,.0f}[/]")
+    from rich.markup import escape
 
     spread = ticker.best_ask - ticker.best_bid
     spread_pct = (spread / ticker.best_bid) * 100 if ticker.best_bid != 0 else 0
-    typer.echo(f"{'spread':<{LABEL_WIDTH}}: {spread:,.0f} ({spread_pct:.3f}%)")
-
-    typer.echo(f"{'last price':<{LABEL_WIDTH}}: {ticker.ltp:,.0f}")
-    typer.echo(f"{'volume':<{LABEL_WIDTH}}: {ticker.volume:,.6f}")
-
-    # Exchange-specific fields
-    typer.echo(f"{'volume by product':<{LABEL_WIDTH}}: {ticker.volume_by_product:,.6f}")
-    print(
-        f"[{BUY_COLOR}]{'best bid size':<{LABEL_WIDTH}}: {ticker.best_bid_size:,.6f}[/]"
-    )
-    print(
-        f"[{SELL_COLOR}]{'best ask size':<{LABEL_WIDTH}}: {ticker.best_ask_size:,.6f}[/]"
-    )
-    print(
-        f"[{BUY_COLOR}]{'total bid depth':<{LABEL_WIDTH}}: {ticker.total_bid_depth:,.6f}[/]"
-    )
-    print(
-        f"[{SELL_COLOR}]{'total ask depth':<{LABEL_WIDTH}}: {ticker.total_ask_depth:,.6f}[/]"
-    )
-    typer.echo(f"{'state':<{LABEL_WIDTH}}: {ticker.state}")
-    typer.echo(
-        f"{'timestamp':<{LABEL_WIDTH}}: {ticker.timestamp.astimezone(zone_info)}\n"
-    )
+
+    # Build the whole block and emit it with one markup parse and one write
+    lines = [
+        # Basic information
+        f"{'product code':<{LABEL_WIDTH}}: {escape(ticker.product_code)}",
+        f"[{SELL_COLOR}]{'ask price':<{LABEL_WIDTH}}: {ticker.best_ask:,.0f}[/]",
+        f"[{BUY_COLOR}]{'bid price':<{LABEL_WIDTH}}: {ticker.best_bid:,.0f}[/]",
+        f"{'spread':<{LABEL_WIDTH}}: {spread:,.0f} ({spread_pct:.3f}%)",
+        f"{'last price':<{LABEL_WIDTH}}: {ticker.ltp:,.0f}",
+        f"{'volume':<{LABEL_WIDTH}}: {ticker.volume:,.6f}",
+        # Exchange-specific fields
+        f"{'volume by product':<{LABEL_WIDTH}}: {ticker.volume_by_product:,.6f}",
+        f"[{BUY_COLOR}]{'best bid size':<{LABEL_WIDTH}}: "
+        f"{ticker.best_bid_size:,.6f}[/]",
+        f"[{SELL_COLOR}]{'best ask size':<{LABEL_WIDTH}}: "
+        f"{ticker.best_ask_size:,.6f}[/]",
+        f"[{BUY_COLOR}]{'total bid depth':<{LABEL_WIDTH}}: "
+        f"{ticker.total_bid_depth:,.6f}[/]",
+        f"[{SELL_COLOR}]{'total ask depth':<{LABEL_WIDTH}}: "
+        f"{ticker.total_ask_depth:,.6f}[/]",
+        f"{'state':<{LABEL_WIDTH}}: {ticker.state}",
+        f"{'timestamp':<{LABEL_WIDTH}}: {ticker.timestamp.astimezone(zone_info)}\n",
+    ]
+    get_console().print("\n".join(lines), highlight=False)
 
 
 if __name__ == "__main__":
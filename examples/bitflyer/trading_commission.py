@@ -13,8 +13,6 @@ Displays the commission rate according to the account's trading level.
     uv run python examples/bitflyer/trading_commission.py --pair ETH_JPY
 """
 
-import asyncio
-import os
 import sys
 from pathlib import Path
 from typing import Annotated
@@ -22,19 +20,14 @@ from typing import Annotated
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import setup_logging
-
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.bitflyer import (
-    TradingCommissionRequest,
+from common.helpers import (
+    create_typer_app,
+    get_key_and_secret,
+    run_async,
+    setup_logging,
 )
 
-# Unified settings for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -51,27 +44,21 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(pair, log_level))
+    run_async(async_main(pair, log_level))
 
 
 async def async_main(pair: str, log_level: str) -> None:
-    setup_logging(log_level)
+    from crypto_api_client import Exchange, create_session
+    from crypto_api_client.bitflyer import TradingCommissionRequest
 
-    api_key = os.getenv("BITFLYER_API_KEY")
-    api_secret = os.getenv("BITFLYER_API_SECRET")
+    setup_logging(log_level)
 
-    if not api_key or not api_secret:
-        typer.echo("Error: API credentials not found in environment variables")
-        typer.echo("Please set BITFLYER_API_KEY and BITFLYER_API_SECRET")
-        raise typer.Exit(1)
+    api_key, api_secret = get_key_and_secret("bitflyer")
 
     request = TradingCommissionRequest(product_code=pair)
 
-    # At this point, api_key and api_secret are guaranteed to be non-None
     async with create_session(
-        Exchange.BITFLYER,
-        api_key=api_key,  # type: ignore[arg-type]
-        api_secret=api_secret,  # type: ignore[arg-type]
+        Exchange.BITFLYER, api_key=api_key, api_secret=api_secret
     ) as session:
         commission = await session.api.gettradingcommission(request)
 
@@ -11,30 +11,30 @@
     Set COINCHECK_API_KEY and COINCHECK_API_SECRET as environment variables.
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import get_key_and_secret, setup_logging
-from rich.console import Console
-from rich.table import Table
-
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.coincheck.exchange_api_client import (
-    ExchangeApiClient as CoincheckApiClient,
+from common.display import format_amount, get_console
+from common.helpers import (
+    create_typer_app,
+    get_key_and_secret,
+    run_async,
+    setup_logging,
 )
-from crypto_api_client.core.exchange_session import ExchangeSession
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
-console = Console()
+if TYPE_CHECKING:
+    from crypto_api_client.coincheck.exchange_api_client import (
+        ExchangeApiClient as CoincheckApiClient,
+    )
+    from crypto_api_client.core.exchange_session import ExchangeSession
+
+app = create_typer_app()
 
 
 @app.command()
@@ -44,10 +44,12 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(log_level))
+    run_async(async_main(log_level))
 
 
 async def async_main(log_level: str) -> None:
+    from crypto_api_client import Exchange, create_session
+
     setup_logging(log_level)
 
     api_key, api_secret = get_key_and_secret("coincheck")
@@ -61,6 +63,11 @@ async def async_main(log_level: str) -> None:
 async def fetch_and_display_balances(
     session: ExchangeSession[CoincheckApiClient],
 ) -> None:
+    from rich.table import Table
+
+    from crypto_api_client import Exchange
+
+    console = get_console()
     balances = await session.api.balance()
 
     if not balances:
@@ -76,23 +83,22 @@ async def fetch_and_display_balances(
     table.add_column("Lendable", justify="right", style="blue")
     table.add_column("Lending", justify="right", style="magenta")
 
-    for balance in balances:
-        if any(
-            val > 0
-            for val in [
-                balance.available,
-                balance.reserved,
-                balance.lending,
-                balance.lend_in_use,
-            ]
-        ):
-            table.add_row(
-                balance.currency.upper(),
-                f"{balance.available:,.8f}".rstrip("0").rstrip("."),
-                f"{balance.reserved:,.8f}".rstrip("0").rstrip("."),
-                f"{balance.lending:,.8f}".rstrip("0").rstrip("."),
-                f"{balance.lend_in_use:,.8f}".rstrip("0").rstrip("."),
-            )
+    rows = [
+        (
+            balance.currency.upper(),
+            format_amount(balance.available),
+            format_amount(balance.reserved),
+            format_amount(balance.lending),
+            format_amount(balance.lend_in_use),
+        )
+        for balance in balances
+        if balance.available > 0
+        or balance.reserved > 0
+        or balance.lending > 0
+        or balance.lend_in_use > 0
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
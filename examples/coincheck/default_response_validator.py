@@ -18,6 +18,9 @@ for invalid currency pairs, we test with authentication errors that return JSON
     # Propagate errors as-is (typer traceback display)
     uv run python examples/coincheck/default_response_validator.py --demo callbacks
 
+    # Run both demos concurrently
+    uv run python examples/coincheck/default_response_validator.py --demo both
+
 .. note::
 
     If you want to customize error handling (custom logging, conversion to
@@ -39,18 +42,19 @@ from typing import Annotated
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import setup_logging
+from common.display import create_recording_console, replay_console
+from common.helpers import (
+    create_typer_app,
+    get_response_validator,
+    run_async,
+    setup_logging,
+)
 from rich.console import Console
 
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.errors.exceptions import ExchangeApiError
-from crypto_api_client.factories import create_response_validator
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = create_typer_app()
 console = Console()
 
 
@@ -60,7 +64,8 @@ def main(
         str,
         typer.Option(
             "--demo",
-            help="Demo type: exception (exception handling), callbacks (callback)",
+            help="Demo type: exception (exception handling), callbacks (callback), "
+            "both (run both concurrently)",
         ),
     ] = "exception",
     log_level: Annotated[
@@ -68,7 +73,7 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(demo, log_level))
+    run_async(async_main(demo, log_level))
 
 
 async def async_main(demo: str, log_level: str) -> None:
@@ -83,17 +88,33 @@ async def async_main(demo: str, log_level: str) -> None:
         await demonstrate_exception_display()
     elif demo == "callbacks":
         await demonstrate_callbacks()
-
-
-async def demonstrate_exception_display() -> None:
-    console.print("\n[bold cyan]Private API + default response validator[/bold cyan]")
-    console.print("   Fetch balance with invalid API key and catch ExchangeApiError for display\n")
-
-    validator = create_response_validator(Exchange.COINCHECK)
-
-    console.print(f"   📍 Validator type: {type(validator).__name__}")
-    console.print("   🔑 API Key: invalid_api_key (dummy)")
-    console.print("   🔐 API Secret: invalid_api_secret (dummy)\n")
+    elif demo == "both":
+        # The demos are independent round-trips, so run them concurrently. Each
+        # one writes to its own recording console, replayed in order once both
+        # have finished so their output does not interleave. The callbacks demo's
+        # error is re-raised only after that
+        outputs = (create_recording_console(), create_recording_console())
+        results = await asyncio.gather(
+            demonstrate_exception_display(outputs[0]),
+            demonstrate_callbacks(outputs[1]),
+            return_exceptions=True,
+        )
+        for out in outputs:
+            replay_console(out, console)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+
+async def demonstrate_exception_display(out: Console = console) -> None:
+    out.print("\n[bold cyan]Private API + default response validator[/bold cyan]")
+    out.print("   Fetch balance with invalid API key and catch ExchangeApiError for display\n")
+
+    validator = get_response_validator(Exchange.COINCHECK)
+
+    out.print(f"   📍 Validator type: {type(validator).__name__}")
+    out.print("   🔑 API Key: invalid_api_key (dummy)")
+    out.print("   🔐 API Secret: invalid_api_secret (dummy)\n")
 
     try:
         # Register validator as callback
@@ -107,18 +128,18 @@ async def demonstrate_exception_display() -> None:
             # Skip processing on success
 
     except ExchangeApiError as e:
-        console.print(f"   ❌ [red]error description: {e.error_description}[/red]")
-        console.print(f"      [red]http status code: {e.http_status_code}[/red]")
-        console.print(f"      [red]api status code 1: {e.api_status_code_1}[/red]")
-        console.print(f"      [red]api error message 1: {e.api_error_message_1}[/red]")
-        console.print(f"      [red]response body: {e.response_body}[/red]")
+        out.print(f"   ❌ [red]error description: {e.error_description}[/red]")
+        out.print(f"      [red]http status code: {e.http_status_code}[/red]")
+        out.print(f"      [red]api status code 1: {e.api_status_code_1}[/red]")
+        out.print(f"      [red]api error message 1: {e.api_error_message_1}[/red]")
+        out.print(f"      [red]response body: {e.response_body}[/red]")
 
 
-async def demonstrate_callbacks() -> None:
-    console.print("\n[bold cyan]Private API + default response validator[/bold cyan]")
-    console.print("   Intentionally fail authentication on API that requires authentication and verify validator behavior\n")
+async def demonstrate_callbacks(out: Console = console) -> None:
+    out.print("\n[bold cyan]Private API + default response validator[/bold cyan]")
+    out.print("   Intentionally fail authentication on API that requires authentication and verify validator behavior\n")
 
-    validator = create_response_validator(Exchange.COINCHECK)
+    validator = get_response_validator(Exchange.COINCHECK)
 
     async with create_session(
         Exchange.COINCHECK,
@@ -8,29 +8,29 @@
 
     # Fetch order book for XRP/JPY
     uv run python examples/coincheck/order_book.py --pair xrp_jpy --price-band 0.1 --rows 5
+
+    # Reuse the previous response for up to 1 second (e.g., frequent refreshes)
+    uv run python examples/coincheck/order_book.py --pair btc_jpy --price-band 100000 --cache-ttl 1
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
 from decimal import Decimal
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import format_price, setup_logging
-from common.order_book_display import display_order_book_table_with_bands
+from common.helpers import create_typer_app, format_price, run_async, setup_logging
+from common.response_cache import get_or_fetch
 from common.typer_custom_types import POSITIVE_DECIMAL_TYPE
 
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.coincheck import OrderBook, OrderBookRequest
+if TYPE_CHECKING:
+    from crypto_api_client.coincheck import OrderBook, OrderBookRequest
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -61,13 +61,21 @@ def main(
         str,
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
+    cache_ttl: Annotated[
+        float,
+        typer.Option(
+            "--cache-ttl",
+            help="Seconds to reuse the previous response (0 disables the cache)",
+        ),
+    ] = 0.0,
 ) -> None:
-    asyncio.run(
+    run_async(
         async_main(
             price_band,
             pair,
             rows,
             log_level,
+            cache_ttl,
         )
     )
 
@@ -77,13 +85,22 @@ async def async_main(
     pair: str,
     rows: int,
     log_level: str,
+    cache_ttl: float,
 ) -> None:
+    from crypto_api_client import Exchange, create_session
+    from crypto_api_client.coincheck import OrderBook, OrderBookRequest
+
     setup_logging(log_level)
 
     request = OrderBookRequest(pair=pair)
 
     async with create_session(Exchange.COINCHECK) as session:
-        order_book = await session.api.order_book(request)
+        order_book = await get_or_fetch(
+            ("coincheck", "order_book", pair),
+            OrderBook,
+            lambda: session.api.order_book(request),
+            ttl_seconds=cache_ttl,
+        )
 
     display_order_book(order_book, request, rows, price_band)
 
@@ -94,6 +111,8 @@ def display_order_book(
     rows: int,
     price_band: Decimal,
 ) -> None:
+    from common.order_book_display import display_order_book_table_with_bands
+
     # Format price_band value according to precision (e.g., 1000 → "1,000", 0.1 → "0.1")
     price_band_str = format_price(price_band, align_to=price_band)
 
@@ -5,33 +5,31 @@
 
     # Fetch ticker information for BTC/JPY pair
     uv run python examples/coincheck/ticker.py --pair btc_jpy --zone Asia/Tokyo
+
+    # Reuse the previous response for up to 2 seconds (e.g., frequent refreshes)
+    uv run python examples/coincheck/ticker.py --pair btc_jpy --cache-ttl 2
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
 from pathlib import Path
-from typing import Annotated
-
-from rich import print
+from typing import TYPE_CHECKING, Annotated, Any
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from zoneinfo import ZoneInfo
 
 import typer
-from common.display import BUY_COLOR, LABEL_WIDTH, SELL_COLOR
-from common.helpers import setup_logging
+from common.display import BUY_COLOR, LABEL_WIDTH, SELL_COLOR, get_console
+from common.helpers import create_typer_app, run_async, setup_logging
+from common.response_cache import get_or_fetch
 from common.typer_custom_types import ZONE_INFO_TYPE
 
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.coincheck import TickerRequest
-from crypto_api_client.coincheck.native_domain_models import Ticker
+if TYPE_CHECKING:
+    from crypto_api_client.coincheck.native_domain_models import Ticker
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -53,44 +51,80 @@ def main(
         str,
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
+    cache_ttl: Annotated[
+        float,
+        typer.Option(
+            "--cache-ttl",
+            help="Seconds to reuse the previous response (0 disables the cache)",
+        ),
+    ] = 0.0,
 ) -> None:
-    asyncio.run(async_main(pair, zone_info, log_level))
+    run_async(async_main(pair, zone_info, log_level, cache_ttl))
 
 
-async def async_main(pair: str, zone_info: ZoneInfo, log_level: str) -> None:
+async def async_main(
+    pair: str, zone_info: ZoneInfo, log_level: str, cache_ttl: float
+) -> None:
+    from crypto_api_client import Exchange, create_session
+    from crypto_api_client.coincheck import TickerRequest
+
     setup_logging(log_level)
 
     async with create_session(Exchange.COINCHECK) as session:
-        ticker = await session.api.ticker(TickerRequest(pair=pair))
+        ticker = await get_or_fetch(
+            ("coincheck", "ticker", pair),
+            cached_ticker_type(),
+            lambda: session.api.ticker(TickerRequest(pair=pair)),
+            ttl_seconds=cache_ttl,
+        )
 
         display_ticker(ticker, pair, zone_info)
 
 
-def display_ticker(ticker: Ticker, pair: str, zone_info: ZoneInfo) -> None:
-    # Basic information
-    typer.echo(f"{'pair':<{LABEL_WIDTH}}: {pair}")
-    print(f"[{SELL_COLOR}]{'ask':<{LABEL_WIDTH}}: {ticker.ask:,.0f}[/]")
-    print(f"[{BUY_COLOR}]{'bid':<{LABEL_WIDTH}}: {ticker.bid:,.0f}[/]")
+def cached_ticker_type() -> Any:
+    """Return Ticker type whose cache entry keeps the timestamp in Unix seconds
 
-    spread = ticker.ask - ticker.bid
-    spread_pct = (spread / ticker.bid) * 100 if ticker.bid != 0 else 0
-    typer.echo(f"{'spread':<{LABEL_WIDTH}}: {spread:,.0f} ({spread_pct:.3f}%)")
+    The Ticker model only accepts the Unix seconds Coincheck sends, not the
+    ISO 8601 string of a JSON mode dump, so the cached timestamp is written back
+    in the API's own format.
+    """
+    from pydantic import PlainSerializer
+
+    from crypto_api_client.coincheck.native_domain_models import Ticker
+
+    def serialize(ticker: Ticker) -> dict[str, Any]:
+        data = ticker.model_dump(mode="json")
+        data["timestamp"] = int(ticker.timestamp.timestamp())
+        return data
+
+    return Annotated[Ticker, PlainSerializer(serialize)]
 
-    typer.echo(f"{'last':<{LABEL_WIDTH}}: {ticker.last:,.0f}")
-    typer.echo(f"{'volume':<{LABEL_WIDTH}}: {ticker.volume:,.4f}")
 
-    # Exchange-specific fields
-    print(f"[{SELL_COLOR}]{'high':<{LABEL_WIDTH}}: {ticker.high:,.0f}[/]")
-    print(f"[{BUY_COLOR}]{'low':<{LABEL_WIDTH}}: {ticker.low:,.0f}[/]")
-    typer.echo(
-        f"{'timestamp':<{LABEL_WIDTH}}: {ticker.timestamp.astimezone(zone_info)}"
-    )
+def display_ticker(ticker: Ticker, pair: str, zone_info: ZoneInfo) -> None:
+    from rich.markup import escape
 
+    spread = ticker.ask - ticker.bid
+    spread_pct = (spread / ticker.bid) * 100 if ticker.bid != 0 else 0
     price_range = ticker.high - ticker.low
     price_range_pct = (price_range / ticker.low) * 100 if ticker.low != 0 else 0
-    typer.echo(
-        f"{'price range':<{LABEL_WIDTH}}: {price_range:,.0f} ({price_range_pct:.2f}%)\n"
-    )
+
+    # Build the whole block and emit it with one markup parse and one write
+    lines = [
+        # Basic information
+        f"{'pair':<{LABEL_WIDTH}}: {escape(pair)}",
+        f"[{SELL_COLOR}]{'ask':<{LABEL_WIDTH}}: {ticker.ask:,.0f}[/]",
+        f"[{BUY_COLOR}]{'bid':<{LABEL_WIDTH}}: {ticker.bid:,.0f}[/]",
+        f"{'spread':<{LABEL_WIDTH}}: {spread:,.0f} ({spread_pct:.3f}%)",
+        f"{'last':<{LABEL_WIDTH}}: {ticker.last:,.0f}",
+        f"{'volume':<{LABEL_WIDTH}}: {ticker.volume:,.4f}",
+        # Exchange-specific fields
+        f"[{SELL_COLOR}]{'high':<{LABEL_WIDTH}}: {ticker.high:,.0f}[/]",
+        f"[{BUY_COLOR}]{'low':<{LABEL_WIDTH}}: {ticker.low:,.0f}[/]",
+        f"{'timestamp':<{LABEL_WIDTH}}: {ticker.timestamp.astimezone(zone_info)}",
+        f"{'price range':<{LABEL_WIDTH}}: "
+        f"{price_range:,.0f} ({price_range_pct:.2f}%)\n",
+    ]
+    get_console().print("\n".join(lines), highlight=False)
 
 
 if __name__ == "__main__":
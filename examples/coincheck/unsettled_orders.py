@@ -13,29 +13,29 @@ Fetches the list of unsettled orders for a specified trading pair.
     Set COINCHECK_API_KEY and COINCHECK_API_SECRET as environment variables.
 """
 
-import asyncio
+from __future__ import annotations
+
 import sys
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 from zoneinfo import ZoneInfo
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
-from common.helpers import get_key_and_secret, setup_logging
+from common.display import format_amount, get_console
+from common.helpers import (
+    create_typer_app,
+    get_key_and_secret,
+    run_async,
+    setup_logging,
+)
 from common.typer_custom_types import ZONE_INFO_TYPE
-from rich.console import Console
-from rich.table import Table
 
-from crypto_api_client import Exchange, create_session
-from crypto_api_client.coincheck import Order, OrderType
+if TYPE_CHECKING:
+    from crypto_api_client.coincheck import Order
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
-console = Console()
+app = create_typer_app()
 
 
 @app.command()
@@ -51,11 +51,14 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(zone_info, log_level))
+    run_async(async_main(zone_info, log_level))
 
 
 async def async_main(zone_info: ZoneInfo, log_level: str) -> None:
+    from crypto_api_client import Exchange, create_session
+
     setup_logging(log_level)
+    console = get_console()
 
     api_key, api_secret = get_key_and_secret("COINCHECK")
 
@@ -70,6 +73,11 @@ async def async_main(zone_info: ZoneInfo, log_level: str) -> None:
 
 
 def display_orders(orders: list[Order], tz: ZoneInfo) -> None:
+    from rich.table import Table
+
+    from crypto_api_client.coincheck import OrderType
+
+    console = get_console()
     if not orders:
         console.print("[yellow]No unsettled orders[/yellow]")
         return
@@ -88,9 +96,15 @@ def display_orders(orders: list[Order], tz: ZoneInfo) -> None:
     table.add_column("Pending", justify="right", width=12)
     table.add_column("Created At", width=20)
 
+    buy_count = 0
+    sell_count = 0
     for order in orders:
-        order_with_tz = order.with_timezone(tz)
-        type_color = "green" if order.order_type == OrderType.BUY else "red"
+        if order.order_type == OrderType.BUY:
+            type_color = "green"
+            buy_count += 1
+        else:
+            type_color = "red"
+            sell_count += 1
         rate_str = f"{order.rate:,.0f}" if order.rate else "MARKET"
 
         table.add_row(
@@ -98,15 +112,13 @@ def display_orders(orders: list[Order], tz: ZoneInfo) -> None:
             order.pair.upper(),
             f"[{type_color}]{order.order_type.value.upper()}[/{type_color}]",
             rate_str,
-            f"{order.pending_amount:,.8f}".rstrip("0").rstrip("."),
-            order_with_tz.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+            format_amount(order.pending_amount),
+            # Convert only the displayed date instead of copying the whole order
+            order.created_at.astimezone(tz).strftime("%Y-%m-%d %H:%M:%S"),
         )
 
     console.print(table)
 
-    buy_count = sum(1 for o in orders if o.order_type == OrderType.BUY)
-    sell_count = sum(1 for o in orders if o.order_type == OrderType.SELL)
-
     console.print("\n📊 Summary:")
     console.print(f"  [bold]Total:[/bold] {len(orders)} orders")
     console.print(
@@ -1,8 +1,71 @@
 """Common constants for display formatting."""
 
+from __future__ import annotations
+
+import functools
+import io
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
 # Display format settings
 LABEL_WIDTH = 18  # Unified width for label display
 
 # Color definitions
 SELL_COLOR = "#f7694d"  # For ask/sell price display (orange-red)
 BUY_COLOR = "#fbbd2a"  # For bid/buy price display (yellow-orange)
+
+
+@functools.cache
+def get_console() -> Console:
+    """Return the shared Rich console, importing Rich on first use
+
+    Deferring the import keeps ``--help`` and shell completion fast.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def create_recording_console(width: int | None = None) -> Console:
+    """Create a console that buffers its output instead of writing it
+
+    Give each concurrently running task its own recording console, then print
+    the buffers one after another with :func:`replay_console` so that the
+    tasks' output does not interleave.
+
+    :param width: Console width (the shared console's width if None)
+    :return: Recording console
+    """
+    from rich.console import Console
+
+    return Console(
+        record=True,
+        file=io.StringIO(),
+        width=width if width is not None else get_console().width,
+    )
+
+
+def replay_console(recorded: Console, target: Console | None = None) -> None:
+    """Print the buffered output of a recording console, keeping its styles
+
+    :param recorded: Console created with :func:`create_recording_console`
+    :param target: Console to print to (the shared console if None)
+    """
+    from rich.text import Text
+
+    target = target if target is not None else get_console()
+    target.print(Text.from_ansi(recorded.export_text(styles=True)), end="")
+
+
+def format_amount(amount: Decimal) -> str:
+    """Format amount with thousands separators and up to 8 decimals
+
+    Trailing zeros (and a trailing decimal point) are removed.
+
+    :param amount: Amount to format
+    :return: Formatted string (e.g., ``1,234.5``)
+    """
+    return f"{amount:,.8f}".rstrip("0").rstrip(".")
@@ -1,22 +1,89 @@
-"""Utility functions used only in examples/*.py"""
+"""Utility functions used only in examples/*.py
 
+Library, Pydantic and dotenv imports are deferred to the functions that need them,
+so that importing this module does not slow down ``--help`` of the examples.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
 import logging
 import os
-from collections.abc import Sequence
+from collections.abc import Coroutine, Sequence
 from decimal import Decimal
-from typing import Type, TypeVar
+from typing import TYPE_CHECKING, Any, Type, TypeVar
 
 import typer
-from dotenv import load_dotenv
-from pydantic import SecretStr
 
-from crypto_api_client.bitflyer.native_domain_models import (
-    BoardStateType,
-    HealthStatusType,
-)
-from crypto_api_client.callbacks import AbstractRequestCallback
+if TYPE_CHECKING:
+    from pydantic import SecretStr
+
+    from crypto_api_client import Exchange
+    from crypto_api_client.bitflyer.native_domain_models import (
+        BoardStateType,
+        HealthStatusType,
+    )
+    from crypto_api_client.callbacks import AbstractRequestCallback
+
+T = TypeVar("T", bound="AbstractRequestCallback")
+R = TypeVar("R")
+
+# Set CRYPTO_API_DEBUG=1 to show local variables and full tracebacks on errors
+DEBUG = os.environ.get("CRYPTO_API_DEBUG") == "1"
+
+
+def create_typer_app() -> typer.Typer:
+    """Create Typer app with Rich tracebacks configured for the environment
+
+    Capturing local variables makes every traceback repr each frame's locals
+    (including large response models), so it is only enabled when
+    the ``CRYPTO_API_DEBUG=1`` environment variable is set.
 
-T = TypeVar("T", bound=AbstractRequestCallback)
+    :return: Typer app
+
+    .. code-block:: console
+
+        # Show local variables and full traceback on errors
+        CRYPTO_API_DEBUG=1 uv run python examples/binance/depth.py --pair BTCUSDT --price-band 100
+    """
+    return typer.Typer(
+        pretty_exceptions_enable=True,
+        pretty_exceptions_show_locals=DEBUG,
+        pretty_exceptions_short=not DEBUG,
+    )
+
+
+def run_async(main: Coroutine[Any, Any, R]) -> R:
+    """Run coroutine on uvloop if installed, otherwise on the default asyncio loop
+
+    uvloop is an optional dependency of the ``examples`` extra (POSIX only).
+
+    :param main: Coroutine to run (e.g., ``async_main(...)``)
+    :return: Return value of the coroutine
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    return uvloop.run(main)
+
+
+@functools.cache
+def get_response_validator(exchange: Exchange) -> AbstractRequestCallback:
+    """Get the default :term:`response validator` for the exchange, created once
+
+    Response validators hold no per-request state, so one instance per exchange
+    from :func:`~crypto_api_client.factories.create_response_validator` is shared
+    by every session in the process.
+
+    :param exchange: Exchange identifier
+    :return: Exchange-specific response validator
+    """
+    from crypto_api_client.factories import create_response_validator
+
+    return create_response_validator(exchange)
 
 
 def filter_callbacks_by_type(
@@ -48,6 +115,14 @@ def filter_callbacks_by_type(
     return tuple(cb for cb in callbacks if isinstance(cb, callback_type))
 
 
+@functools.cache
+def _load_dotenv() -> None:
+    """Load ``.env`` into the environment once per process"""
+    from dotenv import load_dotenv
+
+    load_dotenv(verbose=True)
+
+
 def get_key_and_secret(exchange_name: str) -> tuple[SecretStr, SecretStr]:
     """Get API key and secret from environment variables for specified exchange
 
@@ -56,9 +131,11 @@ def get_key_and_secret(exchange_name: str) -> tuple[SecretStr, SecretStr]:
     :return: Tuple of (API key, API secret) as SecretStr
     :rtype: tuple[SecretStr, SecretStr]
     """
+    from pydantic import SecretStr
+
     exchange_name = exchange_name.upper()
 
-    load_dotenv(verbose=True)
+    _load_dotenv()
 
     api_key = os.environ.get(f"{exchange_name}_API_KEY")
     api_secret = os.environ.get(f"{exchange_name}_API_SECRET")
@@ -95,6 +172,8 @@ def get_health_status_emoji(status: HealthStatusType | str) -> str:
     :param status: HealthStatusType or status string
     :return: Corresponding emoji
     """
+    from crypto_api_client.bitflyer.native_domain_models import HealthStatusType
+
     if isinstance(status, str):
         # For string input, try converting to HealthStatusType
         try:
@@ -125,6 +204,8 @@ def get_board_state_emoji(state: BoardStateType | str) -> str:
     :param state: BoardStateType or status string
     :return: Corresponding emoji
     """
+    from crypto_api_client.bitflyer.native_domain_models import BoardStateType
+
     if isinstance(state, str):
         # For string input, try converting to BoardStateType
         try:
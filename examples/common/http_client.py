@@ -0,0 +1,41 @@
+"""Shared HTTP client for examples
+
+Passing one ``httpx.AsyncClient`` to several :func:`~crypto_api_client.create_session`
+calls lets the sessions reuse TCP/TLS connections (and HTTP/2 multiplexing)
+instead of each session opening its own connection pool.
+
+Usage example:
+    >>> from common.http_client import create_shared_http_client
+    >>> async with create_shared_http_client() as http_client:
+    ...     async with create_session(Exchange.BITFLYER, http_client=http_client) as session:
+    ...         ticker = await session.api.ticker(request)
+"""
+
+import httpx
+
+from crypto_api_client.core.session_config import SessionConfig
+
+# Connection pool sized for fan-out across all supported exchanges
+SHARED_MAX_CONNECTIONS = 32
+
+
+def create_shared_http_client(
+    session_config: SessionConfig | None = None,
+) -> httpx.AsyncClient:
+    """Create HTTP client to be shared across exchange sessions
+
+    The caller owns the client and must close it (e.g., with ``async with``);
+    sessions created with ``http_client=...`` never close it.
+
+    :param session_config: Session configuration (pool sized for
+        :data:`SHARED_MAX_CONNECTIONS` if None)
+    :return: HTTP client built like each session's own client (proxy, SSL and
+        trust_env settings included)
+    """
+    if session_config is None:
+        session_config = SessionConfig(
+            max_connections=SHARED_MAX_CONNECTIONS,
+            max_keepalive_connections=SHARED_MAX_CONNECTIONS,
+        )
+
+    return session_config.to_httpx_client()
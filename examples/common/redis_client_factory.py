@@ -17,6 +17,8 @@ def create_redis_client(
     socket_connect_timeout: float | None = None,
     retry_on_timeout: bool | None = None,
     retry: Retry | None = None,
+    max_connections: int | None = None,
+    health_check_interval: int = 30,
 ):
     """Factory function to create Redis client
 
@@ -40,6 +42,13 @@ def create_redis_client(
     :type retry_on_timeout: bool | None
     :param retry: Retry configuration (default if None)
     :type retry: Retry | None
+    :param max_connections: Connection pool size limit (unbounded if None).
+        The asyncio pool raises ``ConnectionError`` instead of waiting when the
+        limit is reached, so only set this to cap connections on the server side
+    :type max_connections: int | None
+    :param health_check_interval: Seconds a pooled connection may stay idle
+        before it is checked with PING on its next use (0 disables the check)
+    :type health_check_interval: int
     :return: Configured Redis client
     :rtype: redis.asyncio.Redis
 
@@ -75,6 +84,7 @@ def create_redis_client(
         "decode_responses": decode_responses,
         "socket_keepalive": socket_keepalive,
         "socket_timeout": socket_timeout,
+        "health_check_interval": health_check_interval,
     }
 
     # Optional settings (only add if not None)
@@ -84,5 +94,7 @@ def create_redis_client(
         kwargs["retry_on_timeout"] = retry_on_timeout
     if retry is not None:
         kwargs["retry"] = retry
+    if max_connections is not None:
+        kwargs["max_connections"] = max_connections
 
     return redis.asyncio.Redis(**kwargs)
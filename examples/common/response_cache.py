@@ -0,0 +1,124 @@
+"""File-based TTL cache for slow-moving public endpoints
+
+Exchange status endpoints change minutes to hours apart, so repeated runs of
+the examples can reuse the previous response instead of paying a network
+round-trip every time. The cache is opt-in: it is only used when a TTL is given
+explicitly with ``--cache-ttl``.
+
+Entries are stored as JSON under ``~/.cache/crypto_api_client/``. Responses are
+dumped in JSON mode, so :class:`~decimal.Decimal` fields are kept as strings and
+validated back without precision loss. Any type Pydantic can validate is
+supported, e.g. a model or ``list[Market]``.
+
+Usage example:
+    >>> from common.response_cache import get_or_fetch
+    >>> spot_status = await get_or_fetch(
+    ...     ("bitbank", "spot_status"),
+    ...     SpotStatus,
+    ...     lambda: session.api.spot_status(SpotStatusRequest()),
+    ...     ttl_seconds=300,
+    ... )
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CACHE_DIR = Path.home() / ".cache" / "crypto_api_client"
+
+
+def _cache_path(key: Hashable) -> Path:
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def _load(path: Path, adapter: TypeAdapter[T], ttl_seconds: float) -> T | None:
+    from pydantic import ValidationError
+
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - entry.get("fetched_at", 0) > ttl_seconds:
+        return None
+
+    try:
+        return adapter.validate_python(entry["data"])
+    except (KeyError, ValidationError):
+        return None
+
+
+def _store(path: Path, adapter: TypeAdapter[T], value: T) -> None:
+    entry: dict[str, Any] = {
+        "fetched_at": time.time(),
+        "data": adapter.dump_python(value, mode="json"),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a uniquely named file then rename, so concurrent writers do not
+        # clobber each other and a reader never sees a partial file
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as tmp_file:
+            try:
+                json.dump(entry, tmp_file)
+            except BaseException:
+                tmp_file.close()
+                os.unlink(tmp_file.name)
+                raise
+        try:
+            os.replace(tmp_file.name, path)
+        except OSError:
+            os.unlink(tmp_file.name)
+            raise
+    except OSError as e:
+        logger.debug(f"Failed to write cache entry {path}: {e}")
+
+
+async def get_or_fetch(
+    key: Hashable,
+    model_type: Any,
+    fetch: Callable[[], Awaitable[T]],
+    ttl_seconds: float = 0,
+) -> T:
+    """Return cached response for key, or fetch and cache it
+
+    :param key: Cache key, e.g. ``(exchange, endpoint, params)``
+    :param model_type: Type used to restore the cached data (model class or
+        e.g. ``list[Market]``)
+    :param fetch: Coroutine factory called on a cache miss
+    :param ttl_seconds: Maximum entry age in seconds (0, the default, disables
+        the cache)
+    :return: Cached or freshly fetched response
+    """
+    if ttl_seconds <= 0:
+        return await fetch()
+
+    from pydantic import TypeAdapter
+
+    adapter: TypeAdapter[T] = TypeAdapter(model_type)
+    path = _cache_path(key)
+    cached = _load(path, adapter, ttl_seconds)
+    if cached is not None:
+        logger.debug(f"Cache hit for {key!r}")
+        return cached
+
+    value = await fetch()
+    _store(path, adapter, value)
+    return value
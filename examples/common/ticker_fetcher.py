@@ -12,8 +12,11 @@ Usage example:
 """
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import httpx
+
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.binance import (
     Ticker as BinanceTicker,
@@ -34,6 +37,8 @@ from crypto_api_client.gmocoin import (
     TickerRequest as GmocoinTickerRequest,
 )
 
+from .http_client import create_shared_http_client
+
 # Define BTC/JPY currency pair format for each exchange
 BINANCE_BTC_JPY = "BTCJPY"  # BINANCE: no separator
 BITBANK_BTC_JPY = "btc_jpy"  # bitbank: lowercase, underscore
@@ -43,19 +48,40 @@ GMOCOIN_BTC_JPY = "BTC_JPY"  # GMO Coin: uppercase, underscore
 
 
 async def fetch_all_btc_jpy_tickers() -> list[dict[str, Any]]:
-    tasks = [
-        fetch_binance_ticker(BINANCE_BTC_JPY),
-        fetch_bitbank_ticker(BITBANK_BTC_JPY),
-        fetch_bitflyer_ticker(BITFLYER_BTC_JPY),
-        fetch_coincheck_ticker(COINCHECK_BTC_JPY),
-        fetch_gmocoin_ticker(GMOCOIN_BTC_JPY),
+    """Fetch BTC/JPY tickers from all exchanges concurrently
+
+    All sessions share a single HTTP client, so one connection pool serves every
+    exchange. Each exchange is a different host, so no connection is reused.
+
+    :return: Ticker dictionaries in exchange order (``{"exchange": ..., "error": ...}`` on failure)
+    """
+    fetchers: list[tuple[str, Callable[..., Awaitable[dict[str, Any]]], str]] = [
+        ("BINANCE", fetch_binance_ticker, BINANCE_BTC_JPY),
+        ("bitbank", fetch_bitbank_ticker, BITBANK_BTC_JPY),
+        ("bitFlyer", fetch_bitflyer_ticker, BITFLYER_BTC_JPY),
+        ("Coincheck", fetch_coincheck_ticker, COINCHECK_BTC_JPY),
+        ("GMO Coin", fetch_gmocoin_ticker, GMOCOIN_BTC_JPY),
+    ]
+
+    async with create_shared_http_client() as http_client:
+        results = await asyncio.gather(
+            *(fetcher(pair, http_client=http_client) for _, fetcher, pair in fetchers),
+            return_exceptions=True,
+        )
+
+    return [
+        {"exchange": name, "error": str(result)}
+        if isinstance(result, BaseException)
+        else result
+        for (name, _, _), result in zip(fetchers, results, strict=True)
     ]
-    return await asyncio.gather(*tasks)
 
 
-async def fetch_binance_ticker(pair: str) -> dict[str, Any]:
+async def fetch_binance_ticker(
+    pair: str, *, http_client: httpx.AsyncClient | None = None
+) -> dict[str, Any]:
     try:
-        async with create_session(Exchange.BINANCE) as session:
+        async with create_session(Exchange.BINANCE, http_client=http_client) as session:
             request = BinanceTickerRequest(symbol=pair)
             ticker: BinanceTicker = await session.api.ticker_24hr(request)
 
@@ -75,9 +101,11 @@ async def fetch_binance_ticker(pair: str) -> dict[str, Any]:
         return {"exchange": "BINANCE", "error": str(e)}
 
 
-async def fetch_bitbank_ticker(pair: str) -> dict[str, Any]:
+async def fetch_bitbank_ticker(
+    pair: str, *, http_client: httpx.AsyncClient | None = None
+) -> dict[str, Any]:
     try:
-        async with create_session(Exchange.BITBANK) as session:
+        async with create_session(Exchange.BITBANK, http_client=http_client) as session:
             request = BitbankTickerRequest(pair=pair)
             ticker = await session.api.ticker(request)
 
@@ -97,15 +125,19 @@ async def fetch_bitbank_ticker(pair: str) -> dict[str, Any]:
         return {"exchange": "bitbank", "error": str(e)}
 
 
-async def fetch_bitflyer_ticker(pair: str) -> dict[str, Any]:
+async def fetch_bitflyer_ticker(
+    pair: str, *, http_client: httpx.AsyncClient | None = None
+) -> dict[str, Any]:
     try:
-        async with create_session(Exchange.BITFLYER) as session:
+        async with create_session(
+            Exchange.BITFLYER, http_client=http_client
+        ) as session:
             request = BitflyerTickerRequest(product_code=pair)
             ticker = await session.api.ticker(request)
 
             return {
                 "exchange": "bitFlyer",
-                "symbol": str(ticker.product_code),
+                "symbol": ticker.product_code,
                 "last_price": ticker.ltp,
                 "bid_price": ticker.best_bid,
                 "ask_price": ticker.best_ask,
@@ -119,9 +151,13 @@ async def fetch_bitflyer_ticker(pair: str) -> dict[str, Any]:
         return {"exchange": "bitFlyer", "error": str(e)}
 
 
-async def fetch_coincheck_ticker(pair: str) -> dict[str, Any]:
+async def fetch_coincheck_ticker(
+    pair: str, *, http_client: httpx.AsyncClient | None = None
+) -> dict[str, Any]:
     try:
-        async with create_session(Exchange.COINCHECK) as session:
+        async with create_session(
+            Exchange.COINCHECK, http_client=http_client
+        ) as session:
             request = CoincheckTickerRequest(pair=pair)
             ticker = await session.api.ticker(request)
 
@@ -141,9 +177,11 @@ async def fetch_coincheck_ticker(pair: str) -> dict[str, Any]:
         return {"exchange": "Coincheck", "error": str(e)}
 
 
-async def fetch_gmocoin_ticker(pair: str) -> dict[str, Any]:
+async def fetch_gmocoin_ticker(
+    pair: str, *, http_client: httpx.AsyncClient | None = None
+) -> dict[str, Any]:
     try:
-        async with create_session(Exchange.GMOCOIN) as session:
+        async with create_session(Exchange.GMOCOIN, http_client=http_client) as session:
             request = GmocoinTickerRequest(symbol=pair)
             tickers = await session.api.ticker(request)
 
@@ -151,7 +189,7 @@ async def fetch_gmocoin_ticker(pair: str) -> dict[str, Any]:
                 ticker = tickers[0]
                 return {
                     "exchange": "GMO Coin",
-                    "symbol": str(ticker.symbol),
+                    "symbol": ticker.symbol,
                     "last_price": ticker.last,
                     "bid_price": ticker.bid,
                     "ask_price": ticker.ask,
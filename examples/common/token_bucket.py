@@ -0,0 +1,62 @@
+"""Token bucket rate limiter for examples
+
+Paginating examples use it to keep a request rate instead of sleeping a fixed
+time after each response, so slow responses are not followed by an extra wait.
+
+Usage example:
+    >>> from common.token_bucket import TokenBucket
+    >>> bucket = TokenBucket(rate=5.0)  # 5 requests per second
+    >>> await bucket.acquire()
+    >>> await session.api.getchildorders(request)
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Async token bucket rate limiter
+
+    Tokens are refilled continuously at ``rate`` per second up to ``capacity``.
+    :meth:`acquire` reserves its tokens before sleeping, so concurrent callers
+    are served in call order without a lock.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        """
+        :param rate: Tokens refilled per second
+        :param capacity: Maximum number of tokens (burst size)
+        :raises ValueError: When rate is not positive or capacity is less than 1
+        """
+        if rate <= 0:
+            msg = f"rate must be positive: {rate}"
+            raise ValueError(msg)
+        if capacity < 1:
+            msg = f"capacity must be at least 1: {capacity}"
+            raise ValueError(msg)
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until the given number of tokens is available and consume them
+
+        :param tokens: Number of tokens to consume
+        :raises ValueError: When tokens exceeds capacity
+        """
+        if tokens > self.capacity:
+            msg = f"tokens must not exceed capacity {self.capacity}: {tokens}"
+            raise ValueError(msg)
+
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+        # A negative balance is a reservation: later callers wait behind it
+        self._tokens -= tokens
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
@@ -10,7 +10,6 @@
     uv run python examples/gmocoin/ticker.py --pair ETH_JPY --zone Asia/Tokyo --log-level DEBUG
 """
 
-import asyncio
 import sys
 from pathlib import Path
 from typing import Annotated
@@ -23,19 +22,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from zoneinfo import ZoneInfo
 
 from common.display import BUY_COLOR, LABEL_WIDTH, SELL_COLOR
-from common.helpers import setup_logging
+from common.helpers import create_typer_app, run_async, setup_logging
 from common.typer_custom_types import ZONE_INFO_TYPE
 
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.gmocoin import TickerRequest
 from crypto_api_client.gmocoin.native_domain_models import Ticker
 
-# Unified settings for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,      # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False        # Show full traceback
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -58,7 +52,7 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(pair, zone_info, log_level))
+    run_async(async_main(pair, zone_info, log_level))
 
 
 async def async_main(pair: str, zone_info: ZoneInfo, log_level: str) -> None:
@@ -73,7 +67,7 @@ async def async_main(pair: str, zone_info: ZoneInfo, log_level: str) -> None:
 
 def display_ticker(ticker: Ticker, zone_info: ZoneInfo) -> None:
     # Basic information
-    typer.echo(f"{'symbol':<{LABEL_WIDTH}}: {str(ticker.symbol)}")
+    typer.echo(f"{'symbol':<{LABEL_WIDTH}}: {ticker.symbol}")
     print(f"[{SELL_COLOR}]{'ask price':<{LABEL_WIDTH}}: {ticker.ask:,.0f}[/]")
     print(f"[{BUY_COLOR}]{'bid price':<{LABEL_WIDTH}}: {ticker.bid:,.0f}[/]")
 
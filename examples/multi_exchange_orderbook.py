@@ -19,9 +19,11 @@ from typing import Annotated
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+import httpx
 import typer
 from common.display import BUY_COLOR, SELL_COLOR
-from common.helpers import setup_logging
+from common.helpers import create_typer_app, run_async, setup_logging
+from common.http_client import create_shared_http_client
 from rich.console import Console
 from rich.table import Table
 
@@ -55,11 +57,7 @@ from crypto_api_client.gmocoin import (
     OrderBookRequest as GmoCoinOrderBookRequest,
 )
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+app = create_typer_app()
 console = Console()
 
 
@@ -126,7 +124,7 @@ def main(
     base = "BTC"
     quote = "JPY"
 
-    asyncio.run(
+    run_async(
         async_main(
             base,
             quote,
@@ -147,14 +145,27 @@ async def async_main(
     setup_logging(log_level)
 
     try:
-        orderbooks = await asyncio.gather(
-            fetch_bitflyer_orderbook(base.upper(), quote.upper()),
-            fetch_binance_orderbook(base.upper(), quote.upper(), limit=5000),
-            fetch_bitbank_orderbook(base.lower(), quote.lower()),
-            fetch_coincheck_orderbook(base.lower(), quote.lower()),
-            fetch_gmocoin_orderbook(base.upper(), quote.upper()),
-            return_exceptions=False,
-        )
+        # Each exchange is a different host, so no connection is reused; sharing one
+        # client only caps the total number of sockets the five sessions open
+        async with create_shared_http_client() as http_client:
+            orderbooks = await asyncio.gather(
+                fetch_bitflyer_orderbook(
+                    base.upper(), quote.upper(), http_client=http_client
+                ),
+                fetch_binance_orderbook(
+                    base.upper(), quote.upper(), limit=5000, http_client=http_client
+                ),
+                fetch_bitbank_orderbook(
+                    base.lower(), quote.lower(), http_client=http_client
+                ),
+                fetch_coincheck_orderbook(
+                    base.lower(), quote.lower(), http_client=http_client
+                ),
+                fetch_gmocoin_orderbook(
+                    base.upper(), quote.upper(), http_client=http_client
+                ),
+                return_exceptions=False,
+            )
 
         valid_orderbooks = [ob for ob in orderbooks if ob is not None]
 
@@ -172,9 +183,13 @@ async def async_main(
         raise typer.Exit(1)
 
 
-async def fetch_bitflyer_orderbook(base: str, quote: str) -> UnifiedOrderBook | None:
+async def fetch_bitflyer_orderbook(
+    base: str, quote: str, *, http_client: httpx.AsyncClient | None = None
+) -> UnifiedOrderBook | None:
     try:
-        async with create_session(Exchange.BITFLYER) as session:
+        async with create_session(
+            Exchange.BITFLYER, http_client=http_client
+        ) as session:
             # bitFlyer uses uppercase with underscore separator
             product_code = f"{base}_{quote}"
             request = BoardRequest(product_code=product_code)
@@ -186,10 +201,16 @@ async def fetch_bitflyer_orderbook(base: str, quote: str) -> UnifiedOrderBook |
 
 
 async def fetch_binance_orderbook(
-    base: str, quote: str, limit: int = 1000
+    base: str,
+    quote: str,
+    limit: int = 1000,
+    *,
+    http_client: httpx.AsyncClient | None = None,
 ) -> UnifiedOrderBook | None:
     try:
-        async with create_session(Exchange.BINANCE) as session:
+        async with create_session(
+            Exchange.BINANCE, http_client=http_client
+        ) as session:
             # BINANCE uses no separator
             symbol = f"{base}{quote}"
             request = BinanceDepthRequest(symbol=symbol, limit=limit)
@@ -200,9 +221,13 @@ async def fetch_binance_orderbook(
         return None
 
 
-async def fetch_bitbank_orderbook(base: str, quote: str) -> UnifiedOrderBook | None:
+async def fetch_bitbank_orderbook(
+    base: str, quote: str, *, http_client: httpx.AsyncClient | None = None
+) -> UnifiedOrderBook | None:
     try:
-        async with create_session(Exchange.BITBANK) as session:
+        async with create_session(
+            Exchange.BITBANK, http_client=http_client
+        ) as session:
             # bitbank uses lowercase with underscore separator
             pair_str = f"{base.lower()}_{quote.lower()}"
             request = BitbankDepthRequest(pair=pair_str)
@@ -213,9 +238,13 @@ async def fetch_bitbank_orderbook(base: str, quote: str) -> UnifiedOrderBook | N
         return None
 
 
-async def fetch_coincheck_orderbook(base: str, quote: str) -> UnifiedOrderBook | None:
+async def fetch_coincheck_orderbook(
+    base: str, quote: str, *, http_client: httpx.AsyncClient | None = None
+) -> UnifiedOrderBook | None:
     try:
-        async with create_session(Exchange.COINCHECK) as session:
+        async with create_session(
+            Exchange.COINCHECK, http_client=http_client
+        ) as session:
             # Coincheck uses lowercase with underscore separator
             pair_str = f"{base.lower()}_{quote.lower()}"
             request = CoincheckOrderBookRequest(pair=pair_str)
@@ -226,9 +255,13 @@ async def fetch_coincheck_orderbook(base: str, quote: str) -> UnifiedOrderBook |
         return None
 
 
-async def fetch_gmocoin_orderbook(base: str, quote: str) -> UnifiedOrderBook | None:
+async def fetch_gmocoin_orderbook(
+    base: str, quote: str, *, http_client: httpx.AsyncClient | None = None
+) -> UnifiedOrderBook | None:
     try:
-        async with create_session(Exchange.GMOCOIN) as session:
+        async with create_session(
+            Exchange.GMOCOIN, http_client=http_client
+        ) as session:
             # GMO Coin uses uppercase with underscore separator
             pair_str = f"{base.upper()}_{quote.upper()}"
             request = GmoCoinOrderBookRequest(symbol=pair_str)
@@ -40,7 +40,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import httpx
 import psutil
 import typer
-from common.helpers import setup_logging
+from common.helpers import create_typer_app, run_async, setup_logging
 from rich import box  # pyright: ignore[reportMissingModuleSource]
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
@@ -54,12 +54,7 @@ from crypto_api_client.bitflyer import TickerRequest
 from crypto_api_client.core.session_config import SessionConfig
 
 console = Console()
-# Unified configuration for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,      # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False        # Show full traceback
-)
+app = create_typer_app()
 
 
 @dataclass
@@ -381,7 +376,7 @@ def main(
         # bitbank only, test with fewer requests
         uv run python examples/performance/session_pooling_comparison.py -r 20 -c 5 -e bitbank
     """
-    asyncio.run(async_main(requests, concurrent, exchange, log_level))
+    run_async(async_main(requests, concurrent, exchange, log_level))
 
 
 async def async_main(
@@ -8,26 +8,22 @@ This sample demonstrates how to access APIs via a proxy server that requires aut
     uv run python examples/proxy/authenticated_proxy.py --proxy-url http://host.docker.internal:8080 --username myuser --password mypass
 """
 
-import asyncio
 import os
 import sys
 from pathlib import Path
 from typing import Annotated
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
+from common.helpers import create_typer_app, run_async
 from pydantic import SecretStr
 
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.bitflyer.native_requests import TickerRequest
 from crypto_api_client.core.session_config import SessionConfig
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -54,7 +50,7 @@ def main(
         print("  set PROXY_USERNAME and PROXY_PASSWORD environment variables")
         raise typer.Exit(1)
 
-    asyncio.run(async_main(proxy_url, username, password))
+    run_async(async_main(proxy_url, username, password))
 
 
 async def async_main(proxy_url: str, username: str, password: str) -> None:
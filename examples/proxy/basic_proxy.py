@@ -9,24 +9,20 @@ Prerequisites:
     - Proxy server must be running at http://host.docker.internal:8080
 """
 
-import asyncio
 import sys
 from pathlib import Path
 from typing import Annotated
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
+from common.helpers import create_typer_app, run_async
 
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.bitflyer.native_requests import TickerRequest
 from crypto_api_client.core.session_config import SessionConfig
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -36,7 +32,7 @@ def main(
         typer.Option("--proxy-url", help="Proxy server URL"),
     ] = "http://host.docker.internal:8080",
 ) -> None:
-    asyncio.run(async_main(proxy_url))
+    run_async(async_main(proxy_url))
 
 
 async def async_main(proxy_url: str) -> None:
@@ -25,25 +25,21 @@ About trust_env:
     - Set to True to respect environment variables
 """
 
-import asyncio
 import os
 import sys
 from pathlib import Path
 from typing import Annotated
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
+from common.helpers import create_typer_app, run_async
 
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.bitflyer.native_requests import TickerRequest
 from crypto_api_client.core.session_config import SessionConfig
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -53,7 +49,7 @@ def main(
         typer.Option("--trust-env", help="Load proxy settings from environment variables"),
     ] = False,
 ) -> None:
-    asyncio.run(async_main(trust_env=trust_env))
+    run_async(async_main(trust_env=trust_env))
 
 
 async def async_main(trust_env: bool) -> None:
@@ -12,24 +12,20 @@ This sample demonstrates how to use a proxy with CA certificate verification.
     uv run python examples/proxy/proxy_with_cert.py --proxy-url http://host.docker.internal:8080 --cert ./.mitmproxy/mitmproxy-ca-cert.pem
 """
 
-import asyncio
 import sys
 from pathlib import Path
 from typing import Annotated
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
+from common.helpers import create_typer_app, run_async
 
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.bitflyer.native_requests import TickerRequest
 from crypto_api_client.core.session_config import SessionConfig
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -43,7 +39,7 @@ def main(
         typer.Option("--cert", help="CA certificate path"),
     ] = None,
 ) -> None:
-    asyncio.run(async_main(proxy_url, cert))
+    run_async(async_main(proxy_url, cert))
 
 
 async def async_main(proxy_url: str, cert: str | None) -> None:
@@ -22,12 +22,12 @@ and limit states.
     Can be specified via REDIS_HOST environment variable or --redis-host option.
 """
 
-import asyncio
 import time
 from datetime import datetime, timezone
 
 import redis.asyncio as redis
 import typer
+from common.helpers import run_async
 from common.redis_client_factory import create_redis_client
 from rich.console import Console
 from rich.table import Table
@@ -58,7 +58,7 @@ def main(
         help="Window seconds",
     ),
 ) -> None:
-    asyncio.run(
+    run_async(
         async_main(
             redis_host,
             redis_port,
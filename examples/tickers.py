@@ -11,7 +11,6 @@ Supported exchanges: BINANCE, bitbank, bitFlyer, Coincheck, GMO Coin
     uv run python examples/tickers.py
 """
 
-import asyncio
 import sys
 from decimal import Decimal
 from pathlib import Path
@@ -22,18 +21,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import typer
 from common.display import BUY_COLOR, SELL_COLOR
-from common.helpers import setup_logging
+from common.helpers import create_typer_app, run_async, setup_logging
 from common.ticker_fetcher import fetch_all_btc_jpy_tickers
 from common.typer_custom_types import ZONE_INFO_TYPE
 from rich.console import Console
 from rich.table import Table
 
-# Unified settings for development environment
-app = typer.Typer(
-    pretty_exceptions_enable=True,  # Enable Rich traceback
-    pretty_exceptions_show_locals=True,  # Show local variables
-    pretty_exceptions_short=False,  # Show full traceback
-)
+app = create_typer_app()
 console = Console()
 
 
@@ -50,7 +44,7 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(zone_info, log_level))
+    run_async(async_main(zone_info, log_level))
 
 
 async def async_main(zone_info: ZoneInfo, log_level: str) -> None:
@@ -7,7 +7,6 @@
     uv run python examples/upbit/ticker.py --markets KRW-ETH --zone Asia/Seoul
 """
 
-import asyncio
 import sys
 from pathlib import Path
 from typing import Annotated
@@ -19,18 +18,14 @@ from rich import print
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from common.display import BUY_COLOR, LABEL_WIDTH, SELL_COLOR
-from common.helpers import setup_logging
+from common.helpers import create_typer_app, run_async, setup_logging
 from common.typer_custom_types import ZONE_INFO_TYPE
 
 from crypto_api_client import Exchange, create_session
 from crypto_api_client.upbit import TickerRequest
 from crypto_api_client.upbit.native_domain_models import Ticker
 
-app = typer.Typer(
-    pretty_exceptions_enable=True,
-    pretty_exceptions_show_locals=True,
-    pretty_exceptions_short=False,
-)
+app = create_typer_app()
 
 
 @app.command()
@@ -53,7 +48,7 @@ def main(
         typer.Option("--log-level", help="Log level (DEBUG, INFO, WARNING, ERROR)"),
     ] = "WARNING",
 ) -> None:
-    asyncio.run(async_main(markets, zone_info, log_level))
+    run_async(async_main(markets, zone_info, log_level))
 
 
 async def async_main(markets: str, zone_info: ZoneInfo, log_level: str) -> None:
@@ -68,7 +63,7 @@ async def async_main(markets: str, zone_info: ZoneInfo, log_level: str) -> None:
 
 
 def display_ticker(ticker: Ticker, zone_info: ZoneInfo) -> None:
-    typer.echo(f"{'market':<{LABEL_WIDTH}}: {str(ticker.market)}")
+    typer.echo(f"{'market':<{LABEL_WIDTH}}: {ticker.market}")
 
     # Upbit doesn't have direct ask/bid, so display current price
     print(
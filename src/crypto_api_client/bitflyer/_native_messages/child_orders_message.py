@@ -70,16 +70,13 @@ class ChildOrdersMessage(BitFlyerMessage[ChildOrdersPayload, list[ChildOrder]]):
 
     def to_domain_model(self) -> list[ChildOrder]:
         """Generate :term:`native domain model` from :term:`payload content`"""
-        import json
-
         # Parse JSON as array
-        data = json.loads(self.payload.content_str)
+        data = DecimalJsonParser.loads(self.payload.content_str)
 
         # Map product_code to pair for each element
         for item in data:
             if "product_code" in item and "pair" not in item:
                 item["pair"] = item["product_code"]
 
-        # Convert back to JSON string and parse
-        updated_json = json.dumps(data)
-        return DecimalJsonParser.parse(updated_json, list[ChildOrder])
+        # Validate the adjusted objects directly (no JSON round trip)
+        return DecimalJsonParser.validate(data, list[ChildOrder])
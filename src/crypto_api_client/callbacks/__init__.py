@@ -6,9 +6,13 @@ __all__ = [
     "AbstractRequestCallback",
     "RateLimitKeyBuilder",
     "RedisSharedUrlPatternRateLimiter",
+    "RedisSharedUrlPatternRateLimiterGroup",
 ]
 from .abstract_request_callback import AbstractRequestCallback
 from .rate_limit_key_builder import RateLimitKeyBuilder
 from .redis_shared_url_pattern_rate_limiter import (
     RedisSharedUrlPatternRateLimiter,
 )
+from .redis_shared_url_pattern_rate_limiter_group import (
+    RedisSharedUrlPatternRateLimiterGroup,
+)
@@ -5,9 +5,10 @@ import re
 import time
 from collections.abc import Sequence
 from logging import getLogger
-from typing import Final
+from typing import Any, Final
 
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
 from yarl import URL
 
 from crypto_api_client.errors.exceptions import RateLimitApproachingError
@@ -195,16 +196,29 @@ class RedisSharedUrlPatternRateLimiter(AbstractRequestCallback):
 
         return instance
 
+    @property
+    def redis(self) -> redis.Redis:
+        """Redis client holding the shared counter"""
+        return self._redis
+
     async def get_count_async(self) -> int:
         """Get count asynchronously
 
         :return: Call count in current window
         :rtype: int
         """
-        redis_key = self._key()
-
         # Since decode_responses=False, val is returned as bytes
-        val = await self._redis.get(redis_key)
+        val = await self._redis.get(self.key())
+        return self._update_count(val)
+
+    def _update_count(self, val: bytes | None) -> int:
+        """Convert stored counter value and update cached count
+
+        :param val: Value read from Redis (None if the key does not exist)
+        :type val: bytes | None
+        :return: Call count in current window
+        :rtype: int
+        """
         # int() can directly convert byte strings (UTF-8 encoded) to integers, correctly reading numeric strings saved by non-Python languages
         count = int(val) if val else 0
         self._last_known_count = count  # Update cache
@@ -213,16 +227,53 @@ class RedisSharedUrlPatternRateLimiter(AbstractRequestCallback):
 
     async def _incr_count_async(self) -> None:
         """Increment count asynchronously"""
-        redis_key = self._key()
-
         # Transaction processing with pipeline
         pipe = self._redis.pipeline(transaction=True)
+        redis_key = self.queue_increment(pipe)
+        results = await pipe.execute()
+        self._log_incr_result(redis_key, results)
+
+    def apply_count(self, path: str, value: bytes | None) -> int:
+        """Record a counter value read from Redis and check it against the limit
+
+        Used when the counter is read outside :meth:`get_count_async`, e.g. in a
+        batched ``MGET``.
+
+        :param path: Request URL path (for logging)
+        :type path: str
+        :param value: Value read from :meth:`key` (None if the key does not exist)
+        :type value: bytes | None
+        :return: Call count in current window
+        :rtype: int
+        :raises RateLimitApproachingError: When rate limit exceeded
+        """
+        count = self._update_count(value)
+        self._check_count(path, count)
+        return count
+
+    def queue_increment(self, pipe: Pipeline) -> str:
+        """Queue count increment commands (INCR and EXPIRE) on pipeline
+
+        :param pipe: Pipeline to queue commands on
+        :type pipe: redis.asyncio.client.Pipeline
+        :return: Redis key being incremented
+        :rtype: str
+        """
+        redis_key = self.key()
         # Best practice: Using INCR command saves numbers as strings while Redis automatically
         # performs numeric conversion internally, ensuring consistent behavior across all languages
         pipe.incr(redis_key, 1)
         pipe.expire(redis_key, self.window_seconds * 2)
-        results = await pipe.execute()
+        return redis_key
 
+    def _log_incr_result(self, redis_key: str, results: list[Any]) -> None:
+        """Log results of commands queued by queue_increment()
+
+        :param redis_key: Redis key that was incremented
+        :type redis_key: str
+        :param results: Pipeline results for INCR and EXPIRE
+        :type results: list[Any]
+        """
         logger.debug(
             "Redis INCR result: key=%s, new_count=%s, expire_set=%s, label=%s, patterns=%s",
             redis_key,
@@ -262,7 +313,7 @@ class RedisSharedUrlPatternRateLimiter(AbstractRequestCallback):
             )
             raise
 
-    def _key(self) -> str:
+    def key(self) -> str:
         """Generate key for fixed window
 
         :return: Redis key name corresponding to current window
@@ -275,7 +326,7 @@ class RedisSharedUrlPatternRateLimiter(AbstractRequestCallback):
             self.key_prefix, label, self.window_seconds
         )
 
-    def _matches_pattern(self, path: str) -> bool:
+    def matches(self, path: str) -> bool:
         """Check if path matches pattern
 
         :param path: Path to check
@@ -299,7 +350,7 @@ class RedisSharedUrlPatternRateLimiter(AbstractRequestCallback):
         :raises RateLimitApproachingError: When rate limit exceeded
         """
         path = url.path
-        if not self._matches_pattern(path):
+        if not self.matches(path):
             logger.debug(
                 "Rate limit check skipped: url_path=%s (no pattern match), patterns=%s",
                 path,
@@ -308,7 +359,18 @@ class RedisSharedUrlPatternRateLimiter(AbstractRequestCallback):
             return
 
         count = await self.get_count_async()
-        redis_key = self._key()
+        self._check_count(path, count)
+
+    def _check_count(self, path: str, count: int) -> None:
+        """Check count against limit
+
+        :param path: Request URL path (for logging)
+        :type path: str
+        :param count: Call count in current window
+        :type count: int
+        :raises RateLimitApproachingError: When rate limit exceeded
+        """
+        redis_key = self.key()
 
         if self.max_safe_count <= count:
             self.limit_exceeded = True
@@ -353,7 +415,7 @@ class RedisSharedUrlPatternRateLimiter(AbstractRequestCallback):
         :type response_data: HttpResponseData
         """
         path = response_data.request_path
-        if not self._matches_pattern(path):
+        if not self.matches(path):
             logger.debug(
                 "Rate limit increment skipped: request_path=%s (no pattern match), patterns=%s",
                 path,
@@ -361,7 +423,7 @@ class RedisSharedUrlPatternRateLimiter(AbstractRequestCallback):
             )
             return
 
-        redis_key = self._key()
+        redis_key = self.key()
         logger.debug(
             "Rate limit increment: request_path=%s, key=%s, status_code=%d",
             path,
@@ -384,7 +446,7 @@ class RedisSharedUrlPatternRateLimiter(AbstractRequestCallback):
         return (
             f"{self._get_count_sync():>3}/{self.max_safe_count:>3},"
             f" period={self.period:>3}, reset={reset_str}, {self.is_limit_exceeded}, patterns={patterns_str},"
-            f" {self._key()}"
+            f" {self.key()}"
         )
 
     def _get_count_sync(self) -> int:
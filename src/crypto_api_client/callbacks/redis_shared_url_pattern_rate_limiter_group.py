@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from logging import getLogger
+from typing import Any
+
+from yarl import URL
+
+from crypto_api_client.http.http_response_data import HttpResponseData
+from crypto_api_client.security.secret_headers import SecretHeaders
+
+from .abstract_request_callback import AbstractRequestCallback
+from .redis_shared_url_pattern_rate_limiter import RedisSharedUrlPatternRateLimiter
+
+logger = getLogger(__name__)
+
+
+class RedisSharedUrlPatternRateLimiterGroup(AbstractRequestCallback):
+    """Applies several URL pattern rate limiters with one Redis round-trip each way
+
+    Registered as separate callbacks, every matching
+    :class:`~crypto_api_client.callbacks.RedisSharedUrlPatternRateLimiter` issues
+    its own ``GET`` before the request and its own ``INCR``/``EXPIRE`` pipeline
+    after it. The group reads all matching counters with a single ``MGET`` and
+    increments them in a single pipeline, so a request matching N limiters costs
+    2 round-trips instead of 2N.
+
+    Limiters are checked in the given order and the first one over its limit
+    raises, as when they are registered as individual callbacks.
+
+    .. code-block:: python
+
+        group = RedisSharedUrlPatternRateLimiterGroup(
+            [general_limiter, ticker_limiter, markets_limiter]
+        )
+
+        async with create_session(Exchange.BITFLYER, callbacks=(group,)) as session:
+            ...
+    """
+
+    def __init__(self, limiters: Sequence[RedisSharedUrlPatternRateLimiter]) -> None:
+        """
+        :param limiters: Limiters created with
+            ``RedisSharedUrlPatternRateLimiter.create()``
+        :type limiters: Sequence[RedisSharedUrlPatternRateLimiter]
+        :raises ValueError: If limiters is empty or they do not share one Redis client
+        """
+        if not limiters:
+            raise ValueError("limiters must not be empty")
+
+        redis_client = limiters[0].redis
+        if any(limiter.redis is not redis_client for limiter in limiters):
+            raise ValueError("All limiters must share the same Redis client")
+
+        self.limiters = tuple(limiters)
+        self._redis = redis_client
+
+    def _matching_limiters(self, path: str) -> list[RedisSharedUrlPatternRateLimiter]:
+        """Return limiters whose patterns match path, in registration order"""
+        return [limiter for limiter in self.limiters if limiter.matches(path)]
+
+    async def before_request(
+        self,
+        url: URL,
+        headers: SecretHeaders,
+        data: str | None,
+    ) -> None:
+        """Check all matching limiters with a single MGET
+
+        :param url: Request URL
+        :param headers: Request headers
+        :param data: Request body
+        :raises RateLimitApproachingError: When any matching limiter is exceeded
+        """
+        path = url.path
+        limiters = self._matching_limiters(path)
+        if not limiters:
+            logger.debug(
+                "Rate limit check skipped: url_path=%s (no limiter match)", path
+            )
+            return
+
+        values = await self._redis.mget([limiter.key() for limiter in limiters])
+        for limiter, val in zip(limiters, values, strict=True):
+            limiter.apply_count(path, val)
+
+    async def after_request(
+        self,
+        response_data: HttpResponseData,
+    ) -> None:
+        """Increment all matching limiters in a single pipeline
+
+        :param response_data: Response data
+        :type response_data: HttpResponseData
+        """
+        limiters = self._matching_limiters(response_data.request_path)
+        if not limiters:
+            return
+
+        pipe = self._redis.pipeline(transaction=True)
+        redis_keys = [limiter.queue_increment(pipe) for limiter in limiters]
+        results: list[Any] = await pipe.execute()
+
+        # Each limiter queued two commands (INCR, EXPIRE)
+        for i, limiter in enumerate(limiters):
+            logger.debug(
+                "Redis INCR result: key=%s, new_count=%s, expire_set=%s, label=%s",
+                redis_keys[i],
+                results[2 * i],
+                results[2 * i + 1],
+                limiter.label or "auto",
+            )
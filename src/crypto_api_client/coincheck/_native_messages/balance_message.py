@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import json
 from decimal import Decimal
 
+from crypto_api_client.core.decimal_json_parser import DecimalJsonParser
+
 from ..native_domain_models.currency_balance import CurrencyBalance
 from .balance_payload import BalancePayload
 from .coincheck_message import CoincheckMessage
@@ -95,11 +96,7 @@ class BalanceMessage(CoincheckMessage[BalancePayload, list[CurrencyBalance]]):
             ``CoincheckMessage._extract_payload_json()``,
             so all keys in the payload can be treated as payload data.
         """
-        data = json.loads(
-            self.payload.content_str,
-            parse_float=Decimal,
-            parse_int=Decimal,
-        )
+        data = DecimalJsonParser.loads(self.payload.content_str)
 
         # Extract set of currencies (no need to check for success)
         currencies: set[str] = set()
@@ -6,6 +6,18 @@ from typing import Any
 from pydantic import BaseModel, Field, field_validator
 
 
+def _to_decimal(value: Any) -> Decimal:
+    """Return value as Decimal, reusing it if the JSON parser already made one
+
+    :raises ValueError: If value is NaN or Infinity (model_construct skips the
+        field validation that would otherwise reject it)
+    """
+    decimal_value = value if isinstance(value, Decimal) else Decimal(str(value))
+    if not decimal_value.is_finite():
+        raise ValueError(f"Expected finite decimal, got {value!r}")
+    return decimal_value
+
+
 class OrderBookEntry(BaseModel):
     price: Decimal
     size: Decimal
@@ -53,10 +65,12 @@ class OrderBook(BaseModel):
             elif isinstance(item, dict):
                 entries.append(OrderBookEntry(**item))  # type: ignore[arg-type]
             elif isinstance(item, list) and len(item) >= 2:  # pyright: ignore[reportUnknownArgumentType]
-                price_str: str = str(item[0])  # pyright: ignore[reportUnknownArgumentType]
-                size_str: str = str(item[1])  # pyright: ignore[reportUnknownArgumentType]
+                # Both fields are Decimal already, so skip per-entry validation
                 entries.append(
-                    OrderBookEntry(price=Decimal(price_str), size=Decimal(size_str))
+                    OrderBookEntry.model_construct(
+                        price=_to_decimal(item[0]),  # pyright: ignore[reportUnknownArgumentType]
+                        size=_to_decimal(item[1]),  # pyright: ignore[reportUnknownArgumentType]
+                    )
                 )
 
         return entries
@@ -28,10 +28,20 @@ class DecimalJsonParser:
     .. code-block:: python
 
        ticker = DecimalJsonParser.parse(json_str, Ticker)
+
+       # When the parsed data needs to be adjusted before validation
+       data = DecimalJsonParser.loads(json_str)
+       tickers = [DecimalJsonParser.validate(item, Ticker) for item in data]
     """
 
     _adapter_cache: ClassVar[dict[type, TypeAdapter[Any]]] = {}
 
+    # json.loads() with keyword arguments builds a new JSONDecoder on every call,
+    # so a single decoder is created once and reused
+    _decoder: ClassVar[json.JSONDecoder] = json.JSONDecoder(
+        parse_float=Decimal, parse_int=Decimal
+    )
+
     @classmethod
     def parse[T](cls, json_str: str, model_type: type[T]) -> T:
         """Convert JSON string to model instance
@@ -55,8 +65,35 @@ class DecimalJsonParser:
         #
         #   Reference: https://docs.pydantic.dev/latest/api/type_adapter/#pydantic.type_adapter.TypeAdapter.validate_json
         #
+        return cls.validate(cls.loads(json_str), model_type)
+
+    @classmethod
+    def loads(cls, json_str: str) -> Any:
+        """Parse JSON string with numbers as Decimal
+
+        :param json_str: JSON string
+        :type json_str: str
+        :return: Parsed Python object (numbers are Decimal)
+        :rtype: Any
+        :raises json.JSONDecodeError: If the string is not valid JSON
+        """
+        return cls._decoder.decode(json_str)
+
+    @classmethod
+    def validate[T](cls, python_obj: Any, model_type: type[T]) -> T:
+        """Convert object parsed by :meth:`loads` to model instance
+
+        Avoids serializing back to JSON when the parsed data has to be
+        adjusted before validation.
+
+        :param python_obj: Object parsed by :meth:`loads`
+        :type python_obj: Any
+        :param model_type: Target Pydantic model type
+        :type model_type: type[T]
+        :return: Model instance
+        :rtype: T
+        """
         adapter = cls._get_or_create_adapter(model_type)
-        python_obj = json.loads(json_str, parse_float=Decimal, parse_int=Decimal)
         return cast(T, adapter.validate_python(python_obj))
 
     @classmethod
@@ -5,7 +5,6 @@ from typing import Any, ClassVar, Self
 
 import httpx
 from pydantic import SecretStr
-from yarl import URL
 
 from crypto_api_client._base import ApiClient
 from crypto_api_client.binance.binance_api_client_factory import BinanceApiClientFactory
@@ -88,80 +87,25 @@ class ExchangeSession[TApiClient: ApiClient]:
     def _create_http_client(self) -> httpx.AsyncClient:
         """Create HTTP client
 
-        About trust_env:
-            With httpx functionality, when trust_env=True,
-            HTTP_PROXY/HTTPS_PROXY/ALL_PROXY/NO_PROXY environment variables are automatically loaded.
-            Default is False (ignores environment variables). To use environment variables,
-            explicitly specify SessionConfig(trust_env=True).
-
-            Reference: https://www.python-httpx.org/environment_variables/
+        See :meth:`SessionConfig.to_httpx_client` for proxy, SSL and trust_env handling.
         """
-        proxy = self._build_proxy_config()
-        verify = self._build_ssl_verify_config()
-
-        return httpx.AsyncClient(
-            limits=self._session_config.to_httpx_limits(),
-            timeout=self._session_config.to_httpx_timeout(),
-            http2=self._session_config.http2_enabled,
-            headers={"User-Agent": self._session_config.user_agent},
-            follow_redirects=False,
-            proxy=proxy,
-            verify=verify,
-            trust_env=self._session_config.trust_env,  # httpx automatically loads environment variables
-        )
+        return self._session_config.to_httpx_client()
 
     def _build_proxy_config(self) -> str | None:
         """Build proxy configuration
 
-        If proxy_auth is set, embeds authentication info in the URL.
-        Uses SecretStr, so automatically masked in log output.
-
         :return: Proxy URL (may include authentication info), or None
         :rtype: str | None
         """
-        if not self._session_config.proxy_url:
-            return None
-
-        proxy_url = self._session_config.proxy_url
-
-        if self._session_config.proxy_auth:
-            username, password = self._session_config.proxy_auth
-            url = URL(proxy_url)
-            url = url.with_user(username.get_secret_value())
-            url = url.with_password(password.get_secret_value())
-            proxy_url = str(url)
-
-        return proxy_url
+        return self._session_config.to_httpx_proxy()
 
     def _build_ssl_verify_config(self) -> bool | str | ssl.SSLContext:
         """Build SSL verification configuration
 
-        Priority:
-        1. ssl_context (advanced configuration)
-        2. verify_ssl=False (disable verification - creates SSLContext to work with proxies)
-        3. ssl_cert_file (custom CA certificate)
-        4. True (default verification)
-
-        Note: When verify_ssl=False, returns ssl.SSLContext instead of bool False
-        to work with HTTPS connections through proxies. This works around httpx/httpcore limitations.
-
         :return: SSL verification configuration
         :rtype: bool | str | ssl.SSLContext
         """
-        if self._session_config.ssl_context:
-            return self._session_config.ssl_context
-
-        if not self._session_config.verify_ssl:
-            # Create SSLContext to work with HTTPS connections through proxies
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            return ssl_context
-
-        if self._session_config.ssl_cert_file:
-            return self._session_config.ssl_cert_file
-
-        return True
+        return self._session_config.to_httpx_verify()
 
     def _create_api_client(
         self,
@@ -6,6 +6,7 @@ from typing import Any
 
 import httpx
 from pydantic import SecretStr
+from yarl import URL
 
 
 @dataclass
@@ -37,7 +38,9 @@ class SessionConfig:
 
     max_keepalive_connections: int = 30
     max_connections: int = 100
-    keepalive_expiry: float = 30.0
+    # Outlives request_max_delay so a retry after the longest backoff still
+    # finds the idle connection in the pool instead of re-doing TCP+TLS
+    keepalive_expiry: float = 75.0
 
     connect_timeout: float = 5.0
     read_timeout: float = 10.0
@@ -88,6 +91,88 @@ class SessionConfig:
             pool=self.pool_timeout,
         )
 
+    def to_httpx_proxy(self) -> str | None:
+        """Build proxy configuration
+
+        If proxy_auth is set, embeds authentication info in the URL.
+        Uses SecretStr, so automatically masked in log output.
+
+        :return: Proxy URL (may include authentication info), or None
+        :rtype: str | None
+        """
+        if not self.proxy_url:
+            return None
+
+        proxy_url = self.proxy_url
+
+        if self.proxy_auth:
+            username, password = self.proxy_auth
+            url = URL(proxy_url)
+            url = url.with_user(username.get_secret_value())
+            url = url.with_password(password.get_secret_value())
+            proxy_url = str(url)
+
+        return proxy_url
+
+    def to_httpx_verify(self) -> bool | str | ssl.SSLContext:
+        """Build SSL verification configuration
+
+        Priority:
+        1. ssl_context (advanced configuration)
+        2. verify_ssl=False (disable verification - creates SSLContext to work with proxies)
+        3. ssl_cert_file (custom CA certificate)
+        4. True (default verification)
+
+        Note: When verify_ssl=False, returns ssl.SSLContext instead of bool False
+        to work with HTTPS connections through proxies. This works around httpx/httpcore limitations.
+
+        :return: SSL verification configuration
+        :rtype: bool | str | ssl.SSLContext
+        """
+        if self.ssl_context:
+            return self.ssl_context
+
+        if not self.verify_ssl:
+            # Create SSLContext to work with HTTPS connections through proxies
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+            return ssl_context
+
+        if self.ssl_cert_file:
+            return self.ssl_cert_file
+
+        return True
+
+    def to_httpx_client(self) -> httpx.AsyncClient:
+        """Create HTTP client from this configuration
+
+        This is the client :class:`~crypto_api_client.core.exchange_session.ExchangeSession`
+        creates for itself. Use it to build a client shared across sessions
+        (``create_session(..., http_client=...)``) with the same proxy, SSL and
+        trust_env behavior; the caller must close it.
+
+        About trust_env:
+            With httpx functionality, when trust_env=True,
+            HTTP_PROXY/HTTPS_PROXY/ALL_PROXY/NO_PROXY environment variables are automatically loaded.
+            Default is False (ignores environment variables). To use environment variables,
+            explicitly specify SessionConfig(trust_env=True).
+
+            Reference: https://www.python-httpx.org/environment_variables/
+
+        :return: HTTP client
+        """
+        return httpx.AsyncClient(
+            limits=self.to_httpx_limits(),
+            timeout=self.to_httpx_timeout(),
+            http2=self.http2_enabled,
+            headers={"User-Agent": self.user_agent},
+            follow_redirects=False,
+            proxy=self.to_httpx_proxy(),
+            verify=self.to_httpx_verify(),
+            trust_env=self.trust_env,  # httpx automatically loads environment variables
+        )
+
     def to_request_config(self) -> dict[str, Any]:
         """Get request configuration in dictionary format
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from crypto_api_client.core.decimal_json_parser import DecimalJsonParser
@@ -59,7 +58,7 @@ class TickerMessage(GmoCoinMessage[TickerPayload, list[Ticker]]):
         abnormal response and raises an error.
         """
         # Parse payload JSON string
-        data: Any = json.loads(self.payload.content_str)
+        data: Any = DecimalJsonParser.loads(self.payload.content_str)
 
         if not isinstance(data, list):
             raise ValueError(
@@ -70,7 +69,7 @@ class TickerMessage(GmoCoinMessage[TickerPayload, list[Ticker]]):
         # Convert each element of the array to Ticker
         tickers: list[Ticker] = []
         for item in data:  # type: ignore[misc]
-            ticker = DecimalJsonParser.parse(json.dumps(item), Ticker)
+            ticker = DecimalJsonParser.validate(item, Ticker)
             tickers.append(ticker)
 
         return tickers
@@ -116,9 +116,9 @@ class TestRedisSharedUrlPatternRateLimiter:
             url_patterns=[re.compile(r"/v1/ticker"), "/v1/board"],
         )
 
-        assert limiter._matches_pattern("/v1/ticker")  # type: ignore
-        assert limiter._matches_pattern("/v1/board")  # type: ignore
-        assert not limiter._matches_pattern("/v1/executions")  # type: ignore
+        assert limiter.matches("/v1/ticker")
+        assert limiter.matches("/v1/board")
+        assert not limiter.matches("/v1/executions")
 
     @pytest.mark.asyncio
     @pytest.mark.unit
@@ -174,6 +174,25 @@ class TestRedisSharedUrlPatternRateLimiter:
         assert "URL pattern limit exceeded: 200/200" in str(exc_info.value)
         assert limiter.is_limit_exceeded
 
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_apply_count(
+        self, redis_client: redis.Redis, limiter_factory: callable  # type: ignore
+    ) -> None:
+        """Test that apply_count caches the value and checks the limit"""
+        redis_client.ping = AsyncMock(return_value=True)
+
+        limiter = await limiter_factory(max_safe_count=10)
+
+        assert limiter.apply_count("/v1/ticker", b"3") == 3
+        assert limiter.apply_count("/v1/ticker", None) == 0
+        assert limiter.remaining == 10
+
+        with pytest.raises(RateLimitApproachingError):
+            limiter.apply_count("/v1/ticker", b"10")
+        assert limiter.is_limit_exceeded
+        assert limiter.remaining == 0
+
     @pytest.mark.asyncio
     @pytest.mark.unit
     async def test_string_representation(
@@ -196,7 +215,7 @@ class TestRedisSharedUrlPatternRateLimiter:
         # Verify string representation
         str_repr = str(limiter)
         assert " 50/100" in str_repr
-        assert "TEST" in limiter._key()  # type: ignore
+        assert "TEST" in limiter.key()
         assert "[/v1/.*]" in str_repr
 
     @pytest.mark.asyncio
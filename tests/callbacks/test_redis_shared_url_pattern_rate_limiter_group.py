@@ -0,0 +1,180 @@
+"""Tests for RedisSharedUrlPatternRateLimiterGroup"""
+
+import re
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import redis.asyncio as redis
+from yarl import URL
+
+from crypto_api_client.callbacks.redis_shared_url_pattern_rate_limiter import (
+    RedisSharedUrlPatternRateLimiter,
+)
+from crypto_api_client.callbacks.redis_shared_url_pattern_rate_limiter_group import (
+    RedisSharedUrlPatternRateLimiterGroup,
+)
+from crypto_api_client.errors.exceptions import RateLimitApproachingError
+from crypto_api_client.http.http_response_data import HttpResponseData
+from crypto_api_client.security.secret_headers import SecretHeaders
+
+
+def make_response_data(path_url: str) -> HttpResponseData:
+    return HttpResponseData(
+        http_status_code=200,
+        headers={},
+        response_body_text="",
+        response_body_bytes=b"",
+        url=f"https://example.com{path_url}",
+        request_path=path_url,
+    )
+
+
+async def create_limiters(
+    redis_client: redis.Redis,
+    general_max: int = 100,
+    ticker_max: int = 100,
+) -> tuple[RedisSharedUrlPatternRateLimiter, RedisSharedUrlPatternRateLimiter]:
+    general = await RedisSharedUrlPatternRateLimiter.create(
+        redis_client=redis_client,
+        url_patterns=[re.compile(r".*")],
+        max_safe_count=general_max,
+        label="GENERAL",
+    )
+    ticker = await RedisSharedUrlPatternRateLimiter.create(
+        redis_client=redis_client,
+        url_patterns=["v1/ticker"],
+        max_safe_count=ticker_max,
+        label="TICKER",
+    )
+    return general, ticker
+
+
+class TestRedisSharedUrlPatternRateLimiterGroup:
+    """Test class for RedisSharedUrlPatternRateLimiterGroup"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_before_request_reads_all_counts_with_one_mget(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """All matching counters are read with a single MGET"""
+        general, ticker = await create_limiters(redis_client)
+        group = RedisSharedUrlPatternRateLimiterGroup([general, ticker])
+        redis_client.mget = AsyncMock(return_value=[b"3", b"2"])  # type: ignore
+
+        await group.before_request(
+            URL("https://example.com/v1/ticker"), SecretHeaders(), None
+        )
+
+        redis_client.mget.assert_called_once_with(  # type: ignore
+            [general.key(), ticker.key()]
+        )
+        redis_client.get.assert_not_called()  # type: ignore
+        assert general.remaining == 97
+        assert ticker.remaining == 98
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_before_request_skips_unmatched_limiters(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Only limiters matching the request path are read"""
+        general, ticker = await create_limiters(redis_client)
+        group = RedisSharedUrlPatternRateLimiterGroup([general, ticker])
+        redis_client.mget = AsyncMock(return_value=[None])  # type: ignore
+
+        await group.before_request(
+            URL("https://example.com/v1/markets"), SecretHeaders(), None
+        )
+
+        redis_client.mget.assert_called_once_with([general.key()])  # type: ignore
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_before_request_raises_for_exceeded_limiter(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """The exceeded limiter raises and records its state"""
+        general, ticker = await create_limiters(redis_client, ticker_max=5)
+        group = RedisSharedUrlPatternRateLimiterGroup([general, ticker])
+        redis_client.mget = AsyncMock(return_value=[b"5", b"5"])  # type: ignore
+
+        with pytest.raises(RateLimitApproachingError) as exc_info:
+            await group.before_request(
+                URL("https://example.com/v1/ticker"), SecretHeaders(), None
+            )
+
+        assert "URL pattern limit exceeded: 5/5" in str(exc_info.value)
+        assert not general.is_limit_exceeded
+        assert ticker.is_limit_exceeded
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_after_request_increments_in_one_pipeline(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """All matching counters are incremented in a single pipeline"""
+        general, ticker = await create_limiters(redis_client)
+        group = RedisSharedUrlPatternRateLimiterGroup([general, ticker])
+
+        pipeline_mock = MagicMock()
+        pipeline_mock.execute = AsyncMock(return_value=[1, True, 1, True])
+        redis_client.pipeline = MagicMock(return_value=pipeline_mock)  # type: ignore
+
+        await group.after_request(make_response_data("/v1/ticker"))
+
+        redis_client.pipeline.assert_called_once()  # type: ignore
+        assert pipeline_mock.incr.call_count == 2
+        assert pipeline_mock.expire.call_count == 2
+        pipeline_mock.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_requires_limiters(self) -> None:
+        """An empty group is rejected"""
+        with pytest.raises(ValueError, match="must not be empty"):
+            RedisSharedUrlPatternRateLimiterGroup([])
+
+    @pytest.mark.asyncio
+    @pytest.mark.unit
+    async def test_requires_shared_redis_client(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """Limiters using different Redis clients cannot be batched"""
+        general, _ = await create_limiters(redis_client)
+        other_client = AsyncMock()
+        other_client.ping.return_value = True
+        _, ticker = await create_limiters(other_client)
+
+        with pytest.raises(ValueError, match="same Redis client"):
+            RedisSharedUrlPatternRateLimiterGroup([general, ticker])
+
+
+class TestRedisSharedUrlPatternRateLimiterGroupIntegration:
+    """Integration tests for RedisSharedUrlPatternRateLimiterGroup using fakeredis"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_counts_match_individual_limiters(
+        self, redis_client: redis.Redis
+    ) -> None:
+        """The group counts and limits requests like the individual limiters"""
+        general, ticker = await create_limiters(redis_client, ticker_max=3)
+        group = RedisSharedUrlPatternRateLimiterGroup([general, ticker])
+
+        ticker_url = URL("https://example.com/v1/ticker")
+        for _ in range(3):
+            await group.before_request(ticker_url, SecretHeaders(), None)
+            await group.after_request(make_response_data("/v1/ticker"))
+
+        await group.before_request(
+            URL("https://example.com/v1/markets"), SecretHeaders(), None
+        )
+        await group.after_request(make_response_data("/v1/markets"))
+
+        assert await general.get_count_async() == 4
+        assert await ticker.get_count_async() == 3
+
+        with pytest.raises(RateLimitApproachingError):
+            await group.before_request(ticker_url, SecretHeaders(), None)
+        assert ticker.is_limit_exceeded
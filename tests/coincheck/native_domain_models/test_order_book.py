@@ -3,6 +3,7 @@
 from decimal import Decimal
 
 import pytest
+from pydantic import ValidationError
 
 from crypto_api_client.coincheck.native_domain_models.order_book import (
     OrderBook,
@@ -108,6 +109,37 @@ class TestOrderBook:
         assert order_book.asks[0].price == Decimal("15350001")
         assert order_book.asks[0].size == Decimal("0.1")
 
+    def test_parse_array_format_with_decimal_values(self) -> None:
+        """Decimal values from the JSON parser are kept as is"""
+        price = Decimal("15350001")
+        size = Decimal("0.10")
+
+        order_book = OrderBook(
+            asks=[[price, size]],  # type: ignore[list-item]
+            bids=[[15350000, "0.2"]],  # type: ignore[list-item]
+        )
+
+        assert order_book.asks[0].price is price
+        assert order_book.asks[0].size is size
+        assert order_book.bids[0].price == Decimal("15350000")
+        assert order_book.bids[0].size == Decimal("0.2")
+        assert order_book.spread == Decimal("1")
+
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            ["NaN", "0.1"],
+            ["15350001", "Infinity"],
+            [Decimal("-Infinity"), Decimal("0.1")],
+        ],
+    )
+    def test_parse_array_format_rejects_non_finite_values(
+        self, entry: list[str | Decimal]
+    ) -> None:
+        """NaN and Infinity prices or sizes are rejected"""
+        with pytest.raises(ValidationError):
+            OrderBook(asks=[entry], bids=[])  # type: ignore[list-item]
+
     def test_order_book_is_frozen(self) -> None:
         """OrderBook is immutable"""
         order_book = OrderBook(asks=[], bids=[])
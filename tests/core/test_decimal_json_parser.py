@@ -73,3 +73,27 @@ class TestDecimalJsonParser:
         # Verify precision is preserved as Decimal type
         assert isinstance(ticker.best_bid, Decimal)
         assert str(ticker.best_bid) == "123456789.123456789123456789"
+
+    def test_loads_parses_numbers_as_decimal(self) -> None:
+        """Verify loads() returns numbers as Decimal without float rounding."""
+        data = DecimalJsonParser.loads('{"price": 0.1000000000000000055511, "size": 3}')
+
+        assert data["price"] == Decimal("0.1000000000000000055511")
+        assert data["size"] == Decimal("3")
+        assert isinstance(data["size"], Decimal)
+
+    def test_loads_error(self) -> None:
+        """Verify exception is raised for invalid JSON."""
+        with pytest.raises(ValueError):
+            DecimalJsonParser.loads("invalid json")
+
+    def test_validate_parsed_object(self) -> None:
+        """Verify validate() converts an object parsed by loads()."""
+        ticker_json = self.factory.create_ticker_data()
+        data = DecimalJsonParser.loads(json.dumps(ticker_json))
+        data["product_code"] = "ETH_JPY"
+
+        ticker = DecimalJsonParser.validate(data, Ticker)
+
+        assert str(ticker.product_code) == "ETH_JPY"
+        assert isinstance(ticker.best_bid, Decimal)